@@ -0,0 +1,58 @@
+"""
+Time of the operations removing edges from high-degree nodes
+(remove_nodes of the hub, decouple_edges of the multiple edges).
+
+Usage:
+    python benchmarks/adjacency_benchmark.py [number_of_edges ...]
+"""
+
+import sys
+import time
+
+from diblob import DigraphManager
+
+SIZES = (10_000, 20_000, 40_000)
+
+
+def star_digraph(number_of_edges: int):
+    """
+    Hub connected with number_of_edges / 2 leaves in both directions.
+    """
+    leaves = [str(idx) for idx in range(number_of_edges // 2)]
+    digraph_dict = {"hub": leaves} | {leaf: ["hub"] for leaf in leaves}
+    return DigraphManager({"B0": digraph_dict})
+
+
+def multiple_edges_digraph(number_of_edges: int):
+    """
+    Two nodes connected with number_of_edges multiple edges.
+    """
+    return DigraphManager({"B0": {"A": ["B"] * number_of_edges, "B": []}})
+
+
+def measure(func):
+    """
+    Returns execution time of func.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'edges':>8} {'remove hub [s]':>15} {'decouple [s]':>13}")
+
+    for size in sizes:
+        digraph_manager = star_digraph(size)
+        remove_time = measure(
+            lambda: digraph_manager.remove_nodes(digraph_manager["hub"])
+        )
+
+        digraph_manager = multiple_edges_digraph(size)
+        decouple_time = measure(digraph_manager.decouple_edges)
+
+        print(f"{size:>8} {remove_time:>15.3f} {decouple_time:>13.3f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,64 @@
+"""
+Time and memory (predecessor matrix) of the full shortest paths matrix
+(GenerateDijkstraMatrix) for random sparse digraphs.
+
+Usage:
+    python benchmarks/apsp_benchmark.py [number_of_nodes ...]
+"""
+
+import random
+import sys
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import GenerateDijkstraMatrix
+
+SIZES = (500, 1_000, 2_000)
+AVERAGE_DEGREE = 4
+
+
+def random_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Creates random digraph with AVERAGE_DEGREE * number_of_nodes edges.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(
+        *{
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range(AVERAGE_DEGREE * number_of_nodes)
+        }
+    )
+    return digraph_manager
+
+
+def main(sizes):
+    print(f"{'nodes':>8} {'unit [s]':>10} {'weighted [s]':>13} {'matrix [MB]':>12}")
+
+    for size in sizes:
+        digraph_manager = random_digraph(size)
+        rng = random.Random(size)
+        cost_function = {
+            edge_id: rng.randint(1, 10) for edge_id in digraph_manager.edges
+        }
+
+        start = time.perf_counter()
+        dijkstra_matrix = GenerateDijkstraMatrix.run(digraph_manager).run()
+        unit_time = time.perf_counter() - start
+        matrix_size = sum(sys.getsizeof(row) for row in dijkstra_matrix.predecessors)
+
+        start = time.perf_counter()
+        GenerateDijkstraMatrix.run(digraph_manager, cost_function).run()
+        weighted_time = time.perf_counter() - start
+
+        print(
+            f"{size:>8} {unit_time:>10.2f} {weighted_time:>13.2f}"
+            f" {matrix_size / 2**20:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
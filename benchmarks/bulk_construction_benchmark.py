@@ -0,0 +1,71 @@
+"""
+Compares construction of the digraph with number_of_edges random edges:
+dict representation (DigraphManager.__init__), add_nodes + connect_nodes
+and bulk constructor DigraphManager.from_edges.
+
+Usage:
+    python benchmarks/bulk_construction_benchmark.py [number_of_edges ...]
+"""
+
+import random
+import sys
+import time
+
+from diblob import DigraphManager
+
+SIZES = (100_000, 1_000_000)
+AVERAGE_DEGREE = 4
+
+
+def random_edges(number_of_edges: int, seed: int = 0):
+    """
+    Random edges (multiple edges allowed) over number_of_edges / AVERAGE_DEGREE nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_edges // AVERAGE_DEGREE)]
+    return node_ids, [
+        (rng.choice(node_ids), rng.choice(node_ids)) for _ in range(number_of_edges)
+    ]
+
+
+def from_dict(node_ids, edge_ids):
+    adjacency = {node_id: [] for node_id in node_ids}
+    for tail, head in edge_ids:
+        adjacency[tail].append(head)
+    return DigraphManager({"B0": adjacency})
+
+
+def from_connect_nodes(node_ids, edge_ids):
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(*edge_ids)
+    return digraph_manager
+
+
+def from_edges(node_ids, edge_ids):
+    return DigraphManager.from_edges(edge_ids, node_ids)
+
+
+def main(sizes):
+    print(
+        f"{'edges':>10} {'dict [s]':>9} {'connect_nodes [s]':>18}"
+        f" {'from_edges [s]':>15}"
+    )
+
+    for size in sizes:
+        node_ids, edge_ids = random_edges(size)
+        times = []
+
+        for constructor in (from_dict, from_connect_nodes, from_edges):
+            start = time.perf_counter()
+            digraph_manager = constructor(node_ids, edge_ids)
+            times.append(time.perf_counter() - start)
+
+            assert len(digraph_manager.nodes) == len(node_ids)
+            del digraph_manager
+
+        print(f"{size:>10} {times[0]:>9.2f} {times[1]:>18.2f} {times[2]:>15.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,84 @@
+"""
+Compares algorithms working on DigraphManager with their CompactDigraph
+(CSR snapshot) counterparts on the random digraph with 200k edges.
+
+Usage:
+    python benchmarks/compact_digraph_benchmark.py
+"""
+
+import random
+import sys
+import threading
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import (
+    CompactHopcroftKarp,
+    CompactShortestPathBetween2Nodes,
+    CompactTarjanSCC,
+    HopcroftKarp,
+    ShortestPathBetween2Nodes,
+    TarjanSCC,
+)
+
+NUMBER_OF_NODES = 20_000
+NUMBER_OF_EDGES = 200_000
+
+
+def random_digraph(number_of_nodes: int, number_of_edges: int, seed: int = 0):
+    """
+    Creates random digraph (multiple edges allowed).
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(
+        *(
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range(number_of_edges)
+        )
+    )
+    return digraph_manager
+
+
+def measure(label: str, func):
+    """
+    Prints execution time of func.
+    """
+    start = time.perf_counter()
+    func()
+    print(f"{label:<45} {time.perf_counter() - start:>8.3f} s")
+
+
+def main():
+    digraph_manager = random_digraph(NUMBER_OF_NODES, NUMBER_OF_EDGES)
+    start, target = "0", str(NUMBER_OF_NODES - 1)
+
+    measure("freeze", digraph_manager.freeze)
+    compact_digraph = digraph_manager.freeze()
+
+    measure("TarjanSCC", TarjanSCC(digraph_manager).run)
+    measure("CompactTarjanSCC", CompactTarjanSCC(compact_digraph).run)
+
+    measure(
+        "ShortestPathBetween2Nodes",
+        lambda: ShortestPathBetween2Nodes.run(digraph_manager, start, target),
+    )
+    measure(
+        "CompactShortestPathBetween2Nodes",
+        lambda: CompactShortestPathBetween2Nodes.run(compact_digraph, start, target),
+    )
+
+    measure("HopcroftKarp", lambda: HopcroftKarp.run(digraph_manager))
+    measure("CompactHopcroftKarp", lambda: CompactHopcroftKarp.run(compact_digraph))
+
+
+if __name__ == "__main__":
+    # recursive algorithms need deep stack for this size of digraph
+    sys.setrecursionlimit(10 * NUMBER_OF_NODES)
+    threading.stack_size(512 * 1024 * 1024)
+    thread = threading.Thread(target=main)
+    thread.start()
+    thread.join()
@@ -0,0 +1,103 @@
+"""
+Compares CPT tour extraction (Hierholzer's algorithm) with the previous
+approach (scan of all nodes for every step of the tour) on random
+strongly connected digraphs.
+
+Usage:
+    python benchmarks/cpt_tour_benchmark.py
+"""
+
+import random
+import time
+
+from testing_criterions.CPT import CPTDigraphManager
+
+SIZES = (500, 1_000, 2_000)
+
+
+def random_strongly_connected_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Random cycle with chords.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+    rng.shuffle(node_ids)
+
+    digraph_dict = {node_id: [] for node_id in node_ids}
+    for tail_id, head_id in zip(node_ids, node_ids[1:] + node_ids[:1]):
+        digraph_dict[tail_id].append(head_id)
+    for _ in range(number_of_nodes):
+        tail_id, head_id = rng.sample(node_ids, 2)
+        if head_id not in digraph_dict[tail_id]:
+            digraph_dict[tail_id].append(head_id)
+
+    return {"B0": digraph_dict}
+
+
+def scan_based_tour(cpt_digraph_manager, start_node):
+    """
+    Previous tour extraction - O(V * tour_length).
+    """
+    nodes = cpt_digraph_manager.nodes
+    edges = cpt_digraph_manager.edges
+    spanning_tree = cpt_digraph_manager.spanning_tree
+    feasible = dict(cpt_digraph_manager.feasible)
+    edges_will_not_be_processed = set()
+    cpt = []
+    v = start_node
+
+    while True:
+        u = v
+        v = next(
+            (node_id for node_id in nodes if feasible.get((u, node_id), 0) > 0), None
+        )
+
+        if v is not None:
+            feasible[(u, v)] -= 1
+            while u != v:
+                p = spanning_tree[(u, v)]
+                cpt.append((u, p))
+                u = p
+        else:
+            bridge_node = spanning_tree[(u, start_node)]
+            if (u, bridge_node) in edges_will_not_be_processed:
+                break
+
+            v = bridge_node
+            for node_id in nodes:
+                if (
+                    node_id != bridge_node
+                    and (u, node_id) in edges
+                    and (u, node_id) not in edges_will_not_be_processed
+                ):
+                    v = node_id
+                    break
+            edges_will_not_be_processed.add((u, v))
+            cpt.append((u, v))
+
+    return cpt
+
+
+def main():
+    print(f"{'nodes':>8} {'tour':>8} {'scan [s]':>10} {'hierholzer [s]':>15}")
+
+    for size in SIZES:
+        digraph_dict = random_strongly_connected_digraph(size)
+        start_node = next(iter(digraph_dict["B0"]))
+
+        cpt_digraph_manager = CPTDigraphManager(digraph_dict, {})
+        cpt, _ = cpt_digraph_manager.compute_cpt(start_node)
+
+        start = time.perf_counter()
+        scan_based_tour(cpt_digraph_manager, start_node)
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cpt_digraph_manager._get_cpt(start_node)  # pylint: disable=protected-access
+        hierholzer_time = time.perf_counter() - start
+
+        print(f"{size:>8} {len(cpt):>8} {scan_time:>10.3f} {hierholzer_time:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
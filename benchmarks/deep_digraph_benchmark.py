@@ -0,0 +1,62 @@
+"""
+Runs DFS family (explicit stack implementations) on path digraphs much longer
+than the recursion limit.
+
+Usage:
+    python benchmarks/deep_digraph_benchmark.py [number_of_nodes ...]
+"""
+
+import sys
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import DFS, DFS_with_path, JonsonForSimpleSSC, TarjanSCC
+from diblob.factory import add_outgoing
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def path_digraph(number_of_nodes: int):
+    """
+    Path 0 -> 1 -> ... -> number_of_nodes - 1.
+    """
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(*zip(node_ids, node_ids[1:]))
+    return digraph_manager
+
+
+def measure(func):
+    """
+    Returns execution time of func.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print(
+        f"{'nodes':>10} {'DFS [s]':>9} {'DFS_with_path [s]':>18} {'TarjanSCC [s]':>14}"
+        f" {'Jonson [s]':>11} {'add_outgoing [s]':>17}"
+    )
+
+    for size in sizes:
+        digraph_manager = path_digraph(size)
+        dfs_time = measure(lambda: DFS(digraph_manager).run("0"))
+        dfs_with_path_time = measure(
+            lambda: DFS_with_path(digraph_manager).run("0")
+        )
+        tarjan_time = measure(lambda: TarjanSCC(digraph_manager).run())
+        jonson_time = measure(lambda: JonsonForSimpleSSC(digraph_manager).run("0"))
+        add_outgoing_time = measure(lambda: add_outgoing(digraph_manager, "0", []))
+        print(
+            f"{size:>10} {dfs_time:>9.3f} {dfs_with_path_time:>18.3f}"
+            f" {tarjan_time:>14.3f} {jonson_time:>11.3f} {add_outgoing_time:>17.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
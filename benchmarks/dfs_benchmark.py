@@ -0,0 +1,79 @@
+"""
+Compares DFS (set of visited nodes) with the previous visitation tracking
+(membership tests and removals on lists) on random digraphs - the same
+DFS is run by validate_reachability for every criterion.
+
+Usage:
+    python benchmarks/dfs_benchmark.py
+"""
+
+import random
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import DFS
+
+SIZES = (2_000, 10_000, 20_000)
+AVERAGE_DEGREE = 4
+
+
+class ListVisitedDFS(DFS):
+    """
+    DFS with the previous visitation tracking.
+    """
+
+    def __init__(self, digraph_manager):
+        super().__init__(digraph_manager)
+        self.visited = []
+        self.nodes_to_visit = list(digraph_manager.nodes)
+
+    def _mark_visited(self, node_id: str):
+        self.visited_nodes.append(node_id)
+        self.visited.append(node_id)
+        self.nodes_to_visit.remove(node_id)
+
+
+def random_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Random digraph where every node is reachable from "S".
+    """
+    rng = random.Random(seed)
+    node_ids = ["S"] + [str(idx) for idx in range(number_of_nodes - 1)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(*zip(node_ids, node_ids[1:]))
+    digraph_manager.connect_nodes(
+        *(
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range((AVERAGE_DEGREE - 1) * number_of_nodes)
+        )
+    )
+    return digraph_manager
+
+
+def measure(dfs_class, digraph_manager):
+    """
+    Returns visited nodes and execution time of the DFS from "S".
+    """
+    start = time.perf_counter()
+    dfs = dfs_class(digraph_manager)
+    dfs.run("S")
+    return dfs.visited_nodes, time.perf_counter() - start
+
+
+def main():
+    print(f"{'nodes':>8} {'lists [s]':>10} {'set [s]':>9}")
+
+    for size in SIZES:
+        digraph_manager = random_digraph(size)
+
+        expected, old_time = measure(ListVisitedDFS, digraph_manager)
+        visited_nodes, new_time = measure(DFS, digraph_manager)
+        assert visited_nodes == expected
+
+        print(f"{size:>8} {old_time:>10.3f} {new_time:>9.4f}")
+
+
+if __name__ == "__main__":
+    main()
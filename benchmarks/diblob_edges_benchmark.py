@@ -0,0 +1,83 @@
+"""
+Compares get_diblob_edges (adjacency of the diblob nodes) with the previous
+approach (classification of all edges of the digraph) for the diblob with
+100 nodes placed in the random digraphs of the growing size.
+
+Usage:
+    python benchmarks/diblob_edges_benchmark.py
+"""
+
+import random
+import time
+
+from diblob import DigraphManager
+
+SIZES = (10_000, 100_000, 400_000)
+DIBLOB_SIZE = 100
+AVERAGE_DEGREE = 4
+
+
+def random_digraph_with_diblob(number_of_nodes: int, seed: int = 0):
+    """
+    Random digraph with diblob "D" gathering DIBLOB_SIZE nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(
+        *(
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range(AVERAGE_DEGREE * number_of_nodes)
+        )
+    )
+    digraph_manager.gather("D", set(rng.sample(node_ids, DIBLOB_SIZE)))
+    return digraph_manager
+
+
+def all_edges_classification(digraph_manager, diblob_id):
+    """
+    Previous approach - every edge of the digraph is classified.
+    """
+    descendants = digraph_manager.get_diblob_descendants(diblob_id) | {diblob_id}
+    inside_edges, incoming_edges, outgoing_edges = set(), set(), set()
+
+    for edge_id in digraph_manager.edges:
+        tail_inside = digraph_manager[edge_id[0]].diblob_id in descendants
+        head_inside = digraph_manager[edge_id[1]].diblob_id in descendants
+
+        if tail_inside and head_inside:
+            inside_edges.add(edge_id)
+        elif tail_inside:
+            outgoing_edges.add(edge_id)
+        elif head_inside:
+            incoming_edges.add(edge_id)
+
+    return inside_edges, incoming_edges, outgoing_edges, descendants
+
+
+def measure(func, *args):
+    """
+    Returns result and execution time of func.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'nodes':>8} {'all edges [s]':>14} {'adjacency [s]':>14}")
+
+    for size in SIZES:
+        digraph_manager = random_digraph_with_diblob(size)
+
+        expected, old_time = measure(all_edges_classification, digraph_manager, "D")
+        result, new_time = measure(digraph_manager.get_diblob_edges, "D")
+        assert result == expected
+
+        print(f"{size:>8} {old_time:>14.4f} {new_time:>14.5f}")
+
+
+if __name__ == "__main__":
+    main()
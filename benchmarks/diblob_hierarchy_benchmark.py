@@ -0,0 +1,93 @@
+"""
+Compares decouple_edges on the deeply nested diblobs with the common ancestor
+found by the hierarchy index (binary lifting) and by the previous approach
+(walk over parent pointers from both diblobs to the root).
+
+Usage:
+    python benchmarks/diblob_hierarchy_benchmark.py
+"""
+
+import random
+import time
+
+from diblob import DigraphManager
+
+DEPTHS = (250, 1_000, 4_000)
+NUMBER_OF_MULTIPLE_EDGES = 2_000
+
+
+class ParentPointersDigraphManager(DigraphManager):
+    """
+    DigraphManager with the previous common ancestor implementation.
+    """
+
+    def get_diblobs_common_ancestor(self, diblob_id1: str, diblob_id2: str):
+        ancestors_of_diblob_id1 = []
+        ancestors_of_diblob_id2 = []
+
+        while diblob_id1:
+            ancestors_of_diblob_id1.append(diblob_id1)
+            diblob_id1 = self[diblob_id1].parent_id
+
+        while diblob_id2:
+            ancestors_of_diblob_id2.append(diblob_id2)
+            diblob_id2 = self[diblob_id2].parent_id
+
+        common_ancestor = None
+
+        for b1, b2 in zip(ancestors_of_diblob_id1[::-1], ancestors_of_diblob_id2[::-1]):
+            if b1 == b2:
+                common_ancestor = b1
+            else:
+                break
+
+        return common_ancestor
+
+
+def nested_digraph(digraph_manager_class, depth: int, seed: int = 0):
+    """
+    Chain of depth nested diblobs (every diblob contains one node and
+    the next diblob) with random double edges between the nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(depth)]
+
+    digraph_manager = digraph_manager_class({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+
+    parent_id = "B0"
+    for idx in range(1, depth):
+        node_ids_to_gather = digraph_manager[parent_id].nodes - {str(idx - 1)}
+        digraph_manager.gather(f"D{idx}", node_ids_to_gather)
+        parent_id = f"D{idx}"
+
+    edge_ids = [
+        tuple(rng.sample(node_ids, 2)) for _ in range(NUMBER_OF_MULTIPLE_EDGES)
+    ]
+    digraph_manager.connect_nodes(*edge_ids, *edge_ids)
+    return digraph_manager
+
+
+def main():
+    print(f"{'depth':>8} {'parent pointers [s]':>20} {'index [s]':>10}")
+
+    for depth in DEPTHS:
+        times, managers = [], []
+
+        for digraph_manager_class in (ParentPointersDigraphManager, DigraphManager):
+            digraph_manager = nested_digraph(digraph_manager_class, depth)
+
+            start = time.perf_counter()
+            digraph_manager.decouple_edges()
+            times.append(time.perf_counter() - start)
+            managers.append(digraph_manager)
+
+        assert all(
+            managers[0][node_id].diblob_id == node.diblob_id
+            for node_id, node in managers[1].nodes.items()
+        )
+        print(f"{depth:>8} {times[0]:>20.3f} {times[1]:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Export of the digraph to the dict / JSON representation - recursive __call__
+(regrouping outgoing nodes by list_groupby) followed by json.dumps vs
+single-pass cached export and streaming write_json.
+
+Usage:
+    python benchmarks/export_benchmark.py [number_of_nodes ...]
+"""
+
+import io
+import json
+import random
+import sys
+import time
+
+from diblob import DigraphManager
+from diblob.tools import list_groupby
+
+SIZES = (10_000, 100_000, 500_000)
+AVERAGE_DEGREE = 4
+DIBLOB_SIZE = 1000
+
+
+class RecursiveExportDigraphManager(DigraphManager):
+    """
+    Reference export (recursive, node ids looked up by __getitem__).
+    """
+
+    def __call__(self, diblob_id: str):
+        repr_dict = {diblob_id: {}}
+
+        for node_id in self[diblob_id].nodes:
+            node = self[node_id]
+
+            if node_id not in self.nodes:
+                repr_dict[diblob_id][node_id] = self(node_id)[node_id]
+            else:
+                grouped = list_groupby(
+                    node.outgoing_nodes,
+                    map_dict={
+                        node_id: self[node_id].diblob_id
+                        for node_id in node.outgoing_nodes
+                    },
+                )
+                repr_dict[diblob_id][node_id] = grouped.get(diblob_id, []) + [
+                    {key: value}
+                    for key, value in grouped.items()
+                    if key != diblob_id
+                ]
+        return repr_dict
+
+
+def random_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Random digraph with AVERAGE_DEGREE * number_of_nodes edges, nodes gathered
+    in diblobs of DIBLOB_SIZE nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = RecursiveExportDigraphManager.from_edges(
+        (
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range(AVERAGE_DEGREE * number_of_nodes)
+        ),
+        node_ids=node_ids,
+    )
+    for idx in range(0, number_of_nodes, DIBLOB_SIZE):
+        digraph_manager.gather(f"D{idx}", set(node_ids[idx : idx + DIBLOB_SIZE]))
+
+    return digraph_manager
+
+
+def measure(function):
+    """
+    Returns result and execution time of the function.
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(sizes):
+    print(
+        f"{'nodes':>8} {'recursive [s]':>14} {'export [s]':>11}"
+        f" {'cached [s]':>11} {'dumps [s]':>10} {'write_json [s]':>15}"
+    )
+
+    for size in sizes:
+        digraph_manager = random_digraph(size)
+        root_diblob_id = digraph_manager.root_diblob_id
+
+        expected, recursive_time = measure(
+            lambda: RecursiveExportDigraphManager.__call__(
+                digraph_manager, root_diblob_id
+            )
+        )
+        result, export_time = measure(
+            lambda: DigraphManager.__call__(digraph_manager, root_diblob_id)
+        )
+        _, cached_time = measure(
+            lambda: DigraphManager.__call__(digraph_manager, root_diblob_id)
+        )
+        assert result == expected
+
+        expected_json, dumps_time = measure(lambda: json.dumps(expected))
+        file = io.StringIO()
+        _, write_time = measure(lambda: digraph_manager.write_json(file))
+        assert file.getvalue() == expected_json
+
+        print(
+            f"{size:>8} {recursive_time:>14.2f} {export_time:>11.2f}"
+            f" {cached_time:>11.2f} {dumps_time:>10.2f} {write_time:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,100 @@
+"""
+Time and memory of the copy of the digraph followed by a small modification
+(2 nodes and 10 edges added) or by a read-only traversal of the entire digraph
+(DFS, as in NodeCoverage) - deepcopy vs copy-on-write fork.
+
+Usage:
+    python benchmarks/fork_benchmark.py
+"""
+
+import random
+import time
+import tracemalloc
+from copy import deepcopy
+
+from diblob import DigraphManager
+from diblob.algorithms import DFS
+
+SIZES = (10_000, 50_000, 100_000)
+AVERAGE_DEGREE = 4
+
+
+def random_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Creates random digraph with AVERAGE_DEGREE * number_of_nodes edges.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(
+        *(
+            (rng.choice(node_ids), rng.choice(node_ids))
+            for _ in range(AVERAGE_DEGREE * number_of_nodes)
+        )
+    )
+    return digraph_manager
+
+
+def copy_and_modify(digraph_manager, copy_function):
+    """
+    Copies digraph_manager and connects new source and sink with some nodes.
+    """
+    digraph_copy = copy_function(digraph_manager)
+    digraph_copy.add_nodes("Source", "Sink")
+    digraph_copy.connect_nodes(*(("Source", str(idx)) for idx in range(5)))
+    digraph_copy.connect_nodes(*((str(idx), "Sink") for idx in range(5, 10)))
+    return digraph_copy
+
+
+def copy_and_traverse(digraph_manager, copy_function):
+    """
+    Copies digraph_manager and visits all the nodes of the copy (DFS).
+    """
+    digraph_copy = copy_function(digraph_manager)
+    DFS(digraph_copy).exec("0", rng=0)
+    return digraph_copy
+
+
+def measure(digraph_manager, copy_function, workload):
+    """
+    Returns execution time and allocated memory (MB) of the workload.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    digraph_copy = workload(digraph_manager, copy_function)
+    execution_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del digraph_copy
+    return execution_time, memory / 2**20
+
+
+def main():
+    digraph_managers = {size: random_digraph(size) for size in SIZES}
+
+    for workload in (copy_and_modify, copy_and_traverse):
+        print(workload.__name__)
+        print(
+            f"{'nodes':>8} {'deepcopy [s]':>13} {'deepcopy [MB]':>14}"
+            f" {'fork [s]':>9} {'fork [MB]':>10}"
+        )
+
+        for size, digraph_manager in digraph_managers.items():
+            deepcopy_time, deepcopy_memory = measure(
+                digraph_manager, deepcopy, workload
+            )
+            fork_time, fork_memory = measure(
+                digraph_manager, DigraphManager.fork, workload
+            )
+
+            print(
+                f"{size:>8} {deepcopy_time:>13.3f} {deepcopy_memory:>14.1f}"
+                f" {fork_time:>9.5f} {fork_memory:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
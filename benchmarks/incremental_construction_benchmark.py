@@ -0,0 +1,76 @@
+"""
+Compares building CPTDigraphManager edge by edge with the incremental updates,
+with the batch construction and with the previous behaviour (all cost related
+structures recomputed after every connect_nodes call).
+
+Usage:
+    python benchmarks/incremental_construction_benchmark.py
+"""
+
+import random
+import time
+
+from testing_criterions.CPT import CPTDigraphManager
+
+SIZES = (1_000, 2_000, 4_000)
+
+
+def random_edges(number_of_edges: int, seed: int = 0):
+    """
+    Random edges over number_of_edges // 4 nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_edges // 4)]
+    return node_ids, [
+        (rng.choice(node_ids), rng.choice(node_ids)) for _ in range(number_of_edges)
+    ]
+
+
+def build(node_ids, edge_ids, mode):
+    """
+    Builds CPTDigraphManager edge by edge.
+    """
+    cpt_digraph_manager = CPTDigraphManager({"B0": {}}, {})
+
+    if mode == "batch":
+        with cpt_digraph_manager.batch():
+            cpt_digraph_manager.add_nodes(*node_ids)
+            for edge_id in edge_ids:
+                cpt_digraph_manager.connect_nodes(edge_id)
+        return cpt_digraph_manager
+
+    cpt_digraph_manager.add_nodes(*node_ids)
+    for edge_id in edge_ids:
+        cpt_digraph_manager.connect_nodes(edge_id)
+        if mode == "recompute":
+            cpt_digraph_manager._refresh()  # pylint: disable=protected-access
+
+    return cpt_digraph_manager
+
+
+def main():
+    print(
+        f"{'edges':>8} {'recompute [s]':>14} {'incremental [s]':>16}"
+        f" {'batch [s]':>10}"
+    )
+
+    for size in SIZES:
+        node_ids, edge_ids = random_edges(size)
+        times, managers = [], []
+
+        for mode in ("recompute", "incremental", "batch"):
+            start = time.perf_counter()
+            managers.append(build(node_ids, edge_ids, mode))
+            times.append(time.perf_counter() - start)
+
+        assert all(
+            manager.cost == managers[0].cost
+            and manager.delta == managers[0].delta
+            and manager.basic_cost == managers[0].basic_cost
+            for manager in managers
+        )
+        print(f"{size:>8} {times[0]:>14.3f} {times[1]:>16.4f} {times[2]:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Johnson's algorithm of PrimePathCore (simple cycles of SimpleCycleGenerator,
+maximal simple paths of MaxSimplePathGenerator) - recursive generators
+(every cycle re-yielded through each level of the recursion) vs explicit stack.
+
+Usage:
+    python benchmarks/johnson_benchmark.py
+"""
+
+import time
+
+from diblob.algorithms import MaxSimplePathGenerator, SimpleCycleGenerator
+from diblob.generators import CycleBasedDigraph, RandomSCC
+
+SEED = 0
+
+
+class RecursiveJohnsonMixin:
+    """
+    Reference implementation - recursive dfs_jonson and unblock.
+    """
+
+    def dfs_jonson(
+        self,
+        node_id: str,
+        induced_graph: dict,
+        stack: list,
+        blocked_set: set,
+        blocked_dict: dict,
+    ):
+        found_cycle = False
+        stack.append(node_id)
+        blocked_set.add(node_id)
+
+        for outgoing_node_id in induced_graph[node_id]:
+            if stack[0] == outgoing_node_id:
+                yield (*stack, outgoing_node_id)
+                found_cycle = True
+
+            elif outgoing_node_id not in blocked_set:
+                for result in self.dfs_jonson(
+                    outgoing_node_id, induced_graph, stack, blocked_set, blocked_dict
+                ):
+                    yield result
+                    found_cycle = True
+
+        if found_cycle:
+            self.unblock(blocked_set, blocked_dict, node_id)
+        else:
+            for outgoing_node_id in induced_graph[node_id]:
+                blocked_dict[outgoing_node_id].add(node_id)
+
+        stack.pop()
+
+    def unblock(self, blocked_set: set, blocked_dict: dict, node_id: str):
+        blocked_set.remove(node_id)
+
+        while blocked_dict[node_id]:
+            blocked_outgoing_id = blocked_dict[node_id].pop()
+            if blocked_outgoing_id in blocked_set:
+                self.unblock(blocked_set, blocked_dict, blocked_outgoing_id)
+
+
+class RecursiveSimpleCycleGenerator(RecursiveJohnsonMixin, SimpleCycleGenerator):
+    """
+    SimpleCycleGenerator with recursive Johnson's algorithm.
+    """
+
+
+class RecursiveMaxSimplePathGenerator(RecursiveJohnsonMixin, MaxSimplePathGenerator):
+    """
+    MaxSimplePathGenerator with recursive Johnson's algorithm.
+    """
+
+
+def simple_cycles(generator_class, digraph_manager):
+    """
+    Returns simple cycles of the digraph.
+    """
+    return list(generator_class(digraph_manager).get_simple_cycles())
+
+
+def maximal_simple_paths(generator_class, digraph_manager):
+    """
+    Returns maximal simple paths of the digraph.
+    """
+    generator = generator_class(digraph_manager)
+    return [
+        path
+        for node_id in digraph_manager.nodes
+        for path in generator.get_maximal_simple_path_for_node_id(node_id)
+    ]
+
+
+def measure(function, *args):
+    """
+    Returns result and execution time of the function (None if recursion
+    limit is exceeded).
+    """
+    start = time.perf_counter()
+    try:
+        result = function(*args)
+    except RecursionError:
+        return None, None
+    return result, time.perf_counter() - start
+
+
+def main():
+    cases = [
+        (
+            f"RandomSCC({size}, {len(cycle_sizes)} cycles)",
+            RandomSCC([str(idx) for idx in range(size)], cycle_sizes, rng=SEED),
+            simple_cycles,
+            (RecursiveSimpleCycleGenerator, SimpleCycleGenerator),
+        )
+        for size, cycle_sizes in ((30, [6] * 8), (40, [4] * 12), (1200, [1200]))
+    ] + [
+        (
+            f"CycleBasedDigraph({nodes}, {edges})",
+            CycleBasedDigraph(nodes, edges, rng=SEED),
+            function,
+            generator_classes,
+        )
+        for nodes, edges in ((20, 60), (30, 64))
+        for function, generator_classes in (
+            (simple_cycles, (RecursiveSimpleCycleGenerator, SimpleCycleGenerator)),
+            (
+                maximal_simple_paths,
+                (RecursiveMaxSimplePathGenerator, MaxSimplePathGenerator),
+            ),
+        )
+    ]
+
+    print(
+        f"{'digraph':>28} {'result':>21} {'count':>8}"
+        f" {'recursive [s]':>14} {'iterative [s]':>14}"
+    )
+
+    for name, digraph, function, (recursive_class, iterative_class) in cases:
+        digraph_manager = digraph.get_digraph_manager()
+
+        expected, recursive_time = measure(function, recursive_class, digraph_manager)
+        result, iterative_time = measure(function, iterative_class, digraph_manager)
+        assert expected is None or result == expected
+
+        recursive = "RecursionError" if expected is None else f"{recursive_time:.2f}"
+        print(
+            f"{name:>28} {function.__name__:>21} {len(result):>8}"
+            f" {recursive:>14} {iterative_time:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Measures DigraphManager.__getitem__ / __contains__ cost for growing digraphs.
+Per-lookup time should stay flat when the number of nodes grows.
+
+Usage:
+    python benchmarks/lookup_benchmark.py
+"""
+
+import random
+import timeit
+
+from diblob import DigraphManager
+
+SIZES = (1_000, 10_000, 100_000)
+LOOKUPS = 100_000
+
+
+def path_digraph(number_of_nodes: int):
+    """
+    Creates path digraph 0 -> 1 -> ... -> number_of_nodes - 1.
+    """
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+    digraph_manager = DigraphManager({"B0": {}})
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(*zip(node_ids[:-1], node_ids[1:]))
+    return digraph_manager
+
+
+def main():
+    rng = random.Random(0)
+
+    print(f"{'nodes':>10} {'getitem [ns]':>14} {'contains [ns]':>14}")
+    for size in SIZES:
+        digraph_manager = path_digraph(size)
+        keys = [str(rng.randrange(size)) for _ in range(LOOKUPS)]
+
+        getitem_time = timeit.timeit(
+            lambda: [digraph_manager[key] for key in keys], number=1
+        )
+        contains_time = timeit.timeit(
+            lambda: [key in digraph_manager for key in keys], number=1
+        )
+
+        print(
+            f"{size:>10} {getitem_time / LOOKUPS * 1e9:>14.1f}"
+            f" {contains_time / LOOKUPS * 1e9:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Memory footprint of the DigraphManager (default edges - lists of Edge objects,
+compact edges - EdgeMultiset) for random digraphs with number_of_edges edges
+and of the adjacency alone (OrderedMultiset vs plain lists of the node ids).
+
+Usage:
+    python benchmarks/memory_benchmark.py [number_of_edges ...]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from diblob import DigraphManager
+from diblob.components import OrderedMultiset
+
+SIZES = (100_000, 1_000_000)
+AVERAGE_DEGREE = 4
+
+
+def random_edges(number_of_edges: int, seed: int = 0):
+    """
+    Random edges (multiple edges allowed) over number_of_edges / AVERAGE_DEGREE nodes.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_edges // AVERAGE_DEGREE)]
+    return node_ids, [
+        (rng.choice(node_ids), rng.choice(node_ids)) for _ in range(number_of_edges)
+    ]
+
+
+def measure(node_ids, edge_ids, compact_edges):
+    """
+    Returns memory (MB) allocated by the digraph manager and construction time.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    digraph_manager = DigraphManager({"B0": {}}, compact_edges=compact_edges)
+    digraph_manager.add_nodes(*node_ids)
+    digraph_manager.connect_nodes(*edge_ids)
+
+    execution_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del digraph_manager
+    return memory / 2**20, execution_time
+
+
+def measure_adjacency(node_ids, edge_ids, container):
+    """
+    Returns memory (MB) allocated by incoming and outgoing node ids of all nodes
+    stored in container (list or OrderedMultiset) and construction time.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    incoming_nodes = {node_id: container() for node_id in node_ids}
+    outgoing_nodes = {node_id: container() for node_id in node_ids}
+    for tail, head in edge_ids:
+        outgoing_nodes[tail].append(head)
+        incoming_nodes[head].append(tail)
+
+    execution_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del incoming_nodes, outgoing_nodes
+    return memory / 2**20, execution_time
+
+
+def main(sizes):
+    print(
+        f"{'edges':>10} {'mode':>8} {'memory [MB]':>12}"
+        f" {'bytes / edge':>13} {'time [s]':>9}"
+    )
+
+    for size in sizes:
+        node_ids, edge_ids = random_edges(size)
+
+        for compact_edges in (False, True):
+            memory, execution_time = measure(node_ids, edge_ids, compact_edges)
+            mode = "compact" if compact_edges else "default"
+
+            print(
+                f"{size:>10} {mode:>8} {memory:>12.1f}"
+                f" {memory * 2**20 / size:>13.0f} {execution_time:>9.2f}"
+            )
+
+    print()
+    print(
+        f"{'edges':>10} {'adjacency':>15} {'memory [MB]':>12}"
+        f" {'bytes / edge':>13} {'time [s]':>9}"
+    )
+
+    for size in sizes:
+        node_ids, edge_ids = random_edges(size)
+
+        for container in (list, OrderedMultiset):
+            memory, execution_time = measure_adjacency(node_ids, edge_ids, container)
+
+            print(
+                f"{size:>10} {container.__name__:>15} {memory:>12.1f}"
+                f" {memory * 2**20 / size:>13.0f} {execution_time:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
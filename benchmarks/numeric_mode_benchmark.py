@@ -0,0 +1,82 @@
+"""
+Compares CPT computation with Decimal costs (previous behaviour) and with
+the default auto numeric mode (int costs) on random integer-weighted
+strongly connected digraphs.
+
+Usage:
+    python benchmarks/numeric_mode_benchmark.py
+"""
+
+import random
+import time
+
+from testing_criterions.CPT import CPTDigraphManager
+
+SIZES = (50, 100, 200)
+CASES = (("johnson", "min_cost_flow"), ("floyd_warshall", "min_cost_flow"))
+
+
+def random_strongly_connected_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Random cycle with chords and random integer costs.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+    rng.shuffle(node_ids)
+
+    digraph_dict = {node_id: [] for node_id in node_ids}
+    for tail_id, head_id in zip(node_ids, node_ids[1:] + node_ids[:1]):
+        digraph_dict[tail_id].append(head_id)
+    for _ in range(2 * number_of_nodes):
+        tail_id, head_id = rng.sample(node_ids, 2)
+        digraph_dict[tail_id].append(head_id)
+
+    cost_function = {
+        (tail_id, head_id): rng.randint(1, 20)
+        for tail_id, head_ids in digraph_dict.items()
+        for head_id in head_ids
+    }
+    return {"B0": digraph_dict}, cost_function
+
+
+def measure(digraph_dict, cost_function, backend, solver, numeric_mode):
+    """
+    Returns CPT cost and execution time of compute_cpt.
+    """
+    cpt_digraph_manager = CPTDigraphManager(
+        digraph_dict,
+        cost_function,
+        shortest_paths_backend=backend,
+        numeric_mode=numeric_mode,
+    )
+    start = time.perf_counter()
+    _, cost = cpt_digraph_manager.compute_cpt(next(iter(digraph_dict["B0"])), solver)
+    return cost, time.perf_counter() - start
+
+
+def main():
+    print(
+        f"{'nodes':>6} {'backend':>15} {'solver':>16}"
+        f" {'decimal [s]':>12} {'auto [s]':>9} {'speedup':>8}"
+    )
+
+    for size in SIZES:
+        digraph_dict, cost_function = random_strongly_connected_digraph(size)
+
+        for backend, solver in CASES:
+            decimal_cost, decimal_time = measure(
+                digraph_dict, cost_function, backend, solver, "decimal"
+            )
+            auto_cost, auto_time = measure(
+                digraph_dict, cost_function, backend, solver, "auto"
+            )
+            assert decimal_cost == auto_cost
+
+            print(
+                f"{size:>6} {backend:>15} {solver:>16} {decimal_time:>12.3f}"
+                f" {auto_time:>9.3f} {decimal_time / auto_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Prime paths (maximal simple paths and simple cycles) of PrimePathGenerator
+generated in the calling process vs sharded between worker processes.
+
+Digraph is a path of NUMBER_OF_NODES nodes with RANDOM_EDGES random edges
+(hundreds of thousands of maximal simple paths).
+
+Usage:
+    python benchmarks/parallel_prime_path_benchmark.py [processes ...]
+"""
+
+import os
+import random
+import sys
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import PrimePathGenerator
+
+NUMBER_OF_NODES = 30
+RANDOM_EDGES = 48
+
+
+def random_digraph(seed: int = 0):
+    """
+    Creates path with RANDOM_EDGES random edges.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(NUMBER_OF_NODES)]
+
+    return DigraphManager.from_edges(
+        [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(RANDOM_EDGES)]
+        + list(zip(node_ids, node_ids[1:]))
+    )
+
+
+def measure(function):
+    """
+    Returns result and execution time of the function.
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main(processes_list):
+    prime_path_generator = PrimePathGenerator(random_digraph())
+
+    print(f"{'processes':>9} {'paths':>8} {'cycles':>7} {'time [s]':>9} {'speedup':>8}")
+
+    serial_time = None
+    expected = None
+
+    for processes in processes_list:
+        result, execution_time = measure(
+            lambda: (
+                list(prime_path_generator.get_prime_paths_without_cycles(processes)),
+                list(prime_path_generator.get_cycles(processes)),
+            )
+        )
+
+        if expected is None:
+            expected, serial_time = result, execution_time
+        assert result == expected
+
+        print(
+            f"{processes:>9} {len(result[0]):>8} {len(result[1]):>7}"
+            f" {execution_time:>9.2f} {serial_time / execution_time:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(
+        [int(arg) for arg in sys.argv[1:]]
+        or sorted({1, 2, 4, os.cpu_count() or 1})
+    )
@@ -0,0 +1,171 @@
+"""
+Maximal simple paths (PrimePathGenerator.get_prime_paths_without_cycles) -
+artificial node added to the digraph, TarjanSCC and induced digraph recomputed
+for every starting node vs read-only MaxSimplePathGenerator (SCCs,
+condensation, adjacency and tails of the artificial node computed once).
+
+Digraph consists of LAYERS layers of the same width, every node is connected
+with the node of the same position and DEGREE - 1 random nodes of the next
+layer (the first layer - starting nodes).
+
+Usage:
+    python benchmarks/prime_path_benchmark.py [width ...]
+"""
+
+import random
+import sys
+import time
+
+from diblob import DigraphManager
+from diblob.algorithms import MaxSimplePathGenerator, PrimePathGenerator, TarjanSCC
+from diblob.factory import DiblobFactory
+
+SIZES = (100, 300, 1000)
+LAYERS = 4
+DEGREE = 2
+
+
+class RecomputingMaxSimplePathGenerator(MaxSimplePathGenerator):
+    """
+    Reference implementation - artificial node added to the digraph manager
+    (all nodes checked for every starting node), SCC of the extended digraph
+    found by TarjanSCC and induced digraph built for every starting node.
+    """
+
+    def get_extended_graph(self, node_id: str, artificial_node: str = "ArtificialNode"):
+        digraph_manager = self.digraph_manager
+        tarjant_dict = self.tarjant_dict
+
+        incoming_nodes = digraph_manager[node_id].incoming_nodes
+        set_in_outgoing, set_in_incoming = set(), set()
+        node_id_ssc = tarjant_dict[node_id]
+
+        for incoming_node_id in incoming_nodes:
+            if tarjant_dict[incoming_node_id] - node_id_ssc:
+                return False
+            set_in_outgoing |= set(digraph_manager[incoming_node_id].outgoing_nodes)
+            set_in_incoming |= set(digraph_manager[incoming_node_id].incoming_nodes)
+
+        if (
+            len(set_in_outgoing) <= len(incoming_nodes)
+            and len(incoming_nodes) > 0
+            or len(node_id_ssc & set_in_outgoing) < len(incoming_nodes)
+            or len(node_id_ssc & set_in_incoming) < len(incoming_nodes)
+        ):
+            return False
+
+        edges_to_add = {(artificial_node, node_id)}
+
+        for tail in digraph_manager.nodes:
+            if tail == node_id or node_id in digraph_manager[tail].outgoing_nodes:
+                continue
+
+            outgoing_nodes = digraph_manager[tail].outgoing_nodes
+            tail_scc = tarjant_dict[tail]
+            set_out_incoming, set_out_outgoing = set(), set()
+
+            if any(tarjant_dict[head] != tail_scc for head in outgoing_nodes):
+                continue
+
+            for head in outgoing_nodes:
+                set_out_incoming |= set(digraph_manager[head].incoming_nodes)
+                set_out_outgoing |= set(digraph_manager[head].outgoing_nodes)
+
+            if (
+                len(set_out_incoming) <= len(outgoing_nodes)
+                and len(outgoing_nodes) > 0
+                or len(set_out_incoming & tail_scc) < len(outgoing_nodes)
+                or len(set_out_outgoing & tail_scc) < len(outgoing_nodes)
+            ):
+                continue
+
+            edges_to_add.add((tail, artificial_node))
+
+        digraph_manager.add_nodes(artificial_node)
+        digraph_manager.connect_nodes(*edges_to_add)
+        return True
+
+    def get_maximal_simple_path_for_node_id(
+        self, node_id: str, artificial_node: str = "ArtificialNode"
+    ):
+        graph_dict = self.graph_dict
+        reversed_graph = self.reversed_graph
+        digraph_manager = self.digraph_manager
+
+        if not self.get_extended_graph(node_id, artificial_node):
+            return
+
+        for scc in TarjanSCC(digraph_manager).run():
+            if node_id not in scc:
+                continue
+
+            induced_graph = DiblobFactory.get_induced_digraph(digraph_manager, scc)
+            induced_graph = dict(induced_graph("Ind")["Ind"])
+            blocked_dict = {n_id: set() for n_id in induced_graph}
+
+            for path in self.dfs_jonson(
+                artificial_node, induced_graph, [], set(), blocked_dict
+            ):
+                path = path[1:-1]
+                tail, head = path[0], path[-1]
+
+                if all(_node in path for _node in reversed_graph[tail]) and all(
+                    _node in path for _node in graph_dict[head]
+                ):
+                    yield path
+
+            digraph_manager.remove_nodes(digraph_manager[artificial_node])
+            return
+
+
+def layered_digraph(width: int, seed: int = 0):
+    """
+    Creates layered DAG with LAYERS * width nodes.
+    """
+    rng = random.Random(seed)
+    layers = [[f"{layer}_{idx}" for idx in range(width)] for layer in range(LAYERS)]
+
+    return DigraphManager.from_edges(
+        (
+            (tail, head)
+            for layer, next_layer in zip(layers, layers[1:])
+            for idx, tail in enumerate(layer)
+            for head in dict.fromkeys(
+                [next_layer[idx], *rng.sample(next_layer, DEGREE - 1)]
+            )
+        ),
+        node_ids=[node_id for layer in layers for node_id in layer],
+    )
+
+
+def measure(digraph_manager, generator_class):
+    """
+    Returns maximal simple paths and execution time.
+    """
+    start = time.perf_counter()
+    prime_path_generator = PrimePathGenerator(digraph_manager)
+    prime_path_generator.max_simple_paths_generator = generator_class(digraph_manager)
+    paths = list(prime_path_generator.get_prime_paths_without_cycles())
+    return paths, time.perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'nodes':>8} {'paths':>8} {'recomputed [s]':>15} {'cached [s]':>11}")
+
+    for size in sizes:
+        digraph_manager = layered_digraph(size)
+
+        expected, recomputed_time = measure(
+            digraph_manager, RecomputingMaxSimplePathGenerator
+        )
+        paths, cached_time = measure(digraph_manager, MaxSimplePathGenerator)
+        assert paths == expected
+
+        print(
+            f"{LAYERS * size:>8} {len(paths):>8}"
+            f" {recomputed_time:>15.2f} {cached_time:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
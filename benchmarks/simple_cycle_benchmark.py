@@ -0,0 +1,94 @@
+"""
+Simple cycles of SimpleCycleGenerator - induced digraph (DigraphManager)
+built from all edges for every starting node vs Johnson's scheme
+(SCC of the remaining nodes split incrementally, trivial SCCs skipped).
+
+Digraphs are RandomSCC of number_of_nodes nodes - the cycle over all nodes
+and SHORT_CYCLES cycles of SHORT_CYCLE_SIZE nodes. Recomputing implementation
+is measured up to RECOMPUTING_LIMIT nodes.
+
+Usage:
+    python benchmarks/simple_cycle_benchmark.py [number_of_nodes ...]
+"""
+
+import sys
+import time
+
+from diblob.algorithms import SimpleCycleGenerator
+from diblob.factory import DiblobFactory
+from diblob.generators import RandomSCC
+
+SIZES = (1000, 2000, 10_000)
+SHORT_CYCLES = 4
+SHORT_CYCLE_SIZE = 3
+RECOMPUTING_LIMIT = 2000
+
+
+class RecomputingSimpleCycleGenerator(SimpleCycleGenerator):
+    """
+    Reference implementation - induced digraph of the nodes of the SCC
+    (of the entire digraph) which are not processed, built for every node.
+    """
+
+    def get_simple_cycles(self):
+        nodes = list(self.digraph_manager.nodes)
+
+        for node_index, node_id in enumerate(nodes):
+            induced_nodes = set(nodes[node_index:]) & self.tarjant_dict[node_id]
+            induced_graph = DiblobFactory.get_induced_digraph(
+                self.digraph_manager, induced_nodes
+            )
+            induced_graph = dict(induced_graph("Ind")["Ind"])
+            blocked_dict = {n_id: set() for n_id in induced_graph}
+
+            yield from self.dfs_jonson(
+                node_id, induced_graph, [], set(), blocked_dict
+            )
+
+
+def random_scc(number_of_nodes: int, seed: int = 0):
+    """
+    Creates strongly connected digraph with number_of_nodes nodes.
+    """
+    return RandomSCC(
+        [str(idx) for idx in range(number_of_nodes)],
+        [number_of_nodes] + [SHORT_CYCLE_SIZE] * SHORT_CYCLES,
+        rng=seed,
+    ).get_digraph_manager()
+
+
+def measure(generator_class, digraph_manager):
+    """
+    Returns simple cycles and execution time.
+    """
+    start = time.perf_counter()
+    cycles = list(generator_class(digraph_manager).get_simple_cycles())
+    return cycles, time.perf_counter() - start
+
+
+def main(sizes):
+    print(
+        f"{'nodes':>8} {'edges':>8} {'cycles':>8}"
+        f" {'recomputing [s]':>16} {'incremental [s]':>16}"
+    )
+
+    for size in sizes:
+        digraph_manager = random_scc(size)
+        cycles, incremental_time = measure(SimpleCycleGenerator, digraph_manager)
+
+        recomputing = "-"
+        if size <= RECOMPUTING_LIMIT:
+            expected, recomputing_time = measure(
+                RecomputingSimpleCycleGenerator, digraph_manager
+            )
+            assert cycles == expected
+            recomputing = f"{recomputing_time:.2f}"
+
+        print(
+            f"{size:>8} {len(digraph_manager.edges):>8} {len(cycles):>8}"
+            f" {recomputing:>16} {incremental_time:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,80 @@
+"""
+Compares strong connectivity validation of WeightedDigraphManager with the
+previous approach (all pairs least cost paths + check of every pair of nodes)
+on digraphs which are not strongly connected.
+
+Usage:
+    python benchmarks/strong_connectivity_benchmark.py
+"""
+
+import random
+import time
+from itertools import product
+
+from testing_criterions.CPT import WeightedDigraphManager
+
+SIZES = (100, 200, 400)
+
+
+def not_strongly_connected_digraph(number_of_nodes: int, seed: int = 0):
+    """
+    Random cycle with chords and one additional sink node.
+    """
+    rng = random.Random(seed)
+    node_ids = [str(idx) for idx in range(number_of_nodes)]
+    rng.shuffle(node_ids)
+
+    digraph_dict = {node_id: [] for node_id in node_ids}
+    for tail_id, head_id in zip(node_ids, node_ids[1:] + node_ids[:1]):
+        digraph_dict[tail_id].append(head_id)
+    for _ in range(number_of_nodes):
+        tail_id, head_id = rng.sample(node_ids, 2)
+        digraph_dict[tail_id].append(head_id)
+
+    digraph_dict[node_ids[0]].append("sink")
+    digraph_dict["sink"] = []
+
+    return WeightedDigraphManager({"B0": digraph_dict}, cost_function={})
+
+
+def all_pairs_check(weighted_digraph_manager):
+    """
+    Previous validation - least cost paths for every pair of nodes.
+    """
+    weighted_digraph_manager.least_cost_paths()
+    cost = weighted_digraph_manager.cost
+    nodes = weighted_digraph_manager.nodes
+    return all(edge_id in cost for edge_id in product(nodes, nodes))
+
+
+def measure(func, weighted_digraph_manager):
+    """
+    Returns result and execution time of func.
+    """
+    start = time.perf_counter()
+    result = func(weighted_digraph_manager)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print(f"{'nodes':>8} {'all pairs [s]':>14} {'tarjan [s]':>11} {'speedup':>9}")
+
+    for size in SIZES:
+        weighted_digraph_manager = not_strongly_connected_digraph(size)
+        weighted_digraph_manager.shortest_paths_backend = "floyd_warshall"
+
+        old_result, old_time = measure(all_pairs_check, weighted_digraph_manager)
+        new_result, new_time = measure(
+            WeightedDigraphManager.check_if_digraph_is_strongly_connected,
+            weighted_digraph_manager,
+        )
+        assert old_result == new_result is False
+
+        print(
+            f"{size:>8} {old_time:>14.3f} {new_time:>11.4f}"
+            f" {old_time / new_time:>8.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 from .algorithms import *
 from .factory import *
 from .digraph_manager import *
+from .compact_digraph import *
+from .copy_on_write import *
+from .diblob_hierarchy import *
 from .tools import *
 from .generators import *
@@ -1,10 +1,19 @@
+import heapq
 import random
-from collections import deque
+from array import array
+from collections import Counter, deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from diblob.digraph_manager import DigraphManager
-from diblob.factory import DiblobFactory
-from diblob.exceptions import CollisionException, InvalidNodeIdException
+from diblob.copy_on_write import get_reader
+from diblob.tools import get_rng
+from diblob.exceptions import (
+    CollisionException,
+    InvalidNodeIdException,
+    NegativeCycleException,
+)
 
 
 def edges_to_path(edges):
@@ -23,27 +32,38 @@ class DFSTemplate(ABC):
 
     def __init__(self, digraph_manager):
         self.visit_time = 0
+        # visited_nodes - order of the visitation, visited - membership tests
         self.visited_nodes = []
+        self.visited = set()
         self.visitation_dict = {}
         self.digraph_manager = digraph_manager
-        self.nodes_to_visit = list(digraph_manager.nodes)
+        # ordered set of not visited nodes
+        self.nodes_to_visit = dict.fromkeys(digraph_manager.nodes)
 
-    def exec(self, node_id: str):
+    def exec(self, node_id: str, rng: random.Random | int | None = None):
         """
         Executes DFS starting with node_id.
         Args:
             - node_id (str): id of the node where computation is started.
+            - rng (random.Random | int): generator (or seed) used to shuffle
+                                         next starting nodes, global random by default.
         """
-        self.nodes_to_visit.remove(node_id)
+        start_node_ids = list(self.nodes_to_visit)
+        start_node_ids.remove(node_id)
 
-        random.shuffle(self.nodes_to_visit)
-        self.nodes_to_visit = [node_id] + self.nodes_to_visit
+        get_rng(rng).shuffle(start_node_ids)
 
-        while self.nodes_to_visit:
-            self.run(node_id)
+        for start_node_id in [node_id] + start_node_ids:
+            if start_node_id in self.nodes_to_visit:
+                self.run(start_node_id)
 
-            if self.nodes_to_visit:
-                node_id = self.nodes_to_visit[0]
+    def _mark_visited(self, node_id: str):
+        """
+        Moves node from nodes_to_visit to visited nodes.
+        """
+        self.visited_nodes.append(node_id)
+        self.visited.add(node_id)
+        del self.nodes_to_visit[node_id]
 
     @abstractmethod
     def run(self, node_id: str):
@@ -59,16 +79,35 @@ class DFS(DFSTemplate):
 
     def run(self, node_id: str):
         """
-        Basic DFS runner.
+        Basic DFS runner (explicit stack).
         """
-        self.visited_nodes.append(node_id)
-        self.nodes_to_visit.remove(node_id)
-        self.visitation_dict[node_id] = {"visitation_time": self.visit_time}
+        outgoing_nodes = self._enter(node_id)
+        call_stack = [(node_id, iter(outgoing_nodes))]
 
-        for outgoing_node_id in self.digraph_manager[node_id].outgoing_nodes:
-            if outgoing_node_id not in self.visited_nodes:
-                self.run(outgoing_node_id)
+        while call_stack:
+            node_id, outgoing_node_ids = call_stack[-1]
 
+            for outgoing_node_id in outgoing_node_ids:
+                if outgoing_node_id not in self.visited:
+                    outgoing_nodes = self._enter(outgoing_node_id)
+                    call_stack.append((outgoing_node_id, iter(outgoing_nodes)))
+                    break
+            else:
+                call_stack.pop()
+                self._leave(node_id)
+
+    def _enter(self, node_id: str):
+        """
+        Marks node as visited, returns its outgoing nodes.
+        """
+        self._mark_visited(node_id)
+        self.visitation_dict[node_id] = {"visitation_time": self.visit_time}
+        return self.digraph_manager[node_id].outgoing_nodes
+
+    def _leave(self, node_id: str):
+        """
+        Called when all outgoing nodes of the node are processed.
+        """
         self.visit_time += 1
         self.visitation_dict[node_id] |= {"return_time": self.visit_time}
 
@@ -82,19 +121,30 @@ class DFS_with_path(DFSTemplate):
         return test_cases
 
     def run_iter(self, node_id: str, current_path, test_cases):
-        self.visited_nodes.append(node_id)
-        self.nodes_to_visit.remove(node_id)
-        current_path.append(node_id)
-
-        flag = True
-        for outgoing_node_id in self.digraph_manager[node_id].outgoing_nodes:
-            if outgoing_node_id not in self.visited_nodes:
-                self.run_iter(outgoing_node_id, current_path, test_cases)
-                flag = False
-
-        if flag:
-            test_cases.append(list(current_path))
-        current_path.pop()
+        digraph_manager = self.digraph_manager
+        # is_leaf[i] - no node was visited from current_path[i]
+        is_leaf = []
+        call_stack = []
+
+        def enter(node_id):
+            self._mark_visited(node_id)
+            current_path.append(node_id)
+            is_leaf.append(True)
+            call_stack.append(iter(digraph_manager[node_id].outgoing_nodes))
+
+        enter(node_id)
+
+        while call_stack:
+            for outgoing_node_id in call_stack[-1]:
+                if outgoing_node_id not in self.visited:
+                    is_leaf[-1] = False
+                    enter(outgoing_node_id)
+                    break
+            else:
+                call_stack.pop()
+                if is_leaf.pop():
+                    test_cases.append(list(current_path))
+                current_path.pop()
 
 
 class DFSA(DFS):
@@ -107,75 +157,126 @@ class DFSA(DFS):
         self.node_idx = len(self.digraph_manager.nodes)
         self.nodes_order_dict = {}
 
-    @staticmethod
-    def ordering_decorator(dfs_proc_func):
+    def _leave(self, node_id: str):
         """
-        Decorator for runner enables visitation time computation.
+        Stores nodes in the reversed order of the return time.
         """
+        super()._leave(node_id)
+        self.node_idx -= 1
+        self.nodes_order_dict[self.node_idx] = node_id
 
-        def wrapper(self, node_id):
-            result = dfs_proc_func(self, node_id)
-            self.node_idx -= 1
-            self.nodes_order_dict[self.node_idx] = node_id
-            return result
 
-        return wrapper
+class ShortestPathsTree(Mapping):
+    """
+    Result of the Dijkstra algorithm. Stores only distances and predecessor
+    pointers, paths are reconstructed on demand.
 
-    @ordering_decorator
-    def run(self, node_id):
-        super().run(node_id)
+    Behaves like dict {node_id: {"distance": ..., "min_path": [edge_ids]}}
+    with node_ids in sorted order.
+
+    Args:
+        distances (dict): node_id -> distance from the starting node.
+        predecessors (dict): node_id -> predecessor on the shortest path.
+    """
+
+    def __init__(self, distances: dict, predecessors: dict):
+        self.distances = distances
+        self.predecessors = predecessors
+        self.node_ids = sorted(distances)
+
+    def __getitem__(self, node_id: str):
+        return {
+            "distance": self.distances[node_id],
+            "min_path": self.min_path(node_id),
+        }
+
+    def __iter__(self):
+        return iter(self.node_ids)
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def distance(self, node_id: str):
+        """
+        Returns distance from the starting node to node_id.
+        """
+        return self.distances[node_id]
+
+    def min_path(self, node_id: str):
+        """
+        Returns edge_ids of the shortest path to node_id
+        ([] for the starting node and unreachable nodes).
+        """
+        if node_id not in self.distances:
+            raise KeyError(node_id)
+
+        predecessors = self.predecessors
+        min_path = []
+
+        while node_id in predecessors:
+            min_path.append((predecessors[node_id], node_id))
+            node_id = predecessors[node_id]
+
+        return min_path[::-1]
+
+    def path(self, node_id: str):
+        """
+        Returns node_ids of the shortest path to node_id.
+        """
+        return edges_to_path(self.min_path(node_id))
 
 
 class DijkstraAlgorithm:
     """
-    Dijkstra Algorithm
+    Dijkstra Algorithm (binary heap based).
     """
 
     def __init__(self, digraph_manager):
         self.digraph_manager = digraph_manager
 
-    def run(self, node_id: str, cost_function=None):
+    def run(self, node_id: str, cost_function=None, target: str = None):
         """
         Dijkstra algorithm runner.
         Args:
             - node_id (str): starting node id.
             - cost_function (dict): enable edge weighting.
+            - target (str): computation stops when target node is reached.
+                            Then only distances of the nodes processed before
+                            target (and target itself) are final.
+        Returns:
+            ShortestPathsTree.
         """
-        if cost_function is None:
-            cost_function = {edge_id: 1 for edge_id in self.digraph_manager.edges}
+        nodes = self.digraph_manager.nodes
 
-        nodes = sorted(list(self.digraph_manager.nodes))
+        distances = dict.fromkeys(nodes, float("inf"))
+        distances[node_id] = 0
+        predecessors = {}
+        processed = set()
+        heap = [(0, node_id)]
 
-        min_distance_dict = {
-            dest_node_id: {
-                "distance": float("inf") if dest_node_id != node_id else 0,
-                "min_path": [],
-            }
-            for dest_node_id in nodes
-        }
+        while heap:
+            min_distance, min_node_id = heapq.heappop(heap)
+            if min_node_id in processed:
+                continue
 
-        while nodes:
-            min_node_id = min(
-                nodes,
-                key=lambda dest_node_id: min_distance_dict[dest_node_id]["distance"],
-            )
+            processed.add(min_node_id)
+            if min_node_id == target:
+                break
 
-            v = min_distance_dict[min_node_id]
-            min_distance = v["distance"]
-            nodes.remove(min_node_id)
+            for neigh_id in nodes[min_node_id].outgoing_nodes:
+                if neigh_id in processed:
+                    continue
 
-            for neigh_id in set(self.digraph_manager[min_node_id].outgoing_nodes) & set(
-                nodes
-            ):
-                u = min_distance_dict[neigh_id]
                 edge_id = (min_node_id, neigh_id)
-                potential_new_min_distance = min_distance + cost_function[edge_id]
+                edge_cost = 1 if cost_function is None else cost_function[edge_id]
+                potential_new_min_distance = min_distance + edge_cost
 
-                if u["distance"] > potential_new_min_distance:
-                    u["distance"] = potential_new_min_distance
-                    u["min_path"] = v["min_path"] + [edge_id]
+                if distances[neigh_id] > potential_new_min_distance:
+                    distances[neigh_id] = potential_new_min_distance
+                    predecessors[neigh_id] = min_node_id
+                    heapq.heappush(heap, (potential_new_min_distance, neigh_id))
 
-        return min_distance_dict
+        return ShortestPathsTree(distances, predecessors)
 
 
 class TarjanSCC:
@@ -187,6 +288,18 @@ class TarjanSCC:
         self.digraph_manager = digraph_manager
 
     def run(self):
+        digraph_manager = self.digraph_manager
+        return self.get_sccs(
+            digraph_manager.nodes,
+            lambda node_id: digraph_manager[node_id].outgoing_nodes,
+        )
+
+    @staticmethod
+    def get_sccs(node_ids, get_outgoing_nodes):
+        """
+        Returns SCCs of the digraph with node_ids, get_outgoing_nodes(node_id)
+        returns outgoing nodes of the node (subset of node_ids).
+        """
         stack = []
         defined = set()
         on_stack = set()
@@ -195,7 +308,9 @@ class TarjanSCC:
         index = 0
         result = []
 
-        def strong_connect(node_id):
+        call_stack = []
+
+        def enter(node_id):
             nonlocal index
 
             indices[node_id] = low_links[node_id] = index
@@ -203,14 +318,9 @@ class TarjanSCC:
             stack.append(node_id)
             on_stack.add(node_id)
             defined.add(node_id)
+            call_stack.append((node_id, iter(get_outgoing_nodes(node_id))))
 
-            for out_node_id in self.digraph_manager[node_id].outgoing_nodes:
-                if out_node_id not in defined:
-                    strong_connect(out_node_id)
-                    low_links[node_id] = min(low_links[node_id], low_links[out_node_id])
-                elif out_node_id in on_stack:
-                    low_links[node_id] = min(low_links[node_id], indices[out_node_id])
-
+        def leave(node_id):
             if low_links[node_id] == indices[node_id]:
                 scc = set()
                 while True:
@@ -221,7 +331,29 @@ class TarjanSCC:
                         break
                 result.append(scc)
 
-        for node_id in self.digraph_manager.nodes:
+            if call_stack:
+                parent_id = call_stack[-1][0]
+                low_links[parent_id] = min(low_links[parent_id], low_links[node_id])
+
+        def strong_connect(node_id):
+            enter(node_id)
+
+            while call_stack:
+                node_id, out_node_ids = call_stack[-1]
+
+                for out_node_id in out_node_ids:
+                    if out_node_id not in defined:
+                        enter(out_node_id)
+                        break
+                    if out_node_id in on_stack:
+                        low_links[node_id] = min(
+                            low_links[node_id], indices[out_node_id]
+                        )
+                else:
+                    call_stack.pop()
+                    leave(node_id)
+
+        for node_id in node_ids:
             if node_id not in defined:
                 strong_connect(node_id)
 
@@ -248,38 +380,73 @@ class JonsonForSimpleSSC:
         stack = []
 
         def circuit(node_id, start):
-            stack.append(node_id)
-            blocked[node_id] = True
-            found_cycle = False
-
-            for outgoing_node_id in self.digraph_manager[node_id].outgoing_nodes:
-                if outgoing_node_id == start:
-                    cycle = normalize_cycle(stack + [start])
-                    cycles.add(tuple(cycle))
-                    found_cycle = True
-                elif not blocked[outgoing_node_id]:
-                    if circuit(outgoing_node_id, start):
-                        found_cycle = True
-
-            if found_cycle:
-                unblock(node_id)
-            else:
-                for outgoing_node_id in self.digraph_manager[node_id].outgoing_nodes:
-                    block_map[outgoing_node_id].add(node_id)
+            """
+            Finds cycles through start (explicit stack). Returns True if
+            any cycle was found from node_id.
+            """
+            # found_cycle[i] - cycle was found from call_stack[i]
+            found_cycle = []
+            call_stack = []
+
+            def enter(node_id):
+                stack.append(node_id)
+                blocked[node_id] = True
+                found_cycle.append(False)
+                call_stack.append(
+                    (node_id, iter(self.digraph_manager[node_id].outgoing_nodes))
+                )
+
+            enter(node_id)
+            result = False
+
+            while call_stack:
+                node_id, outgoing_node_ids = call_stack[-1]
+
+                for outgoing_node_id in outgoing_node_ids:
+                    if outgoing_node_id == start:
+                        cycle = normalize_cycle(stack + [start])
+                        cycles.add(tuple(cycle))
+                        found_cycle[-1] = True
+                    elif not blocked[outgoing_node_id]:
+                        enter(outgoing_node_id)
+                        break
+                else:
+                    call_stack.pop()
+                    result = found_cycle.pop()
+
+                    if result:
+                        unblock(node_id)
+                    else:
+                        for outgoing_node_id in self.digraph_manager[
+                            node_id
+                        ].outgoing_nodes:
+                            block_map[outgoing_node_id].add(node_id)
+
+                    stack.pop()
+                    if result and found_cycle:
+                        found_cycle[-1] = True
 
-            stack.pop()
-            return found_cycle
+            return result
 
         def unblock(node):
             """
-            Unblocks a node and its dependent nodes recursively.
+            Unblocks a node and its dependent nodes (explicit stack).
             :param node: Node to unblock
             """
             blocked[node] = False
-            for dependent in block_map[node]:
-                if blocked[dependent]:
-                    unblock(dependent)
-            block_map[node].clear()
+            call_stack = [(node, iter(block_map[node]))]
+
+            while call_stack:
+                node, dependents = call_stack[-1]
+
+                for dependent in dependents:
+                    if blocked[dependent]:
+                        blocked[dependent] = False
+                        call_stack.append((dependent, iter(block_map[dependent])))
+                        break
+                else:
+                    call_stack.pop()
+                    block_map[node].clear()
 
         processed = set()
 
@@ -389,19 +556,563 @@ class ShortestPathBetween2Nodes:
         return None
 
 
+class AllPairsShortestPaths(Mapping):
+    """
+    All pairs shortest paths. Works on CompactDigraph snapshot of the digraph.
+        - BFS is used when every edge costs 1 (cost_function is None or unit).
+        - Johnson's algorithm is used otherwise (Bellman-Ford potentials are
+          computed only if there are negative costs, then Dijkstra runs from
+          every node on reweighted edges).
+
+    Only predecessor matrix is stored (one array of node indices per source
+    node, computed on the first request). Paths are reconstructed on demand.
+
+    Behaves like dict {(tail_id, head_id): [node_ids of the shortest path]},
+    [] if head_id is not reachable from tail_id or tail_id == head_id.
+
+    Args:
+        digraph_manager (DigraphManager): digraph (snapshot is taken).
+        cost_function (dict): enable edge weighting.
+    """
+
+    def __init__(self, digraph_manager, cost_function=None):
+        self.compact_digraph = digraph_manager.freeze()
+        self.weights = self.compact_digraph.edge_weights(cost_function)
+        self.unit_weights = all(weight == 1 for weight in self.weights)
+        self.predecessors = [None] * len(self.compact_digraph)
+
+        node_ids = self.compact_digraph.node_ids
+        self.order = sorted(range(len(node_ids)), key=node_ids.__getitem__)
+        self.ranks = array("i", [0]) * len(node_ids)
+        for rank, idx in enumerate(self.order):
+            self.ranks[idx] = rank
+
+        self.potentials = None
+        if any(weight < 0 for weight in self.weights):
+            self.potentials = self._bellman_ford_potentials()
+
+    def __getitem__(self, edge_id: tuple[str, str]):
+        return self.path(*edge_id)
+
+    def __iter__(self):
+        node_ids = self.compact_digraph.node_ids
+        sorted_node_ids = [node_ids[idx] for idx in self.order]
+
+        for tail_id in node_ids:
+            for head_id in sorted_node_ids:
+                yield (tail_id, head_id)
+
+    def __len__(self):
+        return len(self.compact_digraph) ** 2
+
+    def _bellman_ford_potentials(self):
+        """
+        Johnson's potentials - distances from artificial node connected
+        with every node by 0-cost edge.
+        """
+        compact_digraph = self.compact_digraph
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        weights = self.weights
+        number_of_nodes = len(compact_digraph)
+        potentials = [0] * number_of_nodes
+
+        for _ in range(number_of_nodes + 1):
+            updated = False
+            for idx in range(number_of_nodes):
+                for pos in range(offsets[idx], offsets[idx + 1]):
+                    if potentials[targets[pos]] > potentials[idx] + weights[pos]:
+                        potentials[targets[pos]] = potentials[idx] + weights[pos]
+                        updated = True
+            if not updated:
+                return potentials
+
+        raise NegativeCycleException("Digraph contains negative cost cycle!")
+
+    def _bfs(self, start: int):
+        """
+        BFS processed level by level in node_id order (the same
+        predecessors as Dijkstra with unit costs).
+        """
+        compact_digraph = self.compact_digraph
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        ranks = self.ranks
+
+        predecessors = array("i", [-1]) * len(compact_digraph)
+        predecessors[start] = start
+        level = [start]
+
+        while level:
+            next_level = []
+            for idx in level:
+                for pos in range(offsets[idx], offsets[idx + 1]):
+                    if predecessors[targets[pos]] == -1:
+                        predecessors[targets[pos]] = idx
+                        next_level.append(targets[pos])
+            next_level.sort(key=ranks.__getitem__)
+            level = next_level
+
+        predecessors[start] = -1
+        return predecessors
+
+    def _dijkstra(self, start: int):
+        """
+        Dijkstra on (re)weighted edges.
+        """
+        compact_digraph = self.compact_digraph
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        weights, potentials, ranks = self.weights, self.potentials, self.ranks
+
+        number_of_nodes = len(compact_digraph)
+        distances = [float("inf")] * number_of_nodes
+        predecessors = array("i", [-1]) * number_of_nodes
+        settled = bytearray(number_of_nodes)
+
+        distances[start] = 0
+        heap = [(0, ranks[start], start)]
+
+        while heap:
+            distance, _, idx = heapq.heappop(heap)
+            if settled[idx]:
+                continue
+            settled[idx] = 1
+
+            for pos in range(offsets[idx], offsets[idx + 1]):
+                neigh_idx = targets[pos]
+                weight = weights[pos]
+                if potentials is not None:
+                    weight += potentials[idx] - potentials[neigh_idx]
+
+                if not settled[neigh_idx] and distances[neigh_idx] > distance + weight:
+                    distances[neigh_idx] = distance + weight
+                    predecessors[neigh_idx] = idx
+                    heapq.heappush(
+                        heap, (distances[neigh_idx], ranks[neigh_idx], neigh_idx)
+                    )
+
+        return predecessors
+
+    def _get_predecessors(self, tail_id: str):
+        """
+        Returns (and caches) predecessors array for the tail_id.
+        """
+        start = self.compact_digraph.index(tail_id)
+
+        if self.predecessors[start] is None:
+            self.predecessors[start] = (
+                self._bfs(start) if self.unit_weights else self._dijkstra(start)
+            )
+        return self.predecessors[start]
+
+    def run(self):
+        """
+        Computes predecessors for every pair of nodes.
+        """
+        for node_id in self.compact_digraph.node_ids:
+            self._get_predecessors(node_id)
+        return self
+
+    def path(self, tail_id: str, head_id: str):
+        """
+        Returns node_ids of the shortest path from tail_id to head_id.
+        """
+        predecessors = self._get_predecessors(tail_id)
+        node_ids = self.compact_digraph.node_ids
+        idx = self.compact_digraph.index(head_id)
+
+        if predecessors[idx] == -1:
+            return []
+
+        path = [node_ids[idx]]
+        while predecessors[idx] != -1:
+            idx = predecessors[idx]
+            path.append(node_ids[idx])
+
+        return path[::-1]
+
+    def distance(self, tail_id: str, head_id: str):
+        """
+        Returns cost of the shortest path from tail_id to head_id.
+        """
+        if tail_id == head_id:
+            return 0
+
+        path = self.path(tail_id, head_id)
+        if not path:
+            return float("inf")
+
+        if self.unit_weights:
+            return len(path) - 1
+
+        compact_digraph = self.compact_digraph
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        distance = 0
+
+        for tail, head in zip(path, path[1:]):
+            tail_idx = compact_digraph.index(tail)
+            head_idx = compact_digraph.index(head)
+            distance += min(
+                self.weights[pos]
+                for pos in range(offsets[tail_idx], offsets[tail_idx + 1])
+                if targets[pos] == head_idx
+            )
+        return distance
+
+
 class GenerateDijkstraMatrix:
     @staticmethod
-    def run(digraph_manager):
-        dijkstra_matrix = {}
-        dijkstra = DijkstraAlgorithm(digraph_manager)
-        for node_id in digraph_manager.nodes:
-            dijkstra_dict = dijkstra.run(node_id)
-            for key in dijkstra_dict:
-                dijkstra_matrix[(node_id, key)] = edges_to_path(
-                    dijkstra_dict[key]["min_path"]
+    def run(digraph_manager, cost_function=None):
+        """
+        Returns AllPairsShortestPaths - lazy {(tail_id, head_id): path} mapping.
+        """
+        return AllPairsShortestPaths(digraph_manager, cost_function)
+
+
+class CompactDFS:
+    """
+    Basic DFS working on CompactDigraph (explicit stack, integer indices).
+    Produces the same visited_nodes / visitation_dict as DFS.run.
+    """
+
+    def __init__(self, compact_digraph):
+        self.compact_digraph = compact_digraph
+        self.visit_time = 0
+        self.visited_nodes = []
+        self.visitation_dict = {}
+        self.visited = bytearray(len(compact_digraph))
+
+    def run(self, node_id: str):
+        """
+        Basic DFS runner.
+        """
+        compact_digraph = self.compact_digraph
+        node_ids = compact_digraph.node_ids
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        visited = self.visited
+
+        def enter(idx):
+            visited[idx] = 1
+            self.visited_nodes.append(node_ids[idx])
+            self.visitation_dict[node_ids[idx]] = {"visitation_time": self.visit_time}
+
+        start = compact_digraph.index(node_id)
+        enter(start)
+        stack = [start]
+        positions = [offsets[start]]
+
+        while stack:
+            idx = stack[-1]
+            pos, end = positions[-1], offsets[idx + 1]
+
+            while pos < end and visited[targets[pos]]:
+                pos += 1
+
+            if pos < end:
+                positions[-1] = pos + 1
+                enter(targets[pos])
+                stack.append(targets[pos])
+                positions.append(offsets[targets[pos]])
+            else:
+                stack.pop()
+                positions.pop()
+                self.visit_time += 1
+                self.visitation_dict[node_ids[idx]] |= {"return_time": self.visit_time}
+
+
+class CompactDijkstraAlgorithm:
+    """
+    Dijkstra Algorithm working on CompactDigraph.
+    """
+
+    def __init__(self, compact_digraph):
+        self.compact_digraph = compact_digraph
+        order = sorted(
+            range(len(compact_digraph)), key=compact_digraph.node_ids.__getitem__
+        )
+        self.ranks = {idx: rank for rank, idx in enumerate(order)}
+
+    def run(self, node_id: str, cost_function=None, target: str = None):
+        """
+        Dijkstra algorithm runner. Output is the same as for DijkstraAlgorithm.run.
+        Args:
+            - node_id (str): starting node id.
+            - cost_function (dict): enable edge weighting.
+            - target (str): computation stops when target node is reached.
+        Returns:
+            ShortestPathsTree.
+        """
+        compact_digraph = self.compact_digraph
+        node_ids = compact_digraph.node_ids
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+        weights = compact_digraph.edge_weights(cost_function)
+        ranks = self.ranks
+
+        number_of_nodes = len(compact_digraph)
+        distances = [float("inf")] * number_of_nodes
+        predecessors = [-1] * number_of_nodes
+        settled = bytearray(number_of_nodes)
+
+        start = compact_digraph.index(node_id)
+        target_idx = compact_digraph.node_index.get(target)
+        distances[start] = 0
+        heap = [(0, ranks[start], start)]
+
+        while heap:
+            distance, _, idx = heapq.heappop(heap)
+            if settled[idx]:
+                continue
+
+            settled[idx] = 1
+            if idx == target_idx:
+                break
+
+            for pos in range(offsets[idx], offsets[idx + 1]):
+                neigh_idx = targets[pos]
+                potential_new_min_distance = distance + weights[pos]
+
+                if (
+                    not settled[neigh_idx]
+                    and distances[neigh_idx] > potential_new_min_distance
+                ):
+                    distances[neigh_idx] = potential_new_min_distance
+                    predecessors[neigh_idx] = idx
+                    heapq.heappush(
+                        heap, (potential_new_min_distance, ranks[neigh_idx], neigh_idx)
+                    )
+
+        return ShortestPathsTree(
+            dict(zip(node_ids, distances)),
+            {
+                node_ids[idx]: node_ids[predecessor]
+                for idx, predecessor in enumerate(predecessors)
+                if predecessor != -1
+            },
+        )
+
+
+class CompactTarjanSCC:
+    """
+    Extracts SSC's from CompactDigraph (explicit stack, integer indices).
+    Returns the same SCCs in the same order as TarjanSCC.
+    """
+
+    def __init__(self, compact_digraph):
+        self.compact_digraph = compact_digraph
+
+    def run(self):
+        compact_digraph = self.compact_digraph
+        node_ids = compact_digraph.node_ids
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+
+        number_of_nodes = len(compact_digraph)
+        indices = [-1] * number_of_nodes
+        low_links = [0] * number_of_nodes
+        on_stack = bytearray(number_of_nodes)
+        stack = []
+        index = 0
+        result = []
+
+        for root in range(number_of_nodes):
+            if indices[root] != -1:
+                continue
+
+            indices[root] = low_links[root] = index
+            index += 1
+            stack.append(root)
+            on_stack[root] = 1
+            call_stack = [root]
+            positions = [offsets[root]]
+
+            while call_stack:
+                idx = call_stack[-1]
+                pos = positions[-1]
+
+                if pos < offsets[idx + 1]:
+                    positions[-1] = pos + 1
+                    out_idx = targets[pos]
+
+                    if indices[out_idx] == -1:
+                        indices[out_idx] = low_links[out_idx] = index
+                        index += 1
+                        stack.append(out_idx)
+                        on_stack[out_idx] = 1
+                        call_stack.append(out_idx)
+                        positions.append(offsets[out_idx])
+                    elif on_stack[out_idx]:
+                        low_links[idx] = min(low_links[idx], indices[out_idx])
+                    continue
+
+                call_stack.pop()
+                positions.pop()
+
+                if low_links[idx] == indices[idx]:
+                    scc = set()
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        scc.add(node_ids[w])
+                        if w == idx:
+                            break
+                    result.append(scc)
+
+                if call_stack:
+                    parent_idx = call_stack[-1]
+                    low_links[parent_idx] = min(low_links[parent_idx], low_links[idx])
+
+        return result
+
+
+class CompactHopcroftKarp:
+    """
+    HopcroftKarp working on CompactDigraph. Digraph is treated as bipartite
+    graph (node -> outgoing node), the same way as in HopcroftKarp.
+    """
+
+    @staticmethod
+    def run(compact_digraph):
+        node_ids = compact_digraph.node_ids
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+
+        number_of_nodes = len(compact_digraph)
+        nil = number_of_nodes
+        inf = float("inf")
+
+        pair_u = [nil] * number_of_nodes
+        pair_v = [nil] * number_of_nodes
+        dist = [inf] * (number_of_nodes + 1)
+        positions = [0] * number_of_nodes
+        matching = 0
+
+        def bfs_part():
+            queue = deque()
+            for idx in range(number_of_nodes):
+                if pair_u[idx] == nil:
+                    dist[idx] = 0
+                    queue.append(idx)
+                else:
+                    dist[idx] = inf
+            dist[nil] = inf
+
+            while queue:
+                idx = queue.popleft()
+                if dist[idx] < dist[nil]:
+                    for pos in range(offsets[idx], offsets[idx + 1]):
+                        pair = pair_v[targets[pos]]
+                        if dist[pair] == inf:
+                            dist[pair] = dist[idx] + 1
+                            queue.append(pair)
+            return dist[nil] != inf
+
+        def dfs_part(root):
+            u_stack = [root]
+            v_stack = []
+            positions[root] = offsets[root]
+
+            while u_stack:
+                idx = u_stack[-1]
+
+                if idx == nil:
+                    u_stack.pop()
+                    while v_stack:
+                        v_idx, u_idx = v_stack.pop(), u_stack.pop()
+                        pair_v[v_idx] = u_idx
+                        pair_u[u_idx] = v_idx
+                    return True
+
+                pos, end = positions[idx], offsets[idx + 1]
+                while pos < end and dist[pair_v[targets[pos]]] != dist[idx] + 1:
+                    pos += 1
+
+                if pos < end:
+                    positions[idx] = pos + 1
+                    pair = pair_v[targets[pos]]
+                    v_stack.append(targets[pos])
+                    u_stack.append(pair)
+                    if pair != nil:
+                        positions[pair] = offsets[pair]
+                else:
+                    dist[idx] = inf
+                    u_stack.pop()
+                    if v_stack:
+                        v_stack.pop()
+            return False
+
+        while bfs_part():
+            for idx in range(number_of_nodes):
+                if pair_u[idx] == nil and dfs_part(idx):
+                    matching += 1
+
+        return (
+            matching,
+            {
+                node_ids[idx]: (
+                    None if pair_u[idx] == nil else node_ids[pair_u[idx]]
+                )
+                for idx in range(number_of_nodes)
+            },
+            {
+                node_ids[v_idx]: (
+                    None if pair_v[v_idx] == nil else node_ids[pair_v[v_idx]]
                 )
+                for v_idx in dict.fromkeys(targets)
+            },
+        )
+
+    @staticmethod
+    def construct_path_cover(compact_digraph):
+        _, pair_u, _ = CompactHopcroftKarp.run(compact_digraph)
+        visited = set()
+        paths = []
+
+        matched = set(pair_u.values())
+        unmatched_starts = [v for v in pair_u if v not in matched]
+
+        for start in unmatched_starts:
+            if start in visited:
+                continue
+
+            path = []
+            current = start
+            while current is not None and current not in visited:
+                path.append(current)
+                visited.add(current)
+                current = pair_u[current]
+
+            paths.append(path)
+
+        return paths
+
+
+class CompactShortestPathBetween2Nodes:
+    @staticmethod
+    def run(compact_digraph, start, target):
+        """
+        BFS on CompactDigraph, returns the same path as ShortestPathBetween2Nodes.run.
+        """
+        node_ids = compact_digraph.node_ids
+        offsets, targets = compact_digraph.offsets, compact_digraph.targets
+
+        start_idx = compact_digraph.index(start)
+        target_idx = compact_digraph.node_index.get(target)
+        predecessors = [-1] * len(compact_digraph)
+        predecessors[start_idx] = start_idx
+        queue = deque([start_idx])
+
+        while queue:
+            idx = queue.popleft()
+            if idx == target_idx:
+                path = [node_ids[idx]]
+                while idx != start_idx:
+                    idx = predecessors[idx]
+                    path.append(node_ids[idx])
+                return path[::-1]
+
+            for pos in range(offsets[idx], offsets[idx + 1]):
+                neigh_idx = targets[pos]
+                if predecessors[neigh_idx] == -1:
+                    predecessors[neigh_idx] = idx
+                    queue.append(neigh_idx)
+        return None
 
-        return dijkstra_matrix
 
 class PrimePathCore:
     """
@@ -415,55 +1126,90 @@ class PrimePathCore:
         self.graph_dict = dict(self.digraph_manager(diblob_id)[diblob_id])
         self.reversed_graph = self.reverse_graph(self.graph_dict)
 
+        self.sccs = TarjanSCC(digraph_manager).run()
         self.tarjant_dict = {}
-        for scc in TarjanSCC(digraph_manager).run():
+        for scc in self.sccs:
             for node_id in scc:
                 self.tarjant_dict[node_id] = scc
 
+        # outgoing nodes without repetitions (in order of the edges)
+        get_node = get_reader(digraph_manager.nodes)
+        self.adjacency = {
+            node_id: list(dict.fromkeys(get_node(node_id).outgoing_nodes))
+            for node_id in digraph_manager.nodes
+        }
+
+    def get_induced_adjacency(self, node_ids: set):
+        """
+        Returns dict representation of the digraph induced by node_ids
+        (the same as DiblobFactory.get_induced_digraph, multiple edges as one).
+        """
+        adjacency = self.adjacency
+        return {
+            node_id: [
+                outgoing_node_id
+                for outgoing_node_id in adjacency[node_id]
+                if outgoing_node_id in node_ids
+            ]
+            for node_id in node_ids
+        }
+
     def dfs_jonson(self, node_id: str, induced_graph: dict, stack: list,
                     blocked_set: set, blocked_dict: dict):
         """
-        DFS part from Jonson's algorithm
+        DFS part from Jonson's algorithm (explicit stack, cycles are yielded
+        directly instead of through the chain of nested generators).
         """
-
-        found_cycle = False
+        # found_cycle[i] - cycle was found from call_stack[i]
+        found_cycle = [False]
+        call_stack = [(node_id, iter(induced_graph[node_id]))]
         stack.append(node_id)
         blocked_set.add(node_id)
 
-        for outgoing_node_id in induced_graph[node_id]:
-            if stack[0] == outgoing_node_id:
-                yield (*stack, outgoing_node_id)
-                found_cycle = True
-
-            elif outgoing_node_id not in blocked_set:
-                for result in self.dfs_jonson(outgoing_node_id,
-                                              induced_graph,
-                                              stack,
-                                              blocked_set,
-                                              blocked_dict):
-                    yield result
-                    found_cycle = True
-
-        if found_cycle:
-            self.unblock(blocked_set, blocked_dict, node_id)
-        else:
-            for outgoing_node_id in induced_graph[node_id]:
-                if node_id not in blocked_dict[outgoing_node_id]:
-                    blocked_dict[outgoing_node_id].add(node_id)
-
-        stack.pop()
-        return
+        while call_stack:
+            node_id, outgoing_node_ids = call_stack[-1]
+
+            for outgoing_node_id in outgoing_node_ids:
+                if stack[0] == outgoing_node_id:
+                    yield (*stack, outgoing_node_id)
+                    found_cycle[-1] = True
+
+                elif outgoing_node_id not in blocked_set:
+                    found_cycle.append(False)
+                    call_stack.append(
+                        (outgoing_node_id, iter(induced_graph[outgoing_node_id]))
+                    )
+                    stack.append(outgoing_node_id)
+                    blocked_set.add(outgoing_node_id)
+                    break
+            else:
+                call_stack.pop()
+
+                if found_cycle.pop():
+                    self.unblock(blocked_set, blocked_dict, node_id)
+                    if found_cycle:
+                        found_cycle[-1] = True
+                else:
+                    for outgoing_node_id in induced_graph[node_id]:
+                        blocked_dict[outgoing_node_id].add(node_id)
+
+                stack.pop()
 
     def unblock(self, blocked_set: set, blocked_dict: dict, node_id: str):
         """
-        Unblock mechanism from Jonson's algorithm for simple cycles.
+        Unblock mechanism from Jonson's algorithm for simple cycles (explicit stack).
         """
         blocked_set.remove(node_id)
+        nodes_to_unblock = [node_id]
 
-        while blocked_dict[node_id]:
-            blocked_outgoing_id = blocked_dict[node_id].pop()
-            if blocked_outgoing_id in blocked_set:
-                self.unblock(blocked_set, blocked_dict, blocked_outgoing_id)
+        while nodes_to_unblock:
+            blocked_node_ids = blocked_dict[nodes_to_unblock.pop()]
+
+            while blocked_node_ids:
+                blocked_outgoing_id = blocked_node_ids.pop()
+                if blocked_outgoing_id in blocked_set:
+                    blocked_set.remove(blocked_outgoing_id)
+                    nodes_to_unblock.append(blocked_outgoing_id)
 
     @staticmethod
     def reverse_graph(graph_dict: dict):
@@ -479,16 +1225,92 @@ class PrimePathCore:
 
         return reversed_graph
 
+class ArtificialNodeOverlay:
+    """
+    Artificial node of the extended digraph (see MaxSimplePathGenerator) kept
+    outside of the digraph manager: edge artificial_node -> node_id and edges
+    tail -> artificial_node for tails which are not excluded.
+    """
+
+    __slots__ = ("artificial_node", "node_id", "tails", "excluded")
+
+    def __init__(self, artificial_node: str, node_id: str, tails: dict, excluded: set):
+        self.artificial_node = artificial_node
+        self.node_id = node_id
+        self.tails = tails
+        self.excluded = excluded
+
+    def is_tail(self, node_id: str):
+        """
+        Checks there is an edge node_id -> artificial_node.
+        """
+        return node_id in self.tails and node_id not in self.excluded
+
+
 class MaxSimplePathGenerator(PrimePathCore):
     """
-    MaX Simple Path Generator - based on the node_id
+    MaX Simple Path Generator - based on the node_id.
+    Digraph manager is not modified, so maximal simple paths can be generated
+    for many starting nodes at the same time.
     """
     def __init__(self, digraph_manager: DigraphManager):
         super().__init__(digraph_manager)
 
+        # computed once for all starting nodes: number of the SCC of the node
+        # and condensation of the digraph
+        self.scc_index = {
+            node_id: idx for idx, scc in enumerate(self.sccs) for node_id in scc
+        }
+        self.scc_successors = [set() for _ in self.sccs]
+
+        for node_id, outgoing_nodes in self.adjacency.items():
+            idx = self.scc_index[node_id]
+            for outgoing_node_id in outgoing_nodes:
+                if self.scc_index[outgoing_node_id] != idx:
+                    self.scc_successors[idx].add(self.scc_index[outgoing_node_id])
+
+        # nodes connected with the artificial node (for every starting node
+        # except the starting node and its incoming nodes)
+        self.artificial_tails = dict.fromkeys(
+            node_id
+            for node_id in digraph_manager.nodes
+            if self._is_artificial_tail(node_id)
+        )
+        self.scc_artificial_tails = Counter(
+            self.scc_index[node_id] for node_id in self.artificial_tails
+        )
+
+    def _is_artificial_tail(self, node_id: str):
+        """
+        Used in __init__. Checks the node can end a Maximal Simple Path.
+        """
+        get_node = get_reader(self.digraph_manager.nodes)
+        outgoing_nodes = get_node(node_id).outgoing_nodes
+        node_id_scc_idx = self.scc_index[node_id]
+
+        set_out_incoming = set()
+        set_out_outgoing = set()
+
+        for outgoing_node_id in outgoing_nodes:
+            if self.scc_index[outgoing_node_id] != node_id_scc_idx:
+                return False
+
+            set_out_incoming |= set(get_node(outgoing_node_id).incoming_nodes)
+            set_out_outgoing |= set(get_node(outgoing_node_id).outgoing_nodes)
+
+        if len(set_out_incoming) <= len(outgoing_nodes) and len(outgoing_nodes) > 0:
+            return False
+
+        node_id_scc = self.sccs[node_id_scc_idx]
+
+        if len(set_out_incoming & node_id_scc) < len(outgoing_nodes):
+            return False
+
+        return len(set_out_outgoing & node_id_scc) >= len(outgoing_nodes)
+
     def get_extended_graph(self, node_id: str, artificial_node: str = "ArtificialNode"):
         """
-        Returns extended digraph for given node_id, None if
+        Returns extended digraph (ArtificialNodeOverlay) for given node_id, None if
         node_id cannot be a Maximal Simple Path starting node.
         """
 
@@ -498,67 +1320,96 @@ class MaxSimplePathGenerator(PrimePathCore):
             raise InvalidNodeIdException(f"{node_id} doesn't exists in \
                     digraph_manager, available nodes: {self.digraph_manager.nodes}")
 
-        incoming_nodes = self.digraph_manager[node_id].incoming_nodes
+        get_node = get_reader(self.digraph_manager.nodes)
+        incoming_nodes = get_node(node_id).incoming_nodes
         set_in_outgoing = set()
         set_in_incoming = set()
         node_id_ssc = self.tarjant_dict[node_id]
 
 
-        for incoming_node_id in self.digraph_manager[node_id].incoming_nodes:
+        for incoming_node_id in incoming_nodes:
             if self.tarjant_dict[incoming_node_id] - node_id_ssc:
-                return False #Always extendable -> Different SCCs
-            set_in_outgoing |= set(self.digraph_manager[incoming_node_id].outgoing_nodes)
-            set_in_incoming |= set(self.digraph_manager[incoming_node_id].incoming_nodes)
+                return None #Always extendable -> Different SCCs
+            set_in_outgoing |= set(get_node(incoming_node_id).outgoing_nodes)
+            set_in_incoming |= set(get_node(incoming_node_id).incoming_nodes)
 
         if len(set_in_outgoing) <= len(incoming_nodes) and len(incoming_nodes) > 0:
-            return False
+            return None
 
         if len(node_id_ssc & set_in_outgoing) < len(incoming_nodes):
-            return False
+            return None
 
         if len(node_id_ssc & set_in_incoming) < len(incoming_nodes):
-            return False
-
-        nodes_to_add = {(artificial_node, node_id)}
-
-        for digraph_manager_node_id in self.digraph_manager.nodes:
-
-            if digraph_manager_node_id == node_id:
-                continue
-
-            if node_id in self.digraph_manager.nodes[digraph_manager_node_id].outgoing_nodes:
-                continue #There is a possible cycle
+            return None
 
-            skip_loop = False
-            outgoing_nodes = self.digraph_manager[digraph_manager_node_id].outgoing_nodes
+        # node_id and its incoming nodes are not connected with artificial node
+        # (there is a possible cycle)
+        return ArtificialNodeOverlay(
+            artificial_node, node_id, self.artificial_tails, {node_id, *incoming_nodes}
+        )
 
-            set_out_incoming = set()
-            set_out_outgoing = set()
-            digraph_manager_node_id_ssc = self.tarjant_dict[digraph_manager_node_id]
-
-            for outgoing_node_id in outgoing_nodes:
-                if self.tarjant_dict[outgoing_node_id] != digraph_manager_node_id_ssc:
-                    skip_loop = True
+    def get_extended_scc(self, extended_graph: ArtificialNodeOverlay):
+        """
+        Returns SCC of the extended digraph with the starting node.
+        SCC consists of the SCCs (of the original digraph) reachable from the
+        starting node which reach the artificial node - computed on the
+        condensation in O(number of reachable SCCs) instead of TarjanSCC
+        of the extended digraph.
+        """
+        root_idx = self.scc_index[extended_graph.node_id]
+        scc_successors = self.scc_successors
+
+        # SCCs of the tails of the artificial node
+        artificial_tails = self.scc_artificial_tails - Counter(
+            self.scc_index[node_id]
+            for node_id in extended_graph.excluded
+            if node_id in extended_graph.tails
+        )
+
+        reaching = set()
+        visited = {root_idx}
+        call_stack = [(root_idx, iter(scc_successors[root_idx]))]
+
+        while call_stack:
+            idx, successors = call_stack[-1]
+
+            for successor_idx in successors:
+                if successor_idx not in visited:
+                    visited.add(successor_idx)
+                    call_stack.append(
+                        (successor_idx, iter(scc_successors[successor_idx]))
+                    )
                     break
+            else:
+                call_stack.pop()
+                if idx in artificial_tails or not reaching.isdisjoint(
+                    scc_successors[idx]
+                ):
+                    reaching.add(idx)
 
-                set_out_incoming |= set(self.digraph_manager[outgoing_node_id].incoming_nodes)
-                set_out_outgoing |= set(self.digraph_manager[outgoing_node_id].outgoing_nodes)
-
-            if skip_loop or len(set_out_incoming) <= len(outgoing_nodes) and len(outgoing_nodes) > 0:
-                continue
+        if root_idx not in reaching:
+            return set(self.sccs[root_idx])
 
-            if len(set_out_incoming & digraph_manager_node_id_ssc) < len(outgoing_nodes):
-                continue
+        return {extended_graph.artificial_node}.union(
+            *(self.sccs[idx] for idx in reaching)
+        )
 
-            if len(set_out_outgoing & digraph_manager_node_id_ssc) < len(outgoing_nodes):
-                continue
+    def get_induced_graph(self, node_ids: set, extended_graph: ArtificialNodeOverlay):
+        """
+        Returns dict representation of the extended digraph induced by node_ids
+        (see get_induced_adjacency).
+        """
+        artificial_node = extended_graph.artificial_node
+        induced_graph = self.get_induced_adjacency(node_ids - {artificial_node})
 
-            nodes_to_add.add((digraph_manager_node_id, artificial_node))
+        if artificial_node in node_ids:
+            induced_graph[artificial_node] = [extended_graph.node_id]
 
-        self.digraph_manager.add_nodes(artificial_node)
-        self.digraph_manager.connect_nodes(*nodes_to_add)
+            for node_id in node_ids:
+                if extended_graph.is_tail(node_id):
+                    induced_graph[node_id].append(artificial_node)
 
-        return True
+        return induced_graph
 
     def get_maximal_simple_path_for_node_id(self,
                                             node_id: str,
@@ -569,40 +1420,32 @@ class MaxSimplePathGenerator(PrimePathCore):
         graph_dict = self.graph_dict
         reversed_graph = self.reversed_graph
         extended_graph = self.get_extended_graph(node_id, artificial_node)
-        digraph_manager = self.digraph_manager
-
-        if extended_graph:
-
-            for scc in TarjanSCC(digraph_manager).run():
 
-                if node_id in scc:
+        if extended_graph is not None:
 
-                    induced_graph = DiblobFactory.get_induced_digraph(digraph_manager, scc)
-                    induced_graph = dict(induced_graph("Ind")["Ind"])
+            scc = self.get_extended_scc(extended_graph)
+            induced_graph = self.get_induced_graph(scc, extended_graph)
 
-                    blocked_dict = {n_id: set() for n_id in induced_graph}
-                    blocked_set = set()
-                    stack = []
-
-                    for potential_simple_path in self.dfs_jonson(artificial_node,
-                                                                 induced_graph,
-                                                                 stack,
-                                                                 blocked_set,
-                                                                 blocked_dict):
+            blocked_dict = {n_id: set() for n_id in induced_graph}
+            blocked_set = set()
+            stack = []
 
-                        potential_simple_path = potential_simple_path[1:-1]
-                        tail, head = potential_simple_path[0], potential_simple_path[-1]
+            for potential_simple_path in self.dfs_jonson(artificial_node,
+                                                         induced_graph,
+                                                         stack,
+                                                         blocked_set,
+                                                         blocked_dict):
 
-                        tail_ok = all(_node in potential_simple_path
-                                      for _node in reversed_graph[tail])
-                        head_ok = all(_node in potential_simple_path
-                                      for _node in graph_dict[head])
+                potential_simple_path = potential_simple_path[1:-1]
+                tail, head = potential_simple_path[0], potential_simple_path[-1]
 
-                        if tail_ok and head_ok:
-                            yield potential_simple_path
+                tail_ok = all(_node in potential_simple_path
+                              for _node in reversed_graph[tail])
+                head_ok = all(_node in potential_simple_path
+                              for _node in graph_dict[head])
 
-                    self.digraph_manager.remove_nodes(self.digraph_manager[artificial_node])
-                    return
+                if tail_ok and head_ok:
+                    yield potential_simple_path
 
 
 class SimpleCycleGenerator(PrimePathCore):
@@ -613,33 +1456,129 @@ class SimpleCycleGenerator(PrimePathCore):
     def __init__(self, digraph_manager: DigraphManager):
         super().__init__(digraph_manager)
 
+        self.node_ids = list(digraph_manager.nodes)
+        self.node_indices = {node_id: idx for idx, node_id in enumerate(self.node_ids)}
+
     def get_simple_cycles(self):
         """
-        Yields simple cycles
+        Yields simple cycles (Johnson's scheme - cycles which start from the node
+        are found in its SCC of the digraph induced by the node and the next
+        nodes, after removal of the node only its SCC is split by TarjanSCC).
         """
+        adjacency = self.adjacency
 
-        nodes = list(self.digraph_manager.nodes)
-        digraph_manager = self.digraph_manager
-        tarjan_dict = self.tarjant_dict
+        # SCC of the digraph induced by the remaining nodes
+        remaining_sccs = {
+            node_id: scc for scc in map(set, self.sccs) for node_id in scc
+        }
 
-        for node_index, node_id in enumerate(nodes):
-            induced_nodes = set(nodes[node_index:]) & tarjan_dict[node_id]
-            induced_graph = DiblobFactory.get_induced_digraph(digraph_manager, induced_nodes)
-            induced_graph = dict(induced_graph("Ind")["Ind"])
+        for node_id in self.node_ids:
+            scc = remaining_sccs.pop(node_id)
 
-            stack = []
-            blocked_dict = {n_id: set() for n_id in induced_graph}
-            blocked_set = set()
+            if len(scc) > 1 or node_id in adjacency[node_id]:
+                yield from self._get_simple_cycles(node_id, scc)
+
+            scc.remove(node_id)
+            if len(scc) < 2:
+                continue
+
+            for remaining_scc in TarjanSCC.get_sccs(
+                scc,
+                lambda n_id: [
+                    outgoing_node_id
+                    for outgoing_node_id in adjacency[n_id]
+                    if outgoing_node_id in scc
+                ],
+            ):
+                for remaining_node_id in remaining_scc:
+                    remaining_sccs[remaining_node_id] = remaining_scc
+
+    def get_simple_cycles_for_node_index(self, node_index: int):
+        """
+        Yields simple cycles which start from self.node_ids[node_index]
+        and consist of self.node_ids[node_index:] (independent of the other
+        nodes, used by the worker processes).
+        """
+        node_id = self.node_ids[node_index]
+        node_indices = self.node_indices
+
+        induced_nodes = {
+            n_id
+            for n_id in self.tarjant_dict[node_id]
+            if node_indices[n_id] >= node_index
+        }
+        if len(induced_nodes) > 1 or node_id in self.adjacency[node_id]:
+            yield from self._get_simple_cycles(node_id, induced_nodes)
+
+    def _get_simple_cycles(self, node_id: str, node_ids: set):
+        """
+        Yields simple cycles which start from node_id in digraph induced by node_ids.
+        """
+        induced_graph = self.get_induced_adjacency(node_ids)
+
+        stack = []
+        blocked_dict = {n_id: set() for n_id in induced_graph}
+        blocked_set = set()
+
+        yield from self.dfs_jonson(node_id,
+                                   induced_graph,
+                                   stack,
+                                   blocked_set,
+                                   blocked_dict)
+
+
+# state of the worker process of PrimePathGenerator (see _init_prime_path_worker)
+_WORKER_STATE = {}
+
+
+def _init_prime_path_worker(adjacency: dict, root_diblob_id: str):
+    """
+    Initializer of the worker process - digraph is sent once per worker as
+    plain {node_id: [outgoing node_ids]} dict and rebuilt by from_adjacency,
+    generators are created when the first task is executed.
+    """
+    _WORKER_STATE.clear()
+    _WORKER_STATE["digraph_manager"] = DigraphManager.from_adjacency(
+        adjacency, root_diblob_id
+    )
+
+
+def _get_worker_generator(generator_class: type):
+    """
+    Returns generator of the worker process (created once per worker).
+    """
+    if generator_class not in _WORKER_STATE:
+        digraph_manager = _WORKER_STATE["digraph_manager"]
+        _WORKER_STATE[generator_class] = generator_class(digraph_manager)
+    return _WORKER_STATE[generator_class]
+
+
+def _max_simple_paths_task(node_id: str):
+    """
+    Returns maximal simple paths which start from node_id (worker process).
+    """
+    generator = _get_worker_generator(MaxSimplePathGenerator)
+    return list(generator.get_maximal_simple_path_for_node_id(node_id))
+
+
+def _simple_cycles_task(node_index: int):
+    """
+    Returns simple cycles for the node with node_index (worker process).
+    """
+    generator = _get_worker_generator(SimpleCycleGenerator)
+    return list(generator.get_simple_cycles_for_node_index(node_index))
 
-            yield from self.dfs_jonson(node_id,
-                                        induced_graph,
-                                        stack,
-                                        blocked_set,
-                                        blocked_dict)
 
 class PrimePathGenerator:
     """
     Prime Paths generator (backward compatibility)
+
+    Paths and cycles are generated in the calling process by default.
+    With processes > 1 starting nodes are sharded between worker processes
+    (ProcessPoolExecutor) - the digraph is sent once per worker (as adjacency dict),
+    results are yielded in the same order as in the calling process.
+    Tasks are sent in chunks of chunksize starting nodes
+    (by default about 64 chunks per worker).
     """
     def __init__(self, digraph_manager):
         self.digraph_manager = digraph_manager
@@ -647,11 +1586,52 @@ class PrimePathGenerator:
         self.simple_cycles_generator = SimpleCycleGenerator(digraph_manager)
 
 
-    def get_prime_paths_without_cycles(self):
+    def get_prime_paths_without_cycles(
+        self, processes: int = None, chunksize: int = None
+    ):
+        if processes and processes > 1:
+            node_ids = list(self.digraph_manager.nodes)
+            yield from self._run_parallel(
+                _max_simple_paths_task, node_ids, processes, chunksize
+            )
+            return
+
         for node_id in self.digraph_manager.nodes:
             for max_simple_cycle in self.max_simple_paths_generator.get_maximal_simple_path_for_node_id(node_id):
                 yield max_simple_cycle
 
-    def get_cycles(self):
+    def get_cycles(self, processes: int = None, chunksize: int = None):
+        if processes and processes > 1:
+            node_indices = range(len(self.digraph_manager.nodes))
+            yield from self._run_parallel(
+                _simple_cycles_task, node_indices, processes, chunksize
+            )
+            return
+
         for simple_cycle in self.simple_cycles_generator.get_simple_cycles():
             yield simple_cycle
+
+    def _run_parallel(self, task, items, processes: int, chunksize: int = None):
+        """
+        Yields results of the task for items computed by worker processes
+        (in order of the items).
+        """
+        if chunksize is None:
+            chunksize = max(1, len(items) // (64 * processes))
+
+        get_node = get_reader(self.digraph_manager.nodes)
+        adjacency = {
+            node_id: list(get_node(node_id).outgoing_nodes)
+            for node_id in self.digraph_manager.nodes
+        }
+
+        executor = ProcessPoolExecutor(
+            processes,
+            initializer=_init_prime_path_worker,
+            initargs=(adjacency, self.digraph_manager.root_diblob_id),
+        )
+        try:
+            for results in executor.map(task, items, chunksize=chunksize):
+                yield from results
+        finally:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,107 @@
+"""
+Module consists of CompactDigraph - immutable, array-backed snapshot
+of the digraph used by read-only algorithms.
+"""
+
+from array import array
+
+
+class CompactDigraph:
+    """
+    Compressed sparse row (CSR) snapshot of the digraph.
+
+    Nodes are mapped to integer indices (order of digraph_manager.nodes).
+    Outgoing nodes of the node with index idx are stored in
+    targets[offsets[idx]:offsets[idx + 1]] (incoming nodes analogously in
+    rev_targets / rev_offsets). Order of the neighbours is the same as in
+    Node.outgoing_nodes / Node.incoming_nodes, multiple edges are kept.
+
+    Args:
+        digraph_manager (DigraphManager): digraph which will be frozen.
+
+    Note: snapshot is not updated when digraph_manager is modified.
+    """
+
+    __slots__ = (
+        "node_ids",
+        "node_index",
+        "offsets",
+        "targets",
+        "rev_offsets",
+        "rev_targets",
+    )
+
+    def __init__(self, digraph_manager):
+        nodes = digraph_manager.nodes
+
+        self.node_ids = tuple(nodes)
+        self.node_index = {node_id: idx for idx, node_id in enumerate(self.node_ids)}
+
+        self.offsets, self.targets = self._compress(
+            node.outgoing_nodes for node in nodes.values()
+        )
+        self.rev_offsets, self.rev_targets = self._compress(
+            node.incoming_nodes for node in nodes.values()
+        )
+
+    def _compress(self, neighbours_lists):
+        """
+        Used in __init__. Builds read-only offsets and targets arrays.
+        """
+        node_index = self.node_index
+        offsets = array("q", [0])
+        targets = array("q")
+
+        for neighbours in neighbours_lists:
+            targets.extend(node_index[node_id] for node_id in neighbours)
+            offsets.append(len(targets))
+
+        return memoryview(offsets).toreadonly(), memoryview(targets).toreadonly()
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __contains__(self, node_id: str):
+        return node_id in self.node_index
+
+    def number_of_edges(self):
+        """
+        Number of edges (with multiplicities).
+        """
+        return len(self.targets)
+
+    def index(self, node_id: str):
+        """
+        Returns index of the node_id.
+        """
+        return self.node_index[node_id]
+
+    def successors(self, idx: int):
+        """
+        Returns indices of the outgoing nodes.
+        """
+        return self.targets[self.offsets[idx] : self.offsets[idx + 1]]
+
+    def predecessors(self, idx: int):
+        """
+        Returns indices of the incoming nodes.
+        """
+        return self.rev_targets[self.rev_offsets[idx] : self.rev_offsets[idx + 1]]
+
+    def edge_weights(self, cost_function: dict = None):
+        """
+        Returns list of edge costs aligned with targets.
+        Every edge costs 1 if cost_function is not delivered.
+        """
+        if cost_function is None:
+            return [1] * len(self.targets)
+
+        node_ids = self.node_ids
+        offsets = self.offsets
+        targets = self.targets
+
+        return [
+            cost_function[(node_ids[idx], node_ids[targets[pos]])]
+            for idx in range(len(node_ids))
+            for pos in range(offsets[idx], offsets[idx + 1])
+        ]
@@ -1,11 +1,183 @@
 """
-Module consists of Edge, Diblob and Node class which are
+Module consists of Edge, EdgeMultiset, Diblob and Node class which are
 components used by DigraphManager.
 """
 
 from diblob.exceptions import InvalidPathException
 
 
+class _MultisetIndex:
+    """
+    Index of the large OrderedMultiset - number of occurrences of the node ids
+    and the number of removed (not yet dropped from the list) first occurrences.
+    """
+
+    __slots__ = ("counts", "removed", "number_of_removed")
+
+    def __init__(self, node_ids: list[str]):
+        self.counts = {}
+        self.removed = {}
+        self.number_of_removed = 0
+
+        for node_id in node_ids:
+            self.counts[node_id] = self.counts.get(node_id, 0) + 1
+
+
+class OrderedMultiset:
+    """
+    List-like multiset of node ids used as the adjacency of the Node.
+    Node ids are kept in the order of insertion (as in the list, repeated node ids
+    of the pseudograph are not grouped), remove drops the first occurrence.
+
+    Small multisets are plain lists. Multisets with more than INDEX_THRESHOLD node
+    ids are indexed (counts of the node ids, removed node ids are dropped from
+    the list lazily), so append, remove, `in`, count and indexing are O(1)
+    (amortized) for high degree nodes.
+
+    Args:
+        node_ids (iterable[str]): initial node ids.
+    """
+
+    __slots__ = ("_node_ids", "_index")
+
+    INDEX_THRESHOLD = 32
+
+    def __init__(self, node_ids=()):
+        self._node_ids = list(node_ids)
+        self._index = (
+            _MultisetIndex(self._node_ids)
+            if len(self._node_ids) > self.INDEX_THRESHOLD
+            else None
+        )
+
+    def _compact(self):
+        """
+        Drops removed node ids from the list.
+        """
+        removed = self._index.removed
+        node_ids = []
+
+        for node_id in self._node_ids:
+            if removed.get(node_id):
+                removed[node_id] -= 1
+            else:
+                node_ids.append(node_id)
+
+        self._node_ids = node_ids
+        self._index = (
+            _MultisetIndex(node_ids) if len(node_ids) > self.INDEX_THRESHOLD else None
+        )
+
+    def __len__(self):
+        if self._index is None:
+            return len(self._node_ids)
+        return len(self._node_ids) - self._index.number_of_removed
+
+    def __contains__(self, node_id: str):
+        if self._index is None:
+            return node_id in self._node_ids
+        return node_id in self._index.counts
+
+    def __iter__(self):
+        if self._index is None or not self._index.number_of_removed:
+            return iter(self._node_ids)
+        return self._iter_lazy()
+
+    def _iter_lazy(self):
+        removed = dict(self._index.removed)
+
+        for node_id in self._node_ids:
+            if removed.get(node_id):
+                removed[node_id] -= 1
+            else:
+                yield node_id
+
+    def __reversed__(self):
+        if self._index is not None and self._index.number_of_removed:
+            self._compact()
+        return reversed(self._node_ids)
+
+    def __getitem__(self, idx: int | slice):
+        if not isinstance(idx, (int, slice)):
+            raise TypeError(
+                f"OrderedMultiset indices must be integers or slices, not {type(idx)}"
+            )
+
+        if self._index is not None and self._index.number_of_removed:
+            self._compact()
+        return self._node_ids[idx]
+
+    def __eq__(self, other):
+        if isinstance(other, (OrderedMultiset, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, node_id: str):
+        """
+        Adds node_id.
+        """
+        self._node_ids.append(node_id)
+
+        if self._index is not None:
+            counts = self._index.counts
+            counts[node_id] = counts.get(node_id, 0) + 1
+        elif len(self._node_ids) > self.INDEX_THRESHOLD:
+            self._index = _MultisetIndex(self._node_ids)
+
+    def remove(self, node_id: str):
+        """
+        Removes the first occurrence of node_id.
+        """
+        index = self._index
+
+        if index is None:
+            if node_id not in self._node_ids:
+                raise ValueError(f"{node_id} not in OrderedMultiset")
+            self._node_ids.remove(node_id)
+            return
+
+        count = index.counts.get(node_id)
+
+        if count is None:
+            raise ValueError(f"{node_id} not in OrderedMultiset")
+
+        if count == 1:
+            del index.counts[node_id]
+        else:
+            index.counts[node_id] = count - 1
+
+        index.removed[node_id] = index.removed.get(node_id, 0) + 1
+        index.number_of_removed += 1
+
+        if 2 * index.number_of_removed > len(self._node_ids):
+            self._compact()
+
+    def count(self, node_id: str):
+        """
+        Returns number of occurrences of node_id.
+        """
+        if self._index is None:
+            return self._node_ids.count(node_id)
+        return self._index.counts.get(node_id, 0)
+
+    def distinct(self):
+        """
+        Returns distinct node ids (keys view).
+        """
+        if self._index is None:
+            return dict.fromkeys(self._node_ids).keys()
+        return self._index.counts.keys()
+
+
 class Node:
     """
     Node representation in digraph.
@@ -16,9 +188,12 @@ class Node:
         incoming_nodes (list[str]): list of incoming node ids.
         outgoing_nodes (list[str]): list of outgoing node ids.
 
-    Note: {incoming}/{outgoing}_nodes can be redundant (pseudograph enabled).
+    Note: {incoming}/{outgoing}_nodes can be redundant (pseudograph enabled),
+          they are stored as OrderedMultiset (assigned lists are converted).
     """
 
+    __slots__ = ("node_id", "diblob_id", "_incoming_nodes", "_outgoing_nodes")
+
     def __init__(
         self,
         node_id: str,
@@ -32,6 +207,36 @@ class Node:
         self.incoming_nodes = incoming_nodes
         self.outgoing_nodes = outgoing_nodes
 
+    @property
+    def incoming_nodes(self):
+        """
+        Incoming node ids (OrderedMultiset).
+        """
+        return self._incoming_nodes
+
+    @incoming_nodes.setter
+    def incoming_nodes(self, node_ids):
+        self._incoming_nodes = (
+            node_ids
+            if isinstance(node_ids, OrderedMultiset)
+            else OrderedMultiset(node_ids)
+        )
+
+    @property
+    def outgoing_nodes(self):
+        """
+        Outgoing node ids (OrderedMultiset).
+        """
+        return self._outgoing_nodes
+
+    @outgoing_nodes.setter
+    def outgoing_nodes(self, node_ids):
+        self._outgoing_nodes = (
+            node_ids
+            if isinstance(node_ids, OrderedMultiset)
+            else OrderedMultiset(node_ids)
+        )
+
     def get_incoming_edges(self):
         """
         Returns set of edge ids where the node is head.
@@ -92,6 +297,8 @@ class Edge:
              A -> B with edge [A, B, C, D].
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, path: list[str]):
 
         if len(path) < 2:
@@ -118,6 +325,70 @@ class Edge:
         self.path = self.path[::-1]
 
 
+class EdgeMultiset:
+    """
+    Compact representation of the multiple edges with the path [tail, head]
+    - only the number of the edges is stored. Behaves like the list of Edge
+    objects (used by DigraphManager with compact_edges=True), Edge objects
+    are created on demand and compared by the path.
+
+    Args:
+        tail (str): tail of the edges.
+        head (str): head of the edges.
+        count (int): number of the edges.
+    """
+
+    __slots__ = ("tail", "head", "count")
+
+    def __init__(self, tail: str, head: str, count: int = 0):
+        self.tail = tail
+        self.head = head
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for _ in range(self.count):
+            yield Edge([self.tail, self.head])
+
+    def __getitem__(self, idx: int | slice):
+        if isinstance(idx, slice):
+            return [Edge([self.tail, self.head]) for _ in range(self.count)[idx]]
+
+        if not -self.count <= idx < self.count:
+            raise IndexError("EdgeMultiset index out of range")
+
+        return Edge([self.tail, self.head])
+
+    def __repr__(self):
+        return f"EdgeMultiset({self.tail!r}, {self.head!r}, count={self.count})"
+
+    def accepts(self, edge: Edge):
+        """
+        Returns True if edge can be stored in the multiset.
+        """
+        return edge.path == [self.tail, self.head]
+
+    def append(self, edge: Edge):
+        """
+        Adds edge to the multiset.
+        """
+        if not self.accepts(edge):
+            raise InvalidPathException(
+                f"Only edges with the path {[self.tail, self.head]} can be added!"
+            )
+        self.count += 1
+
+    def remove(self, edge: Edge):
+        """
+        Removes edge from the multiset.
+        """
+        if not self.count or not self.accepts(edge):
+            raise ValueError(f"{edge.path} not in EdgeMultiset")
+        self.count -= 1
+
+
 class Diblob:
     """
     Subgraph of the graph.
@@ -129,6 +400,8 @@ class Diblob:
         parent_id (str): id of the diblob in which the considered diblob is contained.
     """
 
+    __slots__ = ("diblob_id", "parent_id", "children", "nodes")
+
     def __init__(
         self, diblob_id: str, children: set, nodes: list[str], parent_id: str = None
     ) -> None:
@@ -0,0 +1,124 @@
+"""
+Module consists of CopyOnWriteDict - mapping used by forked digraph managers
+(DigraphManager.fork) to share unchanged components with the parent.
+"""
+
+from collections.abc import MutableMapping
+from copy import deepcopy
+
+
+class CopyOnWriteDict(MutableMapping):
+    """
+    Overlay over the base dict. Values are read from the base without copying,
+    they are copied lazily by get_mutable (the first time they are modified),
+    new, replaced and removed keys are stored only in the overlay.
+    Order of the keys is the same as for the dict with the same history.
+
+    Args:
+        base (dict | CopyOnWriteDict): shared mapping, never modified by the overlay.
+        copy_value (callable): function copying values of the base (deepcopy).
+
+    Note: base should not be modified while the overlay is in use.
+    """
+
+    __slots__ = ("_base", "_local", "_hidden", "_tail", "_copy_value")
+
+    def __init__(self, base, copy_value=deepcopy):
+        self._base = base
+        self._copy_value = copy_value
+        # copied or assigned values
+        self._local = {}
+        # base keys which are removed (or re-added at the end)
+        self._hidden = set()
+        # keys added after the base keys (ordered set)
+        self._tail = {}
+
+    def _in_base(self, key):
+        return key in self._base and key not in self._hidden
+
+    def peek(self, key):
+        """
+        Returns value without copying it (value should not be modified).
+        """
+        if key in self._local:
+            return self._local[key]
+
+        if not self._in_base(key):
+            raise KeyError(key)
+
+        if isinstance(self._base, CopyOnWriteDict):
+            return self._base.peek(key)
+        return self._base[key]
+
+    def get_mutable(self, key):
+        """
+        Returns value which can be modified in place (value shared with the base
+        is copied to the overlay first).
+        """
+        if key in self._local:
+            return self._local[key]
+
+        value = self._copy_value(self.peek(key))
+        self._local[key] = value
+        return value
+
+    def __getitem__(self, key):
+        return self.peek(key)
+
+    def __setitem__(self, key, value):
+        if not self._in_base(key):
+            self._tail[key] = None
+        self._local[key] = value
+
+    def __delitem__(self, key):
+        if key in self._tail:
+            del self._tail[key]
+        elif self._in_base(key):
+            self._hidden.add(key)
+        else:
+            raise KeyError(key)
+
+        self._local.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._tail or self._in_base(key)
+
+    def __iter__(self):
+        hidden = self._hidden
+        for key in self._base:
+            if key not in hidden:
+                yield key
+        yield from self._tail
+
+    def __len__(self):
+        return len(self._base) - len(self._hidden) + len(self._tail)
+
+    def __or__(self, other):
+        return dict(self) | dict(other)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __repr__(self):
+        return f"{type(self).__name__}({ {key: self.peek(key) for key in self} })"
+
+
+def get_reader(mapping):
+    """
+    Returns function reading values of the mapping without copying them
+    (CopyOnWriteDict.peek for the overlay). Values should not be modified.
+    """
+    if isinstance(mapping, CopyOnWriteDict):
+        return mapping.peek
+    return mapping.__getitem__
+
+
+def get_writer(mapping):
+    """
+    Returns function reading values of the mapping which can be modified in place
+    (CopyOnWriteDict.get_mutable for the overlay).
+    """
+    if isinstance(mapping, CopyOnWriteDict):
+        return mapping.get_mutable
+    return mapping.__getitem__
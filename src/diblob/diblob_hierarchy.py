@@ -0,0 +1,103 @@
+"""
+Module consists of DiblobHierarchyIndex - index of the diblob tree used
+by the hierarchy queries of the DigraphManager (ancestors, descendants).
+"""
+
+from diblob.copy_on_write import get_reader
+
+
+class DiblobHierarchyIndex:
+    """
+    Euler tour (interval) labelling of the diblob tree with binary lifting table.
+
+    Diblobs are numbered in DFS preorder, descendants of the diblob with number
+    idx are order[idx + 1:exit[idx]], so ancestor test is O(1) and
+    lowest common ancestor is found in O(log depth) by binary lifting
+    (up[k][idx] - number of the 2^k-th ancestor of idx, root for the root).
+
+    Args:
+        diblobs (dict): diblobs of the digraph manager.
+        root_diblob_id (str): id of the root diblob.
+
+    Note: index is not updated when diblob tree is modified.
+    """
+
+    __slots__ = ("order", "index", "exit", "depth", "up")
+
+    def __init__(self, diblobs: dict, root_diblob_id: str):
+        get_diblob = get_reader(diblobs)
+
+        self.order = []
+        self.index = {}
+        self.exit = []
+        self.depth = []
+        parents = []
+
+        # (None, idx, _) marks the end of the subtree of the diblob with number idx
+        stack = [(root_diblob_id, 0, 0)]
+        while stack:
+            diblob_id, idx, depth = stack.pop()
+
+            if diblob_id is None:
+                self.exit[idx] = len(self.order)
+                continue
+
+            parent_idx, idx = idx, len(self.order)
+            self.index[diblob_id] = idx
+            self.order.append(diblob_id)
+            self.exit.append(idx + 1)
+            self.depth.append(depth)
+            parents.append(parent_idx)
+
+            stack.append((None, idx, depth))
+            stack.extend(
+                (child_id, idx, depth + 1)
+                for child_id in get_diblob(diblob_id).children
+            )
+
+        self.up = [parents]
+        for _ in range(max(self.depth).bit_length() - 1):
+            previous = self.up[-1]
+            self.up.append([previous[parent_idx] for parent_idx in previous])
+
+    def __contains__(self, diblob_id: str):
+        return diblob_id in self.index
+
+    def is_ancestor(self, ancestor_id: str, diblob_id: str):
+        """
+        Checks ancestor_id is an ancestor of diblob_id (or the same diblob).
+        """
+        ancestor_idx = self.index[ancestor_id]
+        return ancestor_idx <= self.index[diblob_id] < self.exit[ancestor_idx]
+
+    def get_depth(self, diblob_id: str):
+        """
+        Returns number of the ancestors of the diblob.
+        """
+        return self.depth[self.index[diblob_id]]
+
+    def get_descendants(self, diblob_id: str):
+        """
+        Returns diblob_ids which are descendants of the diblob.
+        """
+        idx = self.index[diblob_id]
+        return set(self.order[idx + 1 : self.exit[idx]])
+
+    def get_common_ancestor(self, diblob_id1: str, diblob_id2: str):
+        """
+        Returns lowest common ancestor of the diblobs.
+        """
+        idx1, idx2 = self.index[diblob_id1], self.index[diblob_id2]
+        exit_ = self.exit
+
+        if idx1 <= idx2 < exit_[idx1]:
+            return diblob_id1
+        if idx2 <= idx1 < exit_[idx2]:
+            return diblob_id2
+
+        for ancestors in reversed(self.up):
+            ancestor_idx = ancestors[idx1]
+            if not ancestor_idx <= idx2 < exit_[ancestor_idx]:
+                idx1 = ancestor_idx
+
+        return self.order[self.up[0][idx1]]
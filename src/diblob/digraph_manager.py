@@ -1,10 +1,15 @@
 # pylint: disable=protected-access
 
 import json
+from collections import Counter
+from copy import copy, deepcopy
 
 
-from diblob.components import Edge, Node, Diblob
-from diblob.tools import list_groupby
+from diblob.components import Edge, EdgeMultiset, Node, Diblob, OrderedMultiset
+from diblob.compact_digraph import CompactDigraph
+from diblob.copy_on_write import CopyOnWriteDict, get_reader, get_writer
+from diblob.diblob_hierarchy import DiblobHierarchyIndex
+from diblob.tools import gc_paused
 from diblob.exceptions import (
     CollisionException,
     RemoveRootDiblobException,
@@ -27,6 +32,9 @@ class DigraphManager:
 
     Arg:
         digraph_dict_representation (dict): representation of the digraph in dictionary form.
+        compact_edges (bool): if True, edges with the path [tail, head] are stored
+                              as EdgeMultiset (number of the edges) instead of the
+                              list of Edge objects (saves memory for big digraphs).
 
     Assumptions:
         - Digraphs_dict_representation should contain diblob_id which covers entire digraphs.
@@ -36,7 +44,7 @@ class DigraphManager:
           the ancestor of the other.
     """
 
-    def __init__(self, digraph_dict_representation: dict):
+    def __init__(self, digraph_dict_representation: dict, compact_edges: bool = False):
 
         if not isinstance(digraph_dict_representation, dict):
             raise InvalidDigraphDictException(
@@ -60,6 +68,10 @@ class DigraphManager:
         self.nodes = {}
         self.edges = {}
         self.root_diblob_id = root_diblob_id
+        self.compact_edges = compact_edges
+        self._hierarchy_index = None
+        # {diblob_id: dict representation}, reset by every modification
+        self._export_cache = None
 
         gather_dict = {}
         edges_to_connect = []
@@ -89,17 +101,129 @@ class DigraphManager:
         for diblob_id, nodes in reversed(gather_dict.items()):
             self.gather(diblob_id, set(nodes))
 
+    @classmethod
+    def from_edges(
+        cls,
+        edge_ids,
+        node_ids=(),
+        root_diblob_id: str = "B0",
+        compact_edges: bool = False,
+    ):
+        """
+        Bulk constructor - creates digraph (only root diblob) from edge_ids.
+        Ids are validated once for entire digraph, nodes and edges are created
+        without per-edge checks. Result is the same as add_nodes(*node_ids)
+        and connect_nodes(*edge_ids) on the empty digraph.
+
+        Args:
+            edge_ids (iterable[tuple[str, str]]): edges (multiple edges allowed).
+            node_ids (iterable[str]): nodes added before the nodes of the edges
+                                      (isolated nodes), should be unique.
+            root_diblob_id (str): id of the root diblob.
+            compact_edges (bool): the same as in DigraphManager.
+        """
+        edge_ids = [(tail, head) for tail, head in edge_ids]
+        # number of the edges for every edge_id (in the order of the first occurrence)
+        edge_counts = Counter(edge_ids)
+        node_ids = list(node_ids)
+        unique_node_ids = dict.fromkeys(node_ids)
+
+        if len(unique_node_ids) != len(node_ids):
+            repeated = [
+                node_id for node_id, count in Counter(node_ids).items() if count > 1
+            ]
+            raise CollisionException(f"Node ids should be unique, repeated: {repeated}")
+
+        node_ids = unique_node_ids
+        for tail, head in edge_counts:
+            node_ids[tail] = node_ids[head] = None
+
+        if any(not isinstance(node_id, str) for node_id in node_ids):
+            raise TypeError("Node ids should be of type str!")
+
+        if root_diblob_id in node_ids:
+            raise CollisionException(
+                "Key should be unique over diblobs | nodes | edges"
+            )
+
+        digraph_manager = cls({root_diblob_id: {}}, compact_edges=compact_edges)
+
+        incoming_node_ids = {node_id: [] for node_id in node_ids}
+        outgoing_node_ids = {node_id: [] for node_id in node_ids}
+        edges = {}
+
+        with gc_paused():
+            # adjacency in the order of the edges (the same as for connect_nodes)
+            for tail, head in edge_ids:
+                outgoing_node_ids[tail].append(head)
+                incoming_node_ids[head].append(tail)
+
+            for edge_id, count in edge_counts.items():
+                tail, head = edge_id
+                edges[edge_id] = (
+                    EdgeMultiset(tail, head, count)
+                    if compact_edges
+                    else [Edge(path=[tail, head]) for _ in range(count)]
+                )
+
+            nodes = {
+                node_id: Node(
+                    node_id,
+                    root_diblob_id,
+                    OrderedMultiset(incoming_node_ids[node_id]),
+                    OrderedMultiset(outgoing_node_ids[node_id]),
+                )
+                for node_id in node_ids
+            }
+
+        digraph_manager.nodes = nodes
+        digraph_manager.edges = edges
+        digraph_manager[root_diblob_id].nodes = set(nodes)
+
+        return digraph_manager
+
+    @classmethod
+    def from_adjacency(
+        cls,
+        adjacency: dict | list[tuple[str, list[str]]],
+        root_diblob_id: str = "B0",
+        compact_edges: bool = False,
+    ):
+        """
+        Bulk constructor - creates digraph (only root diblob) from
+        {node_id: [outgoing node_ids]} dict or (node_id, [outgoing node_ids]) pairs
+        (see from_edges), node ids of the pairs should be unique.
+        Outgoing nodes which are not keys of the adjacency are added as well.
+        """
+        if isinstance(adjacency, dict):
+            adjacency = adjacency.items()
+        adjacency = list(adjacency)
+
+        return cls.from_edges(
+            (
+                (tail, head)
+                for tail, outgoing_node_ids in adjacency
+                for head in outgoing_node_ids
+            ),
+            [node_id for node_id, _ in adjacency],
+            root_diblob_id,
+            compact_edges,
+        )
+
     def __setitem__(
         self, key: str | tuple[str, str], value: Diblob | Node | Edge
     ) -> None:
 
-        if key in set(self.diblobs) | set(self.nodes):
+        if key in self.diblobs or key in self.nodes:
             raise CollisionException(
                 "Key should be unique over diblobs | nodes | edges"
             )
 
+        self._export_cache = None
+
         if isinstance(value, Diblob) and isinstance(key, str):
             self.diblobs[key] = value
+            self._hierarchy_index = None
 
         elif isinstance(value, Node) and isinstance(key, str):
             self.nodes[key] = value
@@ -114,7 +238,15 @@ class DigraphManager:
                                   not tuple[{type(key[0])},{type(key[1])}]!"
                 )
 
-            self.edges.setdefault(key, []).append(value)
+            edges = self._get_mutable(key) if key in self.edges else None
+
+            if edges is None:
+                edges = EdgeMultiset(*key) if self.compact_edges else []
+            if isinstance(edges, EdgeMultiset) and not edges.accepts(value):
+                edges = list(edges)
+
+            edges.append(value)
+            self.edges[key] = edges
 
         else:
             raise TypeError(
@@ -123,37 +255,32 @@ class DigraphManager:
             )
 
     def __getitem__(self, key: str | tuple[str, str]):
-        return (self.diblobs | self.nodes | self.edges)[key]
+        if isinstance(key, tuple):
+            return self.edges[key]
 
-    def __contains__(self, key: str | tuple[str, str]):
-        return key in set(self.diblobs | self.nodes | self.edges)
+        if key in self.nodes:
+            return self.nodes[key]
 
-    def __call__(self, diblob_id: str):
-        repr_dict = {diblob_id: {}}
-        nodes = self[diblob_id].nodes
+        return self.diblobs[key]
 
-        for node_id in nodes:
-            node = self[node_id]
+    def _get_mutable(self, key: str | tuple[str, str]):
+        """
+        Returns component which can be modified in place (forked digraph manager
+        copies the shared component first).
+        """
+        if isinstance(key, tuple):
+            return get_writer(self.edges)(key)
 
-            if isinstance(node, Diblob):
-                repr_dict[diblob_id][node_id] = self(node_id)[node_id]
-            else:
-                outgoing_nodes_grouped_by_diblob = list_groupby(
-                    node.outgoing_nodes,
-                    map_dict={
-                        node_id: self[node_id].diblob_id
-                        for node_id in node.outgoing_nodes
-                    },
-                )
+        if key in self.nodes:
+            return get_writer(self.nodes)(key)
 
-                repr_dict[diblob_id][node_id] = outgoing_nodes_grouped_by_diblob.get(
-                    diblob_id, []
-                ) + [
-                    {key: value}
-                    for key, value in outgoing_nodes_grouped_by_diblob.items()
-                    if key != diblob_id
-                ]
-        return repr_dict
+        return get_writer(self.diblobs)(key)
+
+    def __contains__(self, key: str | tuple[str, str]):
+        return key in self.nodes or key in self.diblobs or key in self.edges
+
+    def __call__(self, diblob_id: str):
+        return _copy_export(self._export(diblob_id))
 
     def __repr__(self):
         lines = []
@@ -174,11 +301,105 @@ class DigraphManager:
                     lines.append(f'"{value}",\n')
 
         lines.append("{\n")
-        display(self(self.root_diblob_id), 0)
+        display(self._export(self.root_diblob_id), 0)
         lines.append("}\n")
 
         return "".join(lines)
 
+    def _export(self, diblob_id: str):
+        """
+        Returns cached dict representation of the diblob (should not be modified).
+        Cache is reset by the methods modifying the digraph, components modified
+        directly require self._export_cache = None.
+        """
+        if self._export_cache is None:
+            self._export_cache = {}
+
+        if diblob_id not in self._export_cache:
+            self._export_cache[diblob_id] = self._build_export(diblob_id)
+        return self._export_cache[diblob_id]
+
+    def _build_export(self, diblob_id: str):
+        """
+        Used by _export. Builds dict representation of the diblob in a single
+        pass over its nodes (nested diblobs are visited with explicit stack).
+        """
+        nodes = self.nodes
+        get_node, get_diblob = get_reader(nodes), get_reader(self.diblobs)
+
+        repr_dict = {diblob_id: {}}
+        stack = [(diblob_id, repr_dict[diblob_id])]
+
+        while stack:
+            diblob_id, diblob_dict = stack.pop()
+
+            for node_id in get_diblob(diblob_id).nodes:
+                if node_id not in nodes:
+                    diblob_dict[node_id] = {}
+                    stack.append((node_id, diblob_dict[node_id]))
+                    continue
+
+                inside_node_ids = []
+                outside_node_ids = {}
+
+                for head_id in get_node(node_id).outgoing_nodes:
+                    head_diblob_id = get_node(head_id).diblob_id
+
+                    if head_diblob_id == diblob_id:
+                        inside_node_ids.append(head_id)
+                    else:
+                        outside_node_ids.setdefault(head_diblob_id, []).append(head_id)
+
+                diblob_dict[node_id] = inside_node_ids + [
+                    {key: value} for key, value in outside_node_ids.items()
+                ]
+
+        return repr_dict
+
+    def write_json(self, file, diblob_id: str = None, chunk_size: int = 4096):
+        """
+        Writes dict representation of the diblob (root diblob by default) to the
+        text file - output is the same as json.dump(self(diblob_id), file), but
+        the JSON string of the entire digraph is never built (written in chunks
+        of chunk_size tokens).
+        """
+        if diblob_id is None:
+            diblob_id = self.root_diblob_id
+
+        dumps = json.dumps
+        chunk = ["{"]
+        stack = [iter(self._export(diblob_id).items())]
+        first = True
+
+        while stack:
+            item = next(stack[-1], None)
+
+            if item is None:
+                stack.pop()
+                chunk.append("}")
+                first = False
+                continue
+
+            key, value = item
+            if not first:
+                chunk.append(", ")
+            chunk.append(dumps(key))
+
+            if isinstance(value, dict):
+                chunk.append(": {")
+                stack.append(iter(value.items()))
+                first = True
+            else:
+                chunk.append(": ")
+                chunk.append(dumps(value))
+                first = False
+
+            if len(chunk) >= chunk_size:
+                file.write("".join(chunk))
+                chunk.clear()
+
+        file.write("".join(chunk))
+
     def _construct(
         self,
         diblob_id: str,
@@ -218,75 +439,75 @@ class DigraphManager:
 
             gather_dict[diblob_id].append(key)
 
+    def get_hierarchy_index(self):
+        """
+        Returns index of the diblob tree (DiblobHierarchyIndex).
+        Index is built lazily and rebuilt after the diblob tree is modified
+        (gather, flatten, inject, join_diblobs, compress_diblob).
+        """
+        if self._hierarchy_index is None:
+            self._hierarchy_index = DiblobHierarchyIndex(
+                self.diblobs, self.root_diblob_id
+            )
+        return self._hierarchy_index
+
     def get_diblobs_common_ancestor(self, diblob_id1: str, diblob_id2: str):
         """
         Returns common ancestor diblob_id for diblob_id1 and diblob_id2.
         """
 
-        ancestors_of_diblob_id1 = []
-        ancestors_of_diblob_id2 = []
+        if not diblob_id1 or not diblob_id2:
+            return None
 
-        while diblob_id1:
-            ancestors_of_diblob_id1.append(diblob_id1)
-            diblob_id1 = self[diblob_id1].parent_id
-
-        while diblob_id2:
-            ancestors_of_diblob_id2.append(diblob_id2)
-            diblob_id2 = self[diblob_id2].parent_id
-
-        common_ancestor = None
-
-        for b1, b2 in zip(ancestors_of_diblob_id1[::-1], ancestors_of_diblob_id2[::-1]):
-            if b1 == b2:
-                common_ancestor = b1
-            else:
-                break
-
-        return common_ancestor
+        return self.get_hierarchy_index().get_common_ancestor(diblob_id1, diblob_id2)
 
     def get_diblob_descendants(self, diblob_id: str):
         """
         Returns diblob_ids which are descendants of the diblob.
         """
 
-        descendants = set()
-        diblob_children = self[diblob_id].children
-        descendants |= diblob_children
+        return self.get_hierarchy_index().get_descendants(diblob_id)
 
-        for child_id in diblob_children:
-            descendants |= self.get_diblob_descendants(child_id)
-        return descendants
+    def get_diblob_node_ids(self, diblob_ids: set[str]):
+        """
+        Returns node_ids placed directly in the diblobs with diblob_ids.
+        """
+        return {
+            node_id
+            for diblob_id in diblob_ids
+            for node_id in self.diblobs[diblob_id].nodes
+            if node_id in self.nodes
+        }
 
     def get_diblob_edges(self, diblob_id: str):
         """
         Returns edge_ids, incoming edge_ids, outgoing edge_ids,
         descendants_with_diblob_id of the diblob.
+
+        Edges are found using adjacency of the nodes placed in the diblob,
+        time is proportional to the size of the diblob (not the digraph).
         """
 
         descendants_with_diblob_id = self.get_diblob_descendants(diblob_id)
         descendants_with_diblob_id.add(diblob_id)
+        node_ids = self.get_diblob_node_ids(descendants_with_diblob_id)
 
         inside_edges = set()
         incoming_edges = set()
         outgoing_edges = set()
 
-        for edge_id in self.edges:
-
-            tail_diblob_id = self[edge_id[0]].diblob_id
-            head_diblob_id = self[edge_id[1]].diblob_id
-
-            if (
-                tail_diblob_id in descendants_with_diblob_id
-                and head_diblob_id in descendants_with_diblob_id
-            ):
-
-                inside_edges.add(edge_id)
+        for node_id in node_ids:
+            node = self.nodes[node_id]
 
-            elif tail_diblob_id in descendants_with_diblob_id:
-                outgoing_edges.add(edge_id)
+            for head_id in node.outgoing_nodes.distinct():
+                if head_id in node_ids:
+                    inside_edges.add((node_id, head_id))
+                else:
+                    outgoing_edges.add((node_id, head_id))
 
-            elif head_diblob_id in descendants_with_diblob_id:
-                incoming_edges.add(edge_id)
+            for tail_id in node.incoming_nodes.distinct():
+                if tail_id not in node_ids:
+                    incoming_edges.add((tail_id, node_id))
 
         return inside_edges, incoming_edges, outgoing_edges, descendants_with_diblob_id
 
@@ -302,6 +523,15 @@ class DigraphManager:
         if diblob_id in potential_ancestors:
             return False
 
+        hierarchy_index = self.get_hierarchy_index()
+
+        if len(potential_ancestors) <= hierarchy_index.get_depth(diblob_id):
+            return any(
+                hierarchy_index.is_ancestor(ancestor_id, diblob_id)
+                for ancestor_id in potential_ancestors
+                if ancestor_id in hierarchy_index
+            )
+
         diblob_parent_id = self[diblob_id].parent_id
 
         while diblob_parent_id:
@@ -334,15 +564,15 @@ class DigraphManager:
         for diblob_id in diblob_ids:
             diblob = self[diblob_id]
 
-            parent_diblob = self[self[diblob_id].parent_id]
+            parent_diblob = self._get_mutable(diblob.parent_id)
 
             for node_id in diblob.nodes:
-                node = self[node_id]
+                node = self._get_mutable(node_id)
 
                 if isinstance(node, Node):
-                    self[node_id].diblob_id = parent_diblob.diblob_id
+                    node.diblob_id = parent_diblob.diblob_id
                 else:
-                    self[node_id].parent_id = parent_diblob.diblob_id
+                    node.parent_id = parent_diblob.diblob_id
 
             parent_diblob.children |= diblob.children
             parent_diblob.children.remove(diblob_id)
@@ -352,6 +582,9 @@ class DigraphManager:
 
             self.diblobs.pop(diblob_id)
 
+        self._hierarchy_index = None
+        self._export_cache = None
+
     def gather(self, new_diblob_id: str, node_ids: set[str]):
         """
         Creates new diblob based on delivered node_ids.
@@ -368,8 +601,8 @@ class DigraphManager:
             )
 
         node = self[list(node_ids)[0]]
-        parent_diblob = (
-            self[node.parent_id] if isinstance(node, Diblob) else self[node.diblob_id]
+        parent_diblob = self._get_mutable(
+            node.parent_id if isinstance(node, Diblob) else node.diblob_id
         )
 
         if node_ids - parent_diblob.nodes:
@@ -382,7 +615,7 @@ class DigraphManager:
         parent_id = parent_diblob.diblob_id
 
         for node_id in node_ids:
-            node = self[node_id]
+            node = self._get_mutable(node_id)
 
             if isinstance(node, Node):
                 node.diblob_id = new_diblob_id
@@ -397,6 +630,9 @@ class DigraphManager:
         parent_diblob.nodes.add(new_diblob_id)
         parent_diblob.children.add(new_diblob_id)
         parent_diblob.nodes -= node_ids
+        parent_diblob.children -= diblob_children
+        self._hierarchy_index = None
+        self._export_cache = None
 
     def compress_diblob(self, diblob_id: str):
         """
@@ -430,7 +666,9 @@ class DigraphManager:
         self.remove_nodes(*nodes_to_remove)
 
         self.diblobs.pop(diblob_id)
-        self.diblobs[diblob.parent_id].children.remove(diblob_id)
+        self._get_mutable(diblob.parent_id).children.remove(diblob_id)
+        self._hierarchy_index = None
+        self._export_cache = None
         self[diblob_id] = Node(diblob_id, diblob.parent_id, [], [])
 
         self.connect_nodes(*incoming_edges)
@@ -465,8 +703,8 @@ class DigraphManager:
 
             self.remove_nodes(self[node_id])
 
-            self[tail].outgoing_nodes.append(head)
-            self[head].incoming_nodes.append(tail)
+            self._get_mutable(tail).outgoing_nodes.append(head)
+            self._get_mutable(head).incoming_nodes.append(tail)
 
             self[(tail, head)] = Edge(path)
 
@@ -483,13 +721,14 @@ class DigraphManager:
         """
         Removes edges from the graph.
         """
+        self._export_cache = None
 
         for edge in edges:
             tail, head = edge.path[0], edge.path[-1]
 
-            self[tail].outgoing_nodes.remove(head)
-            self[head].incoming_nodes.remove(tail)
-            self.edges[(tail, head)].remove(edge)
+            self._get_mutable(tail).outgoing_nodes.remove(head)
+            self._get_mutable(head).incoming_nodes.remove(tail)
+            self._get_mutable((tail, head)).remove(edge)
 
             if not self.edges[(tail, head)]:
                 self.edges.pop((tail, head))
@@ -501,8 +740,8 @@ class DigraphManager:
 
         for edge_id in edge_ids:
             tail, head = edge_id[0], edge_id[1]
-            self[tail].outgoing_nodes.append(head)
-            self[head].incoming_nodes.append(tail)
+            self._get_mutable(tail).outgoing_nodes.append(head)
+            self._get_mutable(head).incoming_nodes.append(tail)
             self[(tail, head)] = Edge(path=[tail, head])
 
 
@@ -524,23 +763,27 @@ class DigraphManager:
         """
         Removes nodes from the graph.
         """
+        self._export_cache = None
 
         for node in nodes:
             node_id = node.node_id
+            # the node modified by remove_edges (fork copies the node on modification)
+            node = self._get_mutable(node_id)
 
-            for incoming_node in set(node.incoming_nodes):
+            for incoming_node in list(node.incoming_nodes.distinct()):
                 self.remove_edges(*self[(incoming_node, node_id)])
 
-            for outgoing_node in set(node.outgoing_nodes):
+            for outgoing_node in list(node.outgoing_nodes.distinct()):
                 self.remove_edges(*self[(node_id, outgoing_node)])
 
-            self[node.diblob_id].nodes.remove(node_id)
+            self._get_mutable(node.diblob_id).nodes.remove(node_id)
             self.nodes.pop(node_id)
 
     def add_nodes(self, *node_ids: tuple[str], diblob_id: str = None):
         """
         Adds nodes to the graph structure.
         """
+        self._export_cache = None
 
         if not diblob_id:
             diblob_id = self.root_diblob_id
@@ -548,7 +791,7 @@ class DigraphManager:
         for node_id in node_ids:
             self[node_id] = Node(node_id, diblob_id, [], [])
 
-        self[diblob_id].nodes |= set(node_ids)
+        self._get_mutable(diblob_id).nodes |= set(node_ids)
 
     def compress_edges(self):
         """
@@ -608,9 +851,11 @@ class DigraphManager:
         self.nodes |= digraph_manager.nodes
         self.edges |= digraph_manager.edges
 
-        self[injected_diblob_root_id].parent_id = node.diblob_id
-        self[node.diblob_id]._add_children(injected_diblob_root_id)
-        self[node.diblob_id]._add_nodes(injected_diblob_root_id)
+        self._get_mutable(injected_diblob_root_id).parent_id = node.diblob_id
+        self._get_mutable(node.diblob_id)._add_children(injected_diblob_root_id)
+        self._get_mutable(node.diblob_id)._add_nodes(injected_diblob_root_id)
+        self._hierarchy_index = None
+        self._export_cache = None
 
         for injected_node_id in digraph_manager[injected_diblob_root_id].nodes:
 
@@ -683,14 +928,76 @@ class DigraphManager:
             self.remove_edges(edge)
             self.connect_nodes((head, tail))
 
+    def freeze(self):
+        """
+        Returns immutable CSR snapshot (CompactDigraph) of the digraph.
+        """
+        return CompactDigraph(self)
+
+    def fork(self):
+        """
+        Returns copy-on-write copy of the digraph manager. Dict attributes
+        (nodes, edges, diblobs, ...) are wrapped in CopyOnWriteDict, so components
+        are shared with the original manager and copied only when the fork
+        modifies them - forking is O(1) and the fork grows with the number of
+        modified components (instead of deepcopy of the entire digraph).
+
+        Note: original digraph manager should not be modified while the fork is used.
+        """
+        digraph_manager = copy(self)
+
+        for name, value in vars(self).items():
+            if isinstance(value, (dict, CopyOnWriteDict)):
+                # Edge objects are removed by identity - only edge lists are copied
+                copy_value = copy if name == "edges" else deepcopy
+                setattr(digraph_manager, name, CopyOnWriteDict(value, copy_value))
+
+        digraph_manager._export_cache = None
+        return digraph_manager
+
     def sorted(self):
         """
         Sort components of the graph structure.
         """
-        self.edges = dict(sorted(self.edges.items()))
-        self.nodes = dict(sorted(self.nodes.items()))
-        self.diblobs = dict(sorted(self.diblobs.items()))
+        self._export_cache = None
+        get_edges = get_writer(self.edges)
+        get_node = get_writer(self.nodes)
+        get_diblob = get_writer(self.diblobs)
+        self.edges = {edge_id: get_edges(edge_id) for edge_id in sorted(self.edges)}
+        self.nodes = {node_id: get_node(node_id) for node_id in sorted(self.nodes)}
+        self.diblobs = {
+            diblob_id: get_diblob(diblob_id) for diblob_id in sorted(self.diblobs)
+        }
 
         for node in self.nodes.values():
             node.outgoing_nodes = sorted(node.outgoing_nodes)
             node.incoming_nodes = sorted(node.incoming_nodes)
+
+
+def _copy_export(repr_dict: dict):
+    """
+    Copies dict representation of the diblob (lists and dicts are new objects).
+    """
+    result = {}
+    stack = [(repr_dict, result)]
+
+    while stack:
+        source, target = stack.pop()
+
+        for key, value in source.items():
+            if isinstance(value, dict):
+                target[key] = {}
+                stack.append((value, target[key]))
+            elif value and isinstance(value[-1], dict):
+                target[key] = [
+                    (
+                        {diblob_id: list(ids) for diblob_id, ids in head.items()}
+                        if isinstance(head, dict)
+                        else head
+                    )
+                    for head in value
+                ]
+            else:
+                target[key] = value.copy()
+
+    return result
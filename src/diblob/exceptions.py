@@ -123,7 +123,14 @@ class CycleException(Exception):
     Raised when cycle found in the DAG-focused algorithm.
     """
 
+
 class InvalidNodeIdException(Exception):
     """
     Raised when node_id is incorrect.
     """
+
+
+class NegativeCycleException(Exception):
+    """
+    Raised when shortest paths are requested for digraph with negative cost cycle.
+    """
@@ -7,15 +7,48 @@ from diblob.exceptions import MultipleEdgeException, CycleException, InvalidNode
 
 
 def add_outgoing(digraph_manager, node_id, outgoing_list):
-    outgoing_nodes = digraph_manager[node_id].outgoing_nodes
-    if len(outgoing_nodes) == 0:
-        return []
-
-    outgoing_list += [
-        node_id for node_id in outgoing_nodes if node_id not in outgoing_list
-    ]
-    for outgoing_node_id in outgoing_nodes:
-        add_outgoing(digraph_manager, outgoing_node_id, outgoing_list)
+    """
+    Extends outgoing_list with nodes reachable from node_id (in DFS preorder
+    of the outgoing nodes). Raises CycleException if the cycle is reachable.
+    """
+    listed = set(outgoing_list)
+    processed = set()
+    on_path = {node_id}
+    call_stack = [(node_id, iter(digraph_manager[node_id].outgoing_nodes))]
+
+    def extend(node_id):
+        new_node_ids = [
+            outgoing_node_id
+            for outgoing_node_id in digraph_manager[node_id].outgoing_nodes
+            if outgoing_node_id not in listed
+        ]
+        outgoing_list.extend(new_node_ids)
+        listed.update(new_node_ids)
+
+    extend(node_id)
+
+    while call_stack:
+        node_id, outgoing_node_ids = call_stack[-1]
+
+        for outgoing_node_id in outgoing_node_ids:
+            if outgoing_node_id in on_path:
+                raise CycleException("This factory can be applied only for DAG!")
+
+            # nodes reachable from processed node are already listed
+            if outgoing_node_id not in processed:
+                extend(outgoing_node_id)
+                on_path.add(outgoing_node_id)
+                call_stack.append(
+                    (
+                        outgoing_node_id,
+                        iter(digraph_manager[outgoing_node_id].outgoing_nodes),
+                    )
+                )
+                break
+        else:
+            call_stack.pop()
+            on_path.remove(node_id)
+            processed.add(node_id)
 
 
 class DiblobFactory:
@@ -148,14 +181,10 @@ class DiblobFactory:
             )
 
         bipartite_digraph_dict = {}
-        try:
-            for node_id in digraph_manager.nodes:
-                node_list = []
-                add_outgoing(digraph_manager, node_id, node_list)
-                bipartite_digraph_dict[node_id] = node_list
-
-        except RecursionError as exc:
-            raise CycleException("This factory can be applied only for DAG!") from exc
+        for node_id in digraph_manager.nodes:
+            node_list = []
+            add_outgoing(digraph_manager, node_id, node_list)
+            bipartite_digraph_dict[node_id] = node_list
 
         return DigraphManager({digraph_manager.root_diblob_id: bipartite_digraph_dict})
 
@@ -8,6 +8,7 @@ import random
 import itertools
 
 from diblob.digraph_manager import DigraphManager
+from diblob.tools import get_rng
 from diblob.exceptions import (
     InvalidAdditionException,
     RandomCycleException,
@@ -18,7 +19,8 @@ from diblob.exceptions import (
 
 SEED = 0
 RANDOM_DIBLOB_ID = "RAND"
-random.seed(SEED)
+# generator used when rng is not delivered (independent of the global random)
+DEFAULT_RNG = random.Random(SEED)
 
 
 class RandomBase:
@@ -26,6 +28,9 @@ class RandomBase:
     Random graph base.
     - Enables digraphs addition based on magic method __add__.
     - Enables digraphs injection based on magic method __ior__.
+
+    Generators accept rng - random.Random instance or seed (int),
+    DEFAULT_RNG is used if rng is not delivered.
     """
 
     def __init__(self, digraph: "RandomBase" | DigraphManager) -> None:
@@ -52,8 +57,8 @@ class RandomBase:
         digraph_manager = DigraphManager(
             {
                 root_id: {
-                    key: list(set(dict_x.get(key, []) + dict_y.get(key, [])))
-                    for key in set(dict_x) | set(dict_y)
+                    key: list(dict.fromkeys(dict_x.get(key, []) + dict_y.get(key, [])))
+                    for key in dict.fromkeys([*dict_x, *dict_y])
                 }
             }
         )
@@ -92,12 +97,14 @@ class RandomCycle(RandomBase):
         node_space: list[str],
         cycle_size: int,
         random_diblob_id: str = RANDOM_DIBLOB_ID,
+        rng: random.Random | int | None = None,
     ):
 
         if len(node_space) < cycle_size:
             raise RandomCycleException("node_space must to be greater than cycle_size!")
 
-        tail_node_id = random.choice(node_space)
+        rng = get_rng(rng, DEFAULT_RNG)
+        tail_node_id = rng.choice(node_space)
         start_node_id = tail_node_id
 
         cycle_dict = {}
@@ -106,13 +113,13 @@ class RandomCycle(RandomBase):
         for _ in range(cycle_size - 1):
 
             node_space.remove(tail_node_id)
-            head_node_id = random.choice(node_space)
+            head_node_id = rng.choice(node_space)
             cycle_dict[tail_node_id] = [head_node_id]
             tail_node_id = head_node_id
 
         cycle_dict[tail_node_id] = [start_node_id]
         cycle_dict.update(
-            {key: [] for key in (set(node_space) - set(cycle_dict.keys()))}
+            {key: [] for key in node_space if key not in cycle_dict}
         )
         super().__init__(DigraphManager({random_diblob_id: cycle_dict}))
 
@@ -128,6 +135,7 @@ class RandomSCC(RandomBase):
         node_space: list[str],
         cycle_sizes: list[int],
         random_diblob_id: str = RANDOM_DIBLOB_ID,
+        rng: random.Random | int | None = None,
     ):
 
         if any(len(node_space) < c_size for c_size in cycle_sizes):
@@ -136,10 +144,11 @@ class RandomSCC(RandomBase):
         if not cycle_sizes:
             raise RandomCycleException("cycle_sizes cannot be empty!")
 
-        random_cycle = RandomCycle(node_space, len(node_space), random_diblob_id)
+        rng = get_rng(rng, DEFAULT_RNG)
+        random_cycle = RandomCycle(node_space, len(node_space), random_diblob_id, rng)
         for c_size in cycle_sizes[1:]:
             random_cycle = random_cycle + RandomCycle(
-                node_space, c_size, random_diblob_id
+                node_space, c_size, random_diblob_id, rng
             )
 
         super().__init__(random_cycle)
@@ -155,8 +164,10 @@ class RandomDAG(RandomBase):
         node_space: list[str],
         number_of_edges: int,
         random_diblob_id: str = RANDOM_DIBLOB_ID,
+        rng: random.Random | int | None = None,
     ):
 
+        rng = get_rng(rng, DEFAULT_RNG)
         node_space_size = len(node_space)
         max_number_of_edges_in_dag = node_space_size * (node_space_size - 1) // 2
 
@@ -170,7 +181,7 @@ class RandomDAG(RandomBase):
         digraph_manager.add_nodes(*node_space)
 
         node_space_order = list(node_space)
-        random.shuffle(node_space_order)
+        rng.shuffle(node_space_order)
 
         node_indexes = [
             (tail_idx, head_idx)
@@ -179,7 +190,7 @@ class RandomDAG(RandomBase):
             if tail_idx < head_idx
         ]
 
-        node_indexes = random.sample(node_indexes, k=number_of_edges)
+        node_indexes = rng.sample(node_indexes, k=number_of_edges)
 
         digraph_manager.connect_nodes(
             *[
@@ -203,8 +214,10 @@ class SemiRandomDigraph(RandomBase):
         dag_digraph: SemiRandomDigraph,
         inj_digraphs: list[RandomBase],
         injection_drop_probability: float = 0.2,
+        rng: random.Random | int | None = None,
     ):
 
+        rng = get_rng(rng, DEFAULT_RNG)
         dag = dag_digraph.digraph_manager
         if len(dag.diblobs) > 1:
             raise RootDiblobException(
@@ -220,16 +233,18 @@ class SemiRandomDigraph(RandomBase):
                                                      number of delivered digraphs!"
             )
 
-        node_ids = random.sample(node_ids, len(inj_digraphs))
+        node_ids = rng.sample(node_ids, len(inj_digraphs))
 
         for node_id, inj_digraph in zip(node_ids, inj_digraphs):
 
             dag_node = dag_digraph.digraph_manager[node_id]
             node_space = inj_digraph.digraph_manager.nodes
 
-            edges_to_drop = list(
-                itertools.product(dag_node.incoming_nodes, node_space)
-            ) + list(itertools.product(node_space, dag_node.outgoing_nodes))
+            # sorted - order of the neighbours after injection depends on sets order
+            edges_to_drop = sorted(
+                list(itertools.product(dag_node.incoming_nodes, node_space))
+                + list(itertools.product(node_space, dag_node.outgoing_nodes))
+            )
 
             dag_digraph.digraph_manager.inject(inj_digraph.digraph_manager, node_id)
             dag_digraph.digraph_manager.flatten(
@@ -240,7 +255,7 @@ class SemiRandomDigraph(RandomBase):
                 *[
                     dag_digraph.digraph_manager[drop_id][0]
                     for drop_id in edges_to_drop
-                    if random.random() < injection_drop_probability
+                    if rng.random() < injection_drop_probability
                 ]
             )
 
@@ -252,7 +267,12 @@ class RandomDigraph(RandomBase):
     Random digraph.
     """
 
-    def __init__(self, number_of_nodes, number_of_edges):
+    def __init__(
+        self,
+        number_of_nodes,
+        number_of_edges,
+        rng: random.Random | int | None = None,
+    ):
         if number_of_edges > number_of_nodes * (number_of_nodes - 1):
             raise InvalidGeneratorParameterException(
                 "Cannot create digraphs\
@@ -264,7 +284,7 @@ class RandomDigraph(RandomBase):
         elements = [str(number_of_node) for number_of_node in range(number_of_nodes)]
         digraph.add_nodes(*elements)
 
-        edges = random.sample(
+        edges = get_rng(rng, DEFAULT_RNG).sample(
             [(x, y) for x in elements for y in elements if x != y], number_of_edges
         )
 
@@ -278,7 +298,13 @@ class CycleBasedDigraph(RandomBase):
     Random digraph.
     """
 
-    def __init__(self, number_of_nodes, number_of_edges):
+    def __init__(
+        self,
+        number_of_nodes,
+        number_of_edges,
+        rng: random.Random | int | None = None,
+    ):
+        rng = get_rng(rng, DEFAULT_RNG)
         nodes_to_add_number = number_of_edges - number_of_nodes
 
         if nodes_to_add_number < 0:
@@ -290,6 +316,7 @@ class CycleBasedDigraph(RandomBase):
         digraph = RandomCycle(
             node_space=[str(nr) for nr in range(1, number_of_nodes - 1)],
             cycle_size=number_of_nodes - 2,
+            rng=rng,
         )
 
         edges_to_add_number = number_of_edges - number_of_nodes
@@ -304,7 +331,7 @@ class CycleBasedDigraph(RandomBase):
             and (str(tail_idx), str(head_idx)) not in digraph.edges
         ]
 
-        node_indexes = random.sample(node_indexes, k=edges_to_add_number - 2)
+        node_indexes = rng.sample(node_indexes, k=edges_to_add_number - 2)
 
         digraph.connect_nodes(*node_indexes)
         digraph.add_nodes("0", f"{number_of_nodes - 1}")
@@ -320,22 +347,30 @@ class RandomSESEPathBased(RandomBase):
     def make_pairs(lst):
         return [(lst[i], lst[i+1]) for i in range(len(lst)-1)]
 
-    def __init__(self, number_of_nodes: int, max_path_len: int, min_path_len: int, number_of_paths: int):
-        node_space = {str(i) for i in range(1, number_of_nodes + 1)}
-        edges = set()
-        nodes = set()
+    def __init__(
+        self,
+        number_of_nodes: int,
+        max_path_len: int,
+        min_path_len: int,
+        number_of_paths: int,
+        rng: random.Random | int | None = None,
+    ):
+        rng = get_rng(rng, DEFAULT_RNG)
+        node_space = [str(i) for i in range(1, number_of_nodes + 1)]
+        # dicts are used as ordered sets (the same digraph for the same rng)
+        edges = {}
+        nodes = {}
         for _ in range(number_of_paths):
-            path_length = random.randint(min_path_len, max_path_len)
+            path_length = rng.randint(min_path_len, max_path_len)
             path = ["S"]
             for _ in range(path_length):
-                path.append(random.choice(list(node_space)))
-                
+                path.append(rng.choice(node_space))
+
             path.append("T")
-            edges |= set(self.make_pairs(path))
-            nodes |= set(path)
+            edges.update(dict.fromkeys(self.make_pairs(path)))
+            nodes.update(dict.fromkeys(path))
 
         digraph = DigraphManager({"B0": {}})
         digraph.add_nodes(*nodes)
         digraph.connect_nodes(*edges)
         super().__init__(digraph)
-        
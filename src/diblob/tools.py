@@ -2,7 +2,11 @@
 Tools used in diblob.
 """
 
+import gc
 import json
+import random
+import threading
+from contextlib import contextmanager
 
 
 def display_digraph(d: dict, indent: int = 0):
@@ -111,3 +115,48 @@ def list_groupby(lst: list, map_dict: dict):
     for elem in lst:
         result_dict.setdefault(map_dict[elem], []).append(elem)
     return result_dict
+
+
+def get_rng(rng: random.Random | int | None = None, default=random):
+    """
+    Returns random number generator used by randomized algorithms and generators.
+
+    Args:
+        rng: random.Random instance (returned as it is), seed of the new
+             random.Random instance or None (default is returned).
+        default: generator used when rng is None (global random module by default).
+    """
+    if rng is None:
+        return default
+
+    if isinstance(rng, random.Random):
+        return rng
+
+    return random.Random(rng)
+
+
+# number of the active gc_paused blocks (all threads) and GC state before the first
+_GC_PAUSE_LOCK = threading.Lock()
+_GC_PAUSE = {"depth": 0, "enabled": False}
+
+
+@contextmanager
+def gc_paused():
+    """
+    Disables cyclic garbage collector inside the block. Used by bulk construction
+    (DigraphManager.from_edges) - GC passes would dominate the time of creating
+    millions of objects. Blocks can be nested or run in many threads, previous
+    GC state is restored when the last block exits.
+    """
+    with _GC_PAUSE_LOCK:
+        if not _GC_PAUSE["depth"]:
+            _GC_PAUSE["enabled"] = gc.isenabled()
+            gc.disable()
+        _GC_PAUSE["depth"] += 1
+    try:
+        yield
+    finally:
+        with _GC_PAUSE_LOCK:
+            _GC_PAUSE["depth"] -= 1
+            if not _GC_PAUSE["depth"] and _GC_PAUSE["enabled"]:
+                gc.enable()
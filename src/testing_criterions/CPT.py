@@ -2,8 +2,12 @@
 Module created for CPT.
 """
 
+import heapq
+from contextlib import contextmanager
+from functools import wraps
 from itertools import product
 from diblob import DigraphManager
+from diblob.algorithms import CompactTarjanSCC
 from decimal import Decimal
 
 
@@ -13,9 +17,276 @@ class NotSCGException(Exception):
     """
 
 
+class InvalidShortestPathsBackendException(Exception):
+    """
+    Raised when unknown shortest paths backend is delivered.
+    """
+
+
+class InvalidCPTSolverException(Exception):
+    """
+    Raised when unknown CPT solver is delivered.
+    """
+
+
+class InvalidNumericModeException(Exception):
+    """
+    Raised when unknown numeric mode is delivered or costs do not fit the mode.
+    """
+
+
+CPT_SOLVERS = ("min_cost_flow", "cycle_canceling")
+
+NUMERIC_TYPES = {
+    "int": int,
+    "float": float,
+    "decimal": lambda value: Decimal(str(value)),
+}
+NUMERIC_MODES = ("auto",) + tuple(NUMERIC_TYPES)
+
+# relative precision used for negative cycles detection with float costs
+FLOAT_TOLERANCE = 1e-9
+
+
+def _is_integral(value):
+    return isinstance(value, int) or value == int(value)
+
+
+def _set_negative_cycle(weighted_digraph_manager, cycle: list, edge_costs: dict):
+    """
+    Stores negative cycle [c_0, ..., c_k] in the form expected by the CPT
+    improvements - cost[(c_0, c_0)] < 0 and spanning_tree[(c_i, c_0)] = c_(i+1).
+    """
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+    head_id = cycle[0]
+
+    for tail_id, next_id in zip(cycle, cycle[1:] + cycle[:1]):
+        spanning_tree[(tail_id, head_id)] = next_id
+
+    cost[(head_id, head_id)] = sum(
+        edge_costs[(tail_id, next_id)]
+        for tail_id, next_id in zip(cycle, cycle[1:] + cycle[:1])
+    )
+
+
+def floyd_warshall(weighted_digraph_manager):
+    """
+    Floyd-Warshall algorithm (dense digraphs, O(V^3)).
+    """
+    nodes = weighted_digraph_manager.nodes
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+
+    for node_k, node_i in product(nodes, nodes):
+        if (node_i, node_k) in cost:
+            for node_j in nodes:
+
+                if (node_k, node_j) in cost and (
+                    (node_i, node_j) not in cost
+                    or cost[(node_i, node_j)]
+                    > cost[(node_i, node_k)] + cost[(node_k, node_j)]
+                ):
+
+                    spanning_tree[(node_i, node_j)] = spanning_tree[(node_i, node_k)]
+                    cost[(node_i, node_j)] = cost.get((node_i, node_k), 0) + cost.get(
+                        (node_k, node_j), 0
+                    )
+
+                    if (
+                        node_i == node_j
+                        and cost[(node_i, node_j)] < -weighted_digraph_manager.tolerance
+                    ):
+                        return
+
+
+def johnson(weighted_digraph_manager):
+    """
+    Johnson's algorithm (sparse digraphs, O(V * E * log(V))).
+    Bellman-Ford potentials are computed only if negative costs exist,
+    negative cycle found by Bellman-Ford stops the computation.
+    """
+    nodes = weighted_digraph_manager.nodes
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+    tolerance = weighted_digraph_manager.tolerance
+
+    edge_costs = {edge_id: cost[edge_id] for edge_id in weighted_digraph_manager.edges}
+    adjacency = {
+        node_id: list(dict.fromkeys(node.outgoing_nodes))
+        for node_id, node in nodes.items()
+    }
+    potentials = dict.fromkeys(nodes, 0)
+
+    if any(edge_cost < 0 for edge_cost in edge_costs.values()):
+        predecessors = {}
+
+        for _ in range(len(nodes) + 1):
+            updated_node_id = None
+
+            for tail_id, outgoing_nodes in adjacency.items():
+                for head_id in outgoing_nodes:
+                    new_potential = potentials[tail_id] + edge_costs[(tail_id, head_id)]
+
+                    if new_potential < potentials[head_id] - tolerance:
+                        potentials[head_id] = new_potential
+                        predecessors[head_id] = tail_id
+                        updated_node_id = head_id
+
+            if updated_node_id is None:
+                break
+        else:
+            for _ in range(len(nodes)):
+                updated_node_id = predecessors[updated_node_id]
+
+            cycle = [updated_node_id]
+            while predecessors[cycle[-1]] != updated_node_id:
+                cycle.append(predecessors[cycle[-1]])
+
+            _set_negative_cycle(weighted_digraph_manager, cycle[::-1], edge_costs)
+            return
+
+    for source_id in nodes:
+        distances = {source_id: 0}
+        first_hops = {}
+        cycle_distance, cycle_first_hop = None, None
+        processed = set()
+        heap = [(0, source_id)]
+
+        while heap:
+            distance, node_id = heapq.heappop(heap)
+            if node_id in processed:
+                continue
+            processed.add(node_id)
+
+            for head_id in adjacency[node_id]:
+                new_distance = (
+                    distance
+                    + edge_costs[(node_id, head_id)]
+                    + potentials[node_id]
+                    - potentials[head_id]
+                )
+                first_hop = head_id if node_id == source_id else first_hops[node_id]
+
+                if head_id == source_id:
+                    if cycle_distance is None or new_distance < cycle_distance:
+                        cycle_distance, cycle_first_hop = new_distance, first_hop
+
+                elif head_id not in distances or new_distance < distances[head_id]:
+                    distances[head_id] = new_distance
+                    first_hops[head_id] = first_hop
+                    heapq.heappush(heap, (new_distance, head_id))
+
+        for head_id, first_hop in first_hops.items():
+            cost[(source_id, head_id)] = (
+                distances[head_id] - potentials[source_id] + potentials[head_id]
+            )
+            spanning_tree[(source_id, head_id)] = first_hop
+
+        if cycle_distance is not None:
+            cost[(source_id, source_id)] = cycle_distance
+            spanning_tree[(source_id, source_id)] = cycle_first_hop
+
+
+def numpy_floyd_warshall(weighted_digraph_manager):
+    """
+    Floyd-Warshall algorithm vectorized with NumPy (dense digraphs).
+    Requires numpy (optional dependency).
+    """
+    try:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "numpy shortest paths backend requires numpy package!"
+        ) from exc
+
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+    node_ids = list(weighted_digraph_manager.nodes)
+    node_index = {node_id: idx for idx, node_id in enumerate(node_ids)}
+    number_of_nodes = len(node_ids)
+
+    edge_costs = {edge_id: cost[edge_id] for edge_id in weighted_digraph_manager.edges}
+    is_decimal = any(isinstance(value, Decimal) for value in edge_costs.values())
+
+    distances = np.full(
+        (number_of_nodes, number_of_nodes),
+        Decimal("Infinity") if is_decimal else np.inf,
+        dtype=object if is_decimal else float,
+    )
+    hops = np.full((number_of_nodes, number_of_nodes), -1, dtype=np.int64)
+
+    for (tail_id, head_id), edge_cost in edge_costs.items():
+        distances[node_index[tail_id], node_index[head_id]] = edge_cost
+        hops[node_index[tail_id], node_index[head_id]] = node_index[head_id]
+
+    for k in range(number_of_nodes):
+        candidates = distances[:, k, None] + distances[None, k, :]
+        improved = candidates < distances
+        distances = np.where(improved, candidates, distances)
+        hops = np.where(improved, hops[:, k, None], hops)
+
+        negative = np.flatnonzero(
+            np.diagonal(distances) < -weighted_digraph_manager.tolerance
+        )
+        if negative.size:
+            # hops towards head_idx lead to the negative cycle after len(nodes) steps
+            head_idx = node_idx = int(negative[0])
+            for _ in range(number_of_nodes):
+                node_idx = int(hops[node_idx, head_idx])
+
+            cycle = [node_idx]
+            while int(hops[cycle[-1], head_idx]) != node_idx:
+                cycle.append(int(hops[cycle[-1], head_idx]))
+
+            _set_negative_cycle(
+                weighted_digraph_manager, [node_ids[idx] for idx in cycle], edge_costs
+            )
+            return
+
+    for tail_idx, head_idx in zip(*np.nonzero(hops >= 0)):
+        edge_id = (node_ids[tail_idx], node_ids[head_idx])
+        value = distances[tail_idx, head_idx]
+        cost[edge_id] = value if is_decimal else value.item()
+        spanning_tree[edge_id] = node_ids[hops[tail_idx, head_idx]]
+
+
+def _refreshed(method):
+    """
+    Runs DigraphManager method (which changes the structure in the way not tracked
+    incrementally, e.g. removes edges) in batch - cost related structures
+    are recomputed once after the method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.batch():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+SHORTEST_PATHS_BACKENDS = {
+    "floyd_warshall": floyd_warshall,
+    "johnson": johnson,
+    "numpy": numpy_floyd_warshall,
+}
+
+
 class WeightedDigraphManager(DigraphManager):
     """
     Weighted Digraph Manager - digraph manager with cost function for edges.
+
+    Args:
+        shortest_paths_backend (str): algorithm used by least_cost_paths, one of
+            SHORTEST_PATHS_BACKENDS keys:
+                - johnson (default) - sparse digraphs, negative costs allowed.
+                - floyd_warshall - pure Python Floyd-Warshall.
+                - numpy - Floyd-Warshall vectorized with numpy (dense digraphs).
+        numeric_mode (str): type of the costs, one of NUMERIC_MODES:
+                - auto (default) - int if all costs are integral, float otherwise.
+                - int, float - costs converted to the given type.
+                - decimal - exact (and slow) Decimal arithmetic.
     """
 
     def __init__(
@@ -23,37 +294,167 @@ class WeightedDigraphManager(DigraphManager):
         digraph_dict_representation: dict,
         cost_function: dict,
         default_cost: int = 1,
+        shortest_paths_backend: str = "johnson",
+        numeric_mode: str = "auto",
     ):
 
+        if shortest_paths_backend not in SHORTEST_PATHS_BACKENDS:
+            raise InvalidShortestPathsBackendException(
+                f"Unknown shortest paths backend: {shortest_paths_backend},\
+                  available: {list(SHORTEST_PATHS_BACKENDS)}"
+            )
+
+        if numeric_mode not in NUMERIC_MODES:
+            raise InvalidNumericModeException(
+                f"Unknown numeric mode: {numeric_mode}, available: {NUMERIC_MODES}"
+            )
+
         self.cost_function = cost_function
         self.default_cost = default_cost
+        self.shortest_paths_backend = shortest_paths_backend
+        self.numeric_mode = numeric_mode
+        self._paths_computed = False
+        self._batch_depth = 0
+
+        with self.batch():
+            super().__init__(digraph_dict_representation)
 
-        super().__init__(digraph_dict_representation)
+    @contextmanager
+    def batch(self):
+        """
+        Defers the updates of the costs (and related structures) made by
+        connect_nodes and update_cost_function to the end of the block,
+        where they are recomputed once.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+        if not self._batch_depth:
+            self._refresh()
 
+    def _refresh(self):
+        """
+        Recomputes cost related structures for all edges.
+        """
+        self._paths_computed = False
         self._set_cost()
         self._set_spanning_tree()
 
+    def _requires_refresh(self, edge_ids):
+        """
+        Incremental update is not possible when the least cost paths were computed
+        (they are no longer valid) or the costs of edge_ids change cost_type.
+        """
+        return self._paths_computed or (
+            self.cost_type == "int"
+            and not all(
+                _is_integral(self.cost_function.get(edge_id, self.default_cost))
+                for edge_id in edge_ids
+            )
+        )
+
+    def _set_cost_type(self, costs):
+        """
+        Sets type of the costs (cost_type) and tolerance of negative cycles
+        detection based on numeric_mode.
+        """
+        if self.numeric_mode == "auto":
+            self.cost_type = "int" if all(map(_is_integral, costs)) else "float"
+
+        elif self.numeric_mode == "int" and not all(map(_is_integral, costs)):
+            raise InvalidNumericModeException(
+                "All costs should be integral in the int numeric mode!"
+            )
+        else:
+            self.cost_type = self.numeric_mode
+
+        self.tolerance = 0
+        if self.cost_type == "float":
+            self.tolerance = FLOAT_TOLERANCE * max(map(abs, costs), default=1)
+
+    def _to_cost(self, value):
+        return NUMERIC_TYPES[self.cost_type](value)
+
     def _set_cost(self):
-        self.cost = {
-            edge_id: Decimal(str(self.cost_function.get(edge_id, self.default_cost)))
+        costs = {
+            edge_id: self.cost_function.get(edge_id, self.default_cost)
             for edge_id in self.edges
         }
+        self._set_cost_type(costs.values())
+
+        to_cost = NUMERIC_TYPES[self.cost_type]
+        self.cost = {edge_id: to_cost(value) for edge_id, value in costs.items()}
 
     def _set_spanning_tree(self):
         self.spanning_tree = {edge_id: edge_id[1] for edge_id in self.edges}
 
+    def _update_costs(self, edge_ids):
+        """
+        Sets costs of edge_ids based on cost_function.
+        """
+        for edge_id in edge_ids:
+            self.cost[edge_id] = self._to_cost(
+                self.cost_function.get(edge_id, self.default_cost)
+            )
+
+        if self.cost_type == "float":
+            self.tolerance = max(
+                self.tolerance,
+                FLOAT_TOLERANCE
+                * max((abs(self.cost[edge_id]) for edge_id in edge_ids), default=0),
+            )
+
+    def _add_edges(self, edge_ids, new_edge_ids):
+        """
+        Updates cost related structures for connected edges only.
+        """
+        self._update_costs(new_edge_ids)
+
+        for edge_id in new_edge_ids:
+            self.spanning_tree[edge_id] = edge_id[1]
+
     def connect_nodes(self, *edge_ids: tuple[str, ...]):
+        new_edge_ids = [
+            edge_id for edge_id in dict.fromkeys(edge_ids) if edge_id not in self.edges
+        ]
         super().connect_nodes(*edge_ids)
 
-        self._set_cost()
-        self._set_spanning_tree()
+        if self._batch_depth:
+            return
+
+        if self._requires_refresh(new_edge_ids):
+            self._refresh()
+        else:
+            self._add_edges(edge_ids, new_edge_ids)
+
+    # removals (and operations built on them) refresh cost related structures
+    remove_edges = _refreshed(DigraphManager.remove_edges)
+    remove_nodes = _refreshed(DigraphManager.remove_nodes)
+    reverse_edges = _refreshed(DigraphManager.reverse_edges)
+    merge_edges = _refreshed(DigraphManager.merge_edges)
+    compress_edges = _refreshed(DigraphManager.compress_edges)
+    decompress_edges = _refreshed(DigraphManager.decompress_edges)
+    decouple_edges = _refreshed(DigraphManager.decouple_edges)
+    compress_diblob = _refreshed(DigraphManager.compress_diblob)
+    inject = _refreshed(DigraphManager.inject)
 
     def update_cost_function(self, cost_function: dict):
         """
         updates cost_function.
         """
         self.cost_function |= cost_function
-        self._set_cost()
+
+        if self._batch_depth:
+            return
+
+        edge_ids = [edge_id for edge_id in cost_function if edge_id in self.edges]
+        if self._requires_refresh(edge_ids):
+            self._refresh()
+        else:
+            self._update_costs(edge_ids)
 
     def get_edge_elements(self):
         """
@@ -74,39 +475,25 @@ class WeightedDigraphManager(DigraphManager):
     def least_cost_paths(self):
         """
         Computes shortest path between pairs of nodes (based on cost).
+        Stops when negative cycle is found (then cost[(node_id, node_id)] < 0
+        and the cycle can be followed by spanning_tree[(_, node_id)]).
         """
-        cost = self.cost
-
-        for node_k, node_i in product(self.nodes, self.nodes):
-            if (node_i, node_k) in cost:
-                for node_j in self.nodes:
-
-                    if (node_k, node_j) in cost and (
-                        (node_i, node_j) not in cost
-                        or cost[(node_i, node_j)]
-                        > cost[(node_i, node_k)] + cost[(node_k, node_j)]
-                    ):
-
-                        self.spanning_tree[(node_i, node_j)] = self.spanning_tree[
-                            (node_i, node_k)
-                        ]
-                        cost[(node_i, node_j)] = cost.get(
-                            (node_i, node_k), 0
-                        ) + cost.get((node_k, node_j), 0)
-
-                        if node_i == node_j and cost[(node_i, node_j)] < 0:
-                            return
+        self._paths_computed = True
+        SHORTEST_PATHS_BACKENDS[self.shortest_paths_backend](self)
 
     def check_if_digraph_is_strongly_connected(self):
         """
-        Validates if graph is SSG.
+        Validates if graph is SSG (every node lies on the cycle and all nodes
+        are mutually reachable). Uses Tarjan's SCC - O(V + E).
         """
-        self.least_cost_paths()
-        cost_function = self.cost
+        sccs = CompactTarjanSCC(self.freeze()).run()
+
+        if len(sccs) > 1:
+            return False
+
+        if len(self.nodes) == 1:
+            return bool(self.edges)
 
-        for tail_id, head_id in product(self.nodes, self.nodes):
-            if (tail_id, head_id) not in cost_function:
-                return False
         return True
 
 
@@ -120,12 +507,23 @@ class CPTDigraphManager(WeightedDigraphManager):
         digraph_dict_representation: dict,
         cost_function: dict,
         default_cost: int = 1,
+        shortest_paths_backend: str = "johnson",
+        numeric_mode: str = "auto",
     ):
-        super().__init__(digraph_dict_representation, cost_function, default_cost)
+        super().__init__(
+            digraph_dict_representation,
+            cost_function,
+            default_cost,
+            shortest_paths_backend,
+            numeric_mode,
+        )
+
+        self.feasible = {}
 
+    def _refresh(self):
+        super()._refresh()
         self._set_delta()
         self._set_basic_cost()
-        self.feasible = {}
 
     def _set_delta(self):
         self.delta = {
@@ -134,21 +532,43 @@ class CPTDigraphManager(WeightedDigraphManager):
         }
 
     def _set_basic_cost(self):
+        """
+        Sum of the costs of all edges (multiple edges included).
+        """
+        self.basic_cost = sum(
+            self._to_cost(self.cost_function.get(edge_id, self.default_cost))
+            * len(edges)
+            for edge_id, edges in self.edges.items()
+        )
 
-        self.basic_cost = Decimal(
-            str(
-                sum(
-                    self.cost_function.get(edge_id, self.default_cost)
-                    for edge_id in self.edges
-                )
-            )
+    def _update_costs(self, edge_ids):
+        previous_cost = sum(
+            self.cost.get(edge_id, 0) * len(self.edges[edge_id]) for edge_id in edge_ids
         )
+        super()._update_costs(edge_ids)
 
-    def connect_nodes(self, *edge_ids: tuple[str, ...]):
-        super().connect_nodes(*edge_ids)
+        self.basic_cost += (
+            sum(self.cost[edge_id] * len(self.edges[edge_id]) for edge_id in edge_ids)
+            - previous_cost
+        )
 
-        self._set_delta()
-        self._set_basic_cost()
+    def _add_edges(self, edge_ids, new_edge_ids):
+        super()._add_edges(edge_ids, new_edge_ids)
+        new_edge_ids = set(new_edge_ids)
+
+        delta = self.delta
+        for tail_id, head_id in edge_ids:
+            # nodes can be created without add_nodes (e.g. self[node_id] = Node(...))
+            delta[tail_id] = delta.get(tail_id, 0) + 1
+            delta[head_id] = delta.get(head_id, 0) - 1
+
+            if (tail_id, head_id) not in new_edge_ids:
+                self.basic_cost += self.cost[(tail_id, head_id)]
+
+    def add_nodes(self, *node_ids: tuple[str], diblob_id: str = None):
+        super().add_nodes(*node_ids, diblob_id=diblob_id)
+
+        self.delta |= dict.fromkeys(node_ids, 0)
 
     def _split_nodes_based_on_delta(self):
         """
@@ -195,23 +615,26 @@ class CPTDigraphManager(WeightedDigraphManager):
         cost = self.cost
         feasible = self.feasible
 
-        residual_digraph = DigraphManager({"Res": {}})
-        residual_digraph.add_nodes(*self.nodes)
-
         residual_cost = {}
 
         for node_neq, node_pos in product(delta_neq, delta_pos):
-            residual_digraph.connect_nodes((node_neq, node_pos))
             residual_cost[(node_neq, node_pos)] = cost[(node_neq, node_pos)]
 
             if feasible[(node_neq, node_pos)] != 0:
-
-                residual_digraph.connect_nodes((node_pos, node_neq))
                 residual_cost[(node_pos, node_neq)] = -cost[(node_neq, node_pos)]
 
-        return CPTDigraphManager(
-            dict(residual_digraph("Res")), residual_cost, self.default_cost
+        residual_cpt = CPTDigraphManager(
+            {"Res": {}},
+            residual_cost,
+            self.default_cost,
+            self.shortest_paths_backend,
+            self.cost_type,
         )
+        with residual_cpt.batch():
+            residual_cpt.add_nodes(*self.nodes)
+            residual_cpt.connect_nodes(*residual_cost)
+
+        return residual_cpt
 
     def _improvements(self, residual_cpt: "CPTDigraphManager"):
         """
@@ -225,7 +648,7 @@ class CPTDigraphManager(WeightedDigraphManager):
 
         for node_id in self.nodes:
 
-            if cost.get((node_id, node_id), 0) < 0:
+            if cost.get((node_id, node_id), 0) < -residual_cpt.tolerance:
                 k = 0
                 flag = True
                 u = node_id
@@ -261,77 +684,69 @@ class CPTDigraphManager(WeightedDigraphManager):
         """
         returns the cost of the CPT.
         """
-        phi = Decimal(str(0))
         cost = self.cost
-        feasible = self.feasible
-        nodes = self.nodes
 
-        for tail_id, head_id in product(nodes, nodes):
-            phi += cost.get((tail_id, head_id), 0) * feasible.get((tail_id, head_id), 0)
+        phi = sum(
+            cost.get(edge_id, 0) * flow for edge_id, flow in self.feasible.items()
+        )
         return phi + self.basic_cost
 
-    def _find_path(self, frm, feasible):
+    def _get_augmented_adjacency(self):
         """
-        finds path.
+        Adjacency of the augmented (Eulerian) multigraph - every edge of the digraph
+        and feasible[(u, v)] copies of the least cost path u -> v (stored as
+        (v, True), expanded using spanning_tree).
         """
-        for node_id in self.nodes:
-            if feasible.get((frm, node_id), 0) > 0:
-                return node_id
+        adjacency = {
+            node_id: [(head_id, False) for head_id in node.outgoing_nodes]
+            for node_id, node in self.nodes.items()
+        }
+        for (tail_id, head_id), flow in self.feasible.items():
+            adjacency[tail_id].extend([(head_id, True)] * flow)
+
+        return adjacency
 
     def _get_cpt(self, start_node):
         """
-        returns cpt.
+        returns cpt - Euler circuit of the augmented multigraph starting
+        in start_node (Hierholzer's algorithm, O(E + extra edges)).
         """
-        v = start_node
-        feasible = dict(self.feasible)
-        edges_will_not_be_processed = set()
-        cpt = []
-
-        while True:
+        outgoing = {
+            node_id: iter(arcs)
+            for node_id, arcs in self._get_augmented_adjacency().items()
+        }
+        stack = [(start_node, None)]
+        circuit = []
 
-            u = v
-            v = self._find_path(u, feasible)
+        while stack:
+            node_id, arc = stack[-1]
+            head_id, is_path = next(outgoing[node_id], (None, None))
 
-            if v is not None:
-                feasible[(u, v)] -= 1
-                while u != v:
-                    p = self.spanning_tree[(u, v)]
-                    cpt.append((u, p))
-                    u = p
+            if head_id is None:
+                stack.pop()
+                if arc is not None:
+                    circuit.append(arc)
             else:
+                stack.append((head_id, (node_id, head_id, is_path)))
 
-                bridge_node = self.spanning_tree[(u, start_node)]
-                if (u, bridge_node) in edges_will_not_be_processed:
-                    break
+        cpt = []
+        for tail_id, head_id, is_path in reversed(circuit):
+            if not is_path:
+                cpt.append((tail_id, head_id))
+                continue
 
-                v = bridge_node
-                for node_id in self.nodes:
-                    if (
-                        node_id != bridge_node
-                        and (u, node_id) in self.edges
-                        and (u, node_id) not in edges_will_not_be_processed
-                    ):
-                        v = node_id
-                        break
-                edges_will_not_be_processed.add((u, v))
-                cpt.append((u, v))
+            while tail_id != head_id:
+                next_id = self.spanning_tree[(tail_id, head_id)]
+                cpt.append((tail_id, next_id))
+                tail_id = next_id
 
         return cpt
 
-    def compute_cpt(self, start_node):
+    def _cycle_canceling(self, delta_neq, delta_pos):
         """
-        compute cpt with the cost of cpt.
+        Initial feasible flow improved by negative cycles cancellation
+        in the residual digraphs (algorithm from the papier).
         """
-        self._set_cost()
-        self._set_spanning_tree()
-        self._set_delta()
-        self._set_basic_cost()
-        self.feasible = {}
-
-        if not self.check_if_digraph_is_strongly_connected():
-            raise NotSCGException("Digraph is not strongly connected!")
-
-        delta_neq, delta_pos = self._split_nodes_based_on_delta()
         self._find_feasible(delta_neq, delta_pos)
 
         residual_cpt = self._get_residual_diblob_manager_for_cpt(delta_neq, delta_pos)
@@ -343,5 +758,141 @@ class CPTDigraphManager(WeightedDigraphManager):
             )
             residual_cpt.least_cost_paths()
 
+    def _min_cost_flow(self, delta_neq, delta_pos):
+        """
+        Optimal feasible computed in one pass - successive shortest paths with
+        potentials on the bipartite digraph source -> delta_neq -> delta_pos -> sink
+        (edge delta_neq -> delta_pos costs the least path cost). Residual digraph
+        is stored as adjacency lists, shortest paths are found by heap Dijkstra.
+        """
+        cost = self.cost
+        delta = self.delta
+        number_of_neq = len(delta_neq)
+        number_of_nodes = number_of_neq + len(delta_pos) + 2
+        source, sink = 0, number_of_nodes - 1
+        total_flow = sum(delta[node_id] for node_id in delta_pos)
+
+        # residual edges - edge_idx ^ 1 is the reverse edge of edge_idx
+        heads, capacities, edge_costs = [], [], []
+        adjacency = [[] for _ in range(number_of_nodes)]
+
+        def add_edge(tail_idx, head_idx, capacity, edge_cost):
+            adjacency[tail_idx].append(len(heads))
+            heads.append(head_idx)
+            capacities.append(capacity)
+            edge_costs.append(edge_cost)
+
+            adjacency[head_idx].append(len(heads))
+            heads.append(tail_idx)
+            capacities.append(0)
+            edge_costs.append(-edge_cost)
+
+            return len(heads) - 2
+
+        # initial potentials - distances from the source (digraph is acyclic)
+        potentials = [0] * number_of_nodes
+        pair_edges = {}
+
+        for idy, node_pos in enumerate(delta_pos, start=number_of_neq + 1):
+            add_edge(idy, sink, delta[node_pos], 0)
+            potentials[idy] = min(cost[(node_neq, node_pos)] for node_neq in delta_neq)
+
+        for idx, node_neq in enumerate(delta_neq, start=1):
+            add_edge(source, idx, -delta[node_neq], 0)
+
+            for idy, node_pos in enumerate(delta_pos, start=number_of_neq + 1):
+                edge_id = (node_neq, node_pos)
+                pair_edges[edge_id] = add_edge(idx, idy, total_flow, cost[edge_id])
+
+        if sink > 1:
+            potentials[sink] = min(potentials[number_of_neq + 1 : sink], default=0)
+
+        while True:
+            distances = {source: 0}
+            previous_edges = {}
+            processed = set()
+            heap = [(0, source)]
+
+            while heap:
+                distance, node_idx = heapq.heappop(heap)
+                if node_idx in processed:
+                    continue
+                processed.add(node_idx)
+
+                if node_idx == sink:
+                    break
+
+                for edge_idx in adjacency[node_idx]:
+                    head_idx = heads[edge_idx]
+
+                    if capacities[edge_idx] > 0 and head_idx not in processed:
+                        new_distance = (
+                            distance
+                            + edge_costs[edge_idx]
+                            + potentials[node_idx]
+                            - potentials[head_idx]
+                        )
+                        if (
+                            head_idx not in distances
+                            or new_distance < distances[head_idx]
+                        ):
+                            distances[head_idx] = new_distance
+                            previous_edges[head_idx] = edge_idx
+                            heapq.heappush(heap, (new_distance, head_idx))
+
+            if sink not in processed:
+                break
+
+            for node_idx in processed:
+                potentials[node_idx] += distances[node_idx] - distances[sink]
+
+            flow, node_idx = total_flow, sink
+            while node_idx != source:
+                edge_idx = previous_edges[node_idx]
+                flow = min(flow, capacities[edge_idx])
+                node_idx = heads[edge_idx ^ 1]
+
+            node_idx = sink
+            while node_idx != source:
+                edge_idx = previous_edges[node_idx]
+                capacities[edge_idx] -= flow
+                capacities[edge_idx ^ 1] += flow
+                node_idx = heads[edge_idx ^ 1]
+
+        for edge_id, edge_idx in pair_edges.items():
+            self.feasible[edge_id] = capacities[edge_idx ^ 1]
+
+    def compute_cpt(self, start_node, solver: str = "cycle_canceling"):
+        """
+        compute cpt with the cost of cpt.
+
+        Args:
+            start_node (str): node_id where the tour starts.
+            solver (str): method used for the optimal feasible computation:
+                - cycle_canceling (default) - negative cycles cancellation
+                  in the residual digraphs (from the papier).
+                - min_cost_flow - successive shortest paths (the same cost,
+                  faster, the tour can differ for many optimal feasibles).
+        """
+        if solver not in CPT_SOLVERS:
+            raise InvalidCPTSolverException(
+                f"Unknown CPT solver: {solver}, available: {CPT_SOLVERS}"
+            )
+
+        self._refresh()
+        self.feasible = {}
+
+        if not self.check_if_digraph_is_strongly_connected():
+            raise NotSCGException("Digraph is not strongly connected!")
+
+        self.least_cost_paths()
+
+        delta_neq, delta_pos = self._split_nodes_based_on_delta()
+
+        if solver == "min_cost_flow":
+            self._min_cost_flow(delta_neq, delta_pos)
+        else:
+            self._cycle_canceling(delta_neq, delta_pos)
+
         cpt, cost = self._get_cpt(start_node), self._get_cost()
         return cpt, cost
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from testing_criterions import CPTDigraphManager
 from testing_criterions.exceptions import (
     InvalidSinkSourceException,
@@ -12,7 +11,15 @@ class TestCasesGenerator:
     """
 
     def __init__(
-        self, digraph_manager, source="S", sink="T", cost_function=None, default_cost=1
+        self,
+        digraph_manager,
+        source="S",
+        sink="T",
+        cost_function=None,
+        default_cost=1,
+        shortest_paths_backend="johnson",
+        solver="cycle_canceling",
+        numeric_mode="auto",
     ) -> None:
 
         if cost_function is None:
@@ -25,6 +32,7 @@ class TestCasesGenerator:
 
         self.source = source
         self.sink = sink
+        self.solver = solver
         self.digraph_manager = digraph_manager
 
         dict_json_representation = dict(digraph_manager(digraph_manager.root_diblob_id))
@@ -34,6 +42,8 @@ class TestCasesGenerator:
                 edge_id: cost_function.get(edge_id, default_cost)
                 for edge_id in digraph_manager.edges
             },
+            shortest_paths_backend=shortest_paths_backend,
+            numeric_mode=numeric_mode,
         )
 
         self.minimal_elements, self.maximal_elements = self.cpt.get_edge_elements()
@@ -67,24 +77,25 @@ class TestCasesGenerator:
         self, k, minimal_edges_cost=1, maximal_edges_cost=1, sink_source_cost=1
     ):
         """ "Case 1: Minimal total number of test cases."""
-        cpt = deepcopy(self.cpt)
+        cpt = self.cpt.fork()
         nodes_to_add, minimal_edges, maximal_edges, sink_source_edges = (
             self.__get_additional_nodes_and_edges(k)
         )
         edges = minimal_edges + maximal_edges + sink_source_edges
 
-        cpt.add_nodes(*nodes_to_add)
-        cpt.connect_nodes(*edges)
+        with cpt.batch():
+            cpt.add_nodes(*nodes_to_add)
+            cpt.connect_nodes(*edges)
 
-        cpt.update_cost_function(
-            self.__get_cost(minimal_edges, cost=minimal_edges_cost)
-        )
-        cpt.update_cost_function(
-            self.__get_cost(maximal_edges, cost=maximal_edges_cost)
-        )
-        cpt.update_cost_function(
-            self.__get_cost(sink_source_edges, cost=sink_source_cost)
-        )
+            cpt.update_cost_function(
+                self.__get_cost(minimal_edges, cost=minimal_edges_cost)
+            )
+            cpt.update_cost_function(
+                self.__get_cost(maximal_edges, cost=maximal_edges_cost)
+            )
+            cpt.update_cost_function(
+                self.__get_cost(sink_source_edges, cost=sink_source_cost)
+            )
 
         return cpt
 
@@ -124,5 +135,5 @@ class TestCasesGenerator:
         cpt = self.__set_params(
             k, minimal_edges_cost, maximal_edges_cost, sink_source_cost
         )
-        test_cases, _ = cpt.compute_cpt(start_node=self.source)
+        test_cases, _ = cpt.compute_cpt(start_node=self.source, solver=self.solver)
         return self.__extract_test_cases(test_cases)
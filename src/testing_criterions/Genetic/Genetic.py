@@ -116,10 +116,19 @@ class Mutation:
 
 import random
 
+from diblob.tools import get_rng
+
 
 def run_algorithm(
-    test_cases, cost_function, iterations=1000000, threshold=0, avg=None, pop=None
+    test_cases,
+    cost_function,
+    iterations=1000000,
+    threshold=0,
+    avg=None,
+    pop=None,
+    rng: random.Random | int | None = None,
 ):
+    rng = get_rng(rng)
 
     m = Mutation(test_cases, cost_function)
     m.create_mutation_resources()
@@ -153,8 +162,8 @@ def run_algorithm(
     while iterator < iterations and dist > threshold:
 
         iterator += 1
-        mutate = random.choice(list(m.mutation_dict.keys()))
-        x, y = random.sample(m.mutation_dict[mutate], 2)
+        mutate = rng.choice(list(m.mutation_dict.keys()))
+        x, y = rng.sample(m.mutation_dict[mutate], 2)
 
         old_cost, new_cost = m.compare_cost(x, y, avg=avg)
 
@@ -2,6 +2,8 @@ import random
 import copy
 from itertools import combinations
 
+from diblob.tools import get_rng
+
 
 class Criterion:
 
@@ -106,7 +108,9 @@ def mutation_algorithm(
     number_of_mutations=3,
     mutation_method="common_node_mutation",
     avg=0,
+    rng: random.Random | int | None = None,
 ):
+    rng = get_rng(rng)
     mutation_set = set()
     mutation_manager = Mutation(test_cases, mutation_method)
 
@@ -117,8 +121,8 @@ def mutation_algorithm(
         )
 
         for _ in range(number_of_mutations):
-            key = random.choice(list(potential_new_mutation_manager.hash_dict))
-            value = random.choice(list(potential_new_mutation_manager.hash_dict[key]))
+            key = rng.choice(list(potential_new_mutation_manager.hash_dict))
+            value = rng.choice(list(potential_new_mutation_manager.hash_dict[key]))
 
             test_1_hash, test_2_hash = key
             test_case_1, test_case_2 = (
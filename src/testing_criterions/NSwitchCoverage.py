@@ -1,4 +1,3 @@
-from copy import deepcopy
 from diblob import DigraphManager
 from diblob.factory import DiblobFactory
 from testing_criterions.EdgeCoverage import EdgeCoverage
@@ -125,7 +124,7 @@ class NSwitchCoverage:
     @staticmethod
     def generate_n_switch_graph(digraph_manager, n_switch):
 
-        digraph_manager = deepcopy(digraph_manager)
+        digraph_manager = digraph_manager.fork()
         if n_switch < 2:
             raise InvalidNSwitchException(
                 "n_switch should be at least equals to 2 or 3"
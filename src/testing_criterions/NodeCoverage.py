@@ -1,5 +1,4 @@
 from diblob.algorithms import DFS_with_path, DijkstraAlgorithm
-from copy import deepcopy
 from testing_criterions.decorators import (
     validate_source,
     validate_sink,
@@ -27,7 +26,7 @@ class NodeCoverage:
         starting_point = "S"
         end_point = "T"
 
-        digraph_manager = deepcopy(self.digraph_manager)
+        digraph_manager = self.digraph_manager.fork()
         dfs = DFS_with_path(digraph_manager)
         test_cases = dfs.run(starting_point)
 
@@ -42,6 +41,6 @@ class NodeCoverage:
             node_id = test_case[-1]
             if node_id != end_point:
                 test_case += [
-                    elem[0] for elem in min_distance_dict[node_id]["min_path"]
+                    elem[0] for elem in min_distance_dict.min_path(node_id)
                 ][::-1]
             yield test_case
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from diblob.algorithms import PrimePathGenerator, ShortestPathBetween2Nodes
 from testing_criterions.decorators import (
     validate_source,
@@ -27,7 +26,7 @@ class SimpleCycleCoverage:
     def get_test_cases(
         self, k: int, double_cycle: bool=False
     ):
-        ppg = PrimePathGenerator(deepcopy(self.digraph_manager))
+        ppg = PrimePathGenerator(self.digraph_manager)
         shortest_path_dict = {}
         test_case = []
 
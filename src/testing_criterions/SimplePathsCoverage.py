@@ -1,4 +1,3 @@
-from copy import deepcopy
 from diblob.algorithms import PrimePathGenerator, ShortestPathBetween2Nodes
 from testing_criterions.decorators import (
     validate_source,
@@ -25,7 +24,7 @@ class SimplePathsCoverage:
     
     def get_test_cases(
         self, k: int):
-        ppg = PrimePathGenerator(deepcopy(self.digraph_manager))
+        ppg = PrimePathGenerator(self.digraph_manager)
         shortest_path_dict = {}
         test_case = []
 
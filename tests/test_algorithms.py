@@ -0,0 +1,327 @@
+"""
+Diblob algorithms tests.
+"""
+
+import random
+
+import pytest
+
+from diblob.digraph_manager import DigraphManager
+from diblob.exceptions import NegativeCycleException
+from diblob.algorithms import (
+    DFS,
+    DFSA,
+    DFS_with_path,
+    JonsonForSimpleSSC,
+    TarjanSCC,
+    HopcroftKarp,
+    DijkstraAlgorithm,
+    ShortestPathBetween2Nodes,
+    AllPairsShortestPaths,
+    GenerateDijkstraMatrix,
+    CompactDFS,
+    CompactTarjanSCC,
+    CompactHopcroftKarp,
+    CompactDijkstraAlgorithm,
+    CompactShortestPathBetween2Nodes,
+    MaxSimplePathGenerator,
+    PrimePathGenerator,
+    SimpleCycleGenerator,
+)
+
+DIGRAPH = {
+    "B0": {
+        "S": ["A", "B"],
+        "A": ["C", "C", "D"],
+        "B": ["D"],
+        "C": ["A", "E"],
+        "D": ["E", "B"],
+        "E": ["T", "E"],
+        "T": [],
+    }
+}
+
+
+def test_compact_digraph():
+    """
+    Tests CSR snapshot of the digraph.
+    """
+    digraph_manager = DigraphManager(DIGRAPH)
+    compact_digraph = digraph_manager.freeze()
+
+    assert len(compact_digraph) == 7
+    assert compact_digraph.number_of_edges() == 12
+    assert "S" in compact_digraph and "X" not in compact_digraph
+
+    for node_id, node in digraph_manager.nodes.items():
+        idx = compact_digraph.index(node_id)
+        node_ids = compact_digraph.node_ids
+
+        assert [node_ids[i] for i in compact_digraph.successors(idx)] == (
+            node.outgoing_nodes
+        )
+        assert [node_ids[i] for i in compact_digraph.predecessors(idx)] == (
+            node.incoming_nodes
+        )
+
+    digraph_manager.connect_nodes(("T", "S"))
+    assert compact_digraph.number_of_edges() == 12
+
+
+def test_compact_algorithms():
+    """
+    Algorithms working on CompactDigraph return the same results
+    as their DigraphManager counterparts.
+    """
+    digraph_manager = DigraphManager(DIGRAPH)
+    compact_digraph = digraph_manager.freeze()
+
+    dfs, compact_dfs = DFS(digraph_manager), CompactDFS(compact_digraph)
+    dfs.run("S")
+    compact_dfs.run("S")
+    assert compact_dfs.visited_nodes == dfs.visited_nodes
+    assert compact_dfs.visitation_dict == dfs.visitation_dict
+
+    assert CompactTarjanSCC(compact_digraph).run() == TarjanSCC(digraph_manager).run()
+    assert CompactHopcroftKarp.run(compact_digraph) == HopcroftKarp.run(
+        digraph_manager
+    )
+
+    cost_function = {edge_id: len(edge_id[1]) for edge_id in digraph_manager.edges}
+    cost_function[("A", "C")] = 5
+    assert CompactDijkstraAlgorithm(compact_digraph).run(
+        "S", cost_function
+    ) == DijkstraAlgorithm(digraph_manager).run("S", cost_function)
+
+    for target in ("T", "S", "B"):
+        assert CompactShortestPathBetween2Nodes.run(
+            compact_digraph, "C", target
+        ) == ShortestPathBetween2Nodes.run(digraph_manager, "C", target)
+
+
+def test_dijkstra_algorithm():
+    """
+    Tests Dijkstra algorithm (lazy paths, early exit).
+    """
+    digraph_manager = DigraphManager(DIGRAPH)
+    cost_function = {edge_id: 1 for edge_id in digraph_manager.edges}
+    cost_function[("S", "A")] = 3
+
+    shortest_paths = DijkstraAlgorithm(digraph_manager).run("S", cost_function)
+
+    assert list(shortest_paths) == ["A", "B", "C", "D", "E", "S", "T"]
+    assert shortest_paths["S"] == {"distance": 0, "min_path": []}
+    assert shortest_paths["T"] == {
+        "distance": 4,
+        "min_path": [("S", "B"), ("B", "D"), ("D", "E"), ("E", "T")],
+    }
+    assert shortest_paths.distance("C") == 4
+    assert shortest_paths.path("C") == ["S", "A", "C"]
+
+    shortest_paths = DijkstraAlgorithm(digraph_manager).run(
+        "S", cost_function, target="D"
+    )
+    assert shortest_paths.path("D") == ["S", "B", "D"]
+    assert shortest_paths.distance("T") == float("inf")
+    assert shortest_paths.min_path("T") == []
+
+
+def test_all_pairs_shortest_paths():
+    """
+    Tests all pairs shortest paths (BFS, Johnson's algorithm).
+    """
+    digraph_manager = DigraphManager(DIGRAPH)
+
+    dijkstra_matrix = GenerateDijkstraMatrix.run(digraph_manager)
+    assert len(dijkstra_matrix) == 49
+    assert dijkstra_matrix[("S", "T")] == ["S", "A", "C", "E", "T"]
+    assert dijkstra_matrix[("S", "S")] == []
+    assert dijkstra_matrix[("T", "S")] == []
+    assert dijkstra_matrix.distance("S", "T") == 4
+    assert dijkstra_matrix.distance("T", "S") == float("inf")
+
+    cost_function = {edge_id: 2 for edge_id in digraph_manager.edges}
+    cost_function[("S", "B")] = -1
+    cost_function[("B", "D")] = -1
+
+    shortest_paths = AllPairsShortestPaths(digraph_manager, cost_function).run()
+    assert shortest_paths.path("S", "T") == ["S", "B", "D", "E", "T"]
+    assert shortest_paths.distance("S", "T") == 2
+    assert shortest_paths.path("A", "B") == ["A", "D", "B"]
+
+    cost_function[("D", "B")] = -1
+    with pytest.raises(NegativeCycleException):
+        AllPairsShortestPaths(digraph_manager, cost_function)
+
+
+def test_deep_digraphs():
+    """
+    DFS family works on paths and cycles longer than the recursion limit.
+    """
+    node_ids = [str(idx) for idx in range(3000)]
+    path_dict = {"B0": {tail: [head] for tail, head in zip(node_ids, node_ids[1:])}}
+    path_dict["B0"][node_ids[-1]] = []
+    digraph_manager = DigraphManager(path_dict)
+
+    dfs = DFSA(digraph_manager)
+    dfs.run(node_ids[0])
+    assert dfs.visited_nodes == node_ids
+    assert dfs.visitation_dict[node_ids[0]]["return_time"] == len(node_ids)
+    assert [dfs.nodes_order_dict[idx] for idx in range(len(node_ids))] == node_ids
+
+    assert DFS_with_path(digraph_manager).run(node_ids[0]) == [node_ids]
+    assert TarjanSCC(digraph_manager).run() == [{node_id} for node_id in node_ids[::-1]]
+
+    digraph_manager.connect_nodes((node_ids[-1], node_ids[0]))
+    assert TarjanSCC(digraph_manager).run() == [set(node_ids)]
+
+    # JonsonForSimpleSSC is quadratic for the cycle, shorter one is used
+    node_ids = sorted(node_ids[:1100])
+    cycle_dict = {"B0": {tail: [head] for tail, head in zip(node_ids, node_ids[1:])}}
+    cycle_dict["B0"][node_ids[-1]] = [node_ids[0]]
+    digraph_manager = DigraphManager(cycle_dict)
+    assert JonsonForSimpleSSC(digraph_manager).run(node_ids[0]) == [node_ids]
+
+
+def test_dfs_exec():
+    """
+    DFS.exec visits every node once, starting with the delivered node.
+    """
+    digraph_manager = DigraphManager(DIGRAPH)
+    digraph_manager.add_nodes("X", "Y")
+    digraph_manager.connect_nodes(("X", "S"))
+
+    dfs = DFS(digraph_manager)
+    dfs.exec("A")
+
+    assert dfs.visited_nodes[:5] == ["A", "C", "E", "T", "D"]
+    assert sorted(dfs.visited_nodes) == sorted(digraph_manager.nodes)
+    assert dfs.visited == set(digraph_manager.nodes)
+    assert not dfs.nodes_to_visit
+    assert dfs.visit_time == len(digraph_manager.nodes)
+
+
+def test_dfs_exec_rng():
+    """
+    Order of DFS.exec starting nodes depends only on the delivered rng.
+    """
+    digraph_manager = DigraphManager({"B0": {str(idx): [] for idx in range(20)}})
+
+    visited_nodes = []
+    for rng in (5, random.Random(5)):
+        dfs = DFS(digraph_manager)
+        dfs.exec("0", rng=rng)
+        visited_nodes.append(dfs.visited_nodes)
+
+    assert visited_nodes[0] == visited_nodes[1]
+    assert visited_nodes[0] != [str(idx) for idx in range(20)]
+
+
+def test_prime_paths():
+    """
+    Maximal simple paths are found in the SCC of the extended digraph
+    (SCCs of the original digraph merged by the artificial node).
+    """
+    digraph_manager = DigraphManager(
+        {"B0": {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}}
+    )
+    generator = MaxSimplePathGenerator(digraph_manager)
+    extended_graph = generator.get_extended_graph("A")
+    assert generator.get_extended_graph("B") is None
+    assert generator.get_extended_scc(extended_graph) == {
+        "ArtificialNode",
+        "A",
+        "B",
+        "C",
+        "D",
+    }
+    assert "ArtificialNode" not in digraph_manager
+
+    prime_path_generator = PrimePathGenerator(digraph_manager)
+    assert list(prime_path_generator.get_prime_paths_without_cycles()) == [
+        ("A", "B", "D"),
+        ("A", "C", "D"),
+    ]
+    assert "ArtificialNode" not in digraph_manager
+
+    # digraph manager is not modified - generators can be interleaved
+    paths = generator.get_maximal_simple_path_for_node_id("A")
+    other_paths = generator.get_maximal_simple_path_for_node_id("A")
+    assert next(paths) == next(other_paths) == ("A", "B", "D")
+    assert list(paths) == list(other_paths) == [("A", "C", "D")]
+
+    digraph_manager = DigraphManager(
+        {"B0": {"A": ["B"], "B": ["C", "A"], "C": ["D"], "D": ["C"]}}
+    )
+    prime_path_generator = PrimePathGenerator(digraph_manager)
+    assert list(prime_path_generator.get_prime_paths_without_cycles()) == [
+        ("A", "B", "C", "D")
+    ]
+    assert list(prime_path_generator.get_cycles()) == [
+        ("A", "B", "A"),
+        ("C", "D", "C"),
+    ]
+
+
+def test_parallel_prime_paths():
+    """
+    Worker processes yield the same paths and cycles in the same order.
+    """
+    rng = random.Random(0)
+    node_ids = [str(idx) for idx in range(30)]
+    digraph_manager = DigraphManager.from_edges(
+        [(rng.choice(node_ids), rng.choice(node_ids)) for _ in range(20)]
+        + [(tail, head) for tail, head in zip(node_ids, node_ids[1:])]
+    )
+    prime_path_generator = PrimePathGenerator(digraph_manager)
+
+    prime_paths = list(prime_path_generator.get_prime_paths_without_cycles())
+    cycles = list(prime_path_generator.get_cycles())
+    assert prime_paths and cycles
+
+    for chunksize in (None, 1, 7):
+        assert (
+            list(
+                prime_path_generator.get_prime_paths_without_cycles(
+                    processes=2, chunksize=chunksize
+                )
+            )
+            == prime_paths
+        )
+        assert list(prime_path_generator.get_cycles(3, chunksize)) == cycles
+
+    # workers rebuild the digraph from adjacency - order of the nodes and
+    # the root diblob id of the modified digraph are preserved
+    digraph_manager = DigraphManager.from_edges(
+        [(tail, head) for tail, head in zip(node_ids, node_ids[2:])], root_diblob_id="R"
+    )
+    digraph_manager.remove_nodes(digraph_manager["5"])
+    digraph_manager.add_nodes("B0")
+    digraph_manager.connect_nodes(("29", "B0"), ("B0", "0"), ("B0", "3"))
+    prime_path_generator = PrimePathGenerator(digraph_manager)
+
+    assert list(prime_path_generator.get_prime_paths_without_cycles(2)) == list(
+        prime_path_generator.get_prime_paths_without_cycles()
+    )
+    assert list(prime_path_generator.get_cycles(2)) == list(
+        prime_path_generator.get_cycles()
+    )
+
+
+def test_simple_cycles():
+    """
+    Simple cycles are found in the SCCs of the remaining nodes
+    (self-loops of the trivial SCCs included).
+    """
+    digraph_manager = DigraphManager(
+        {"B0": {"A": ["B", "A"], "B": ["C", "A"], "C": ["A", "D"], "D": ["D"]}}
+    )
+    generator = SimpleCycleGenerator(digraph_manager)
+    cycles = [("A", "B", "C", "A"), ("A", "B", "A"), ("A", "A"), ("D", "D")]
+
+    assert list(generator.get_simple_cycles()) == cycles
+    assert [
+        cycle
+        for node_index in range(len(generator.node_ids))
+        for cycle in generator.get_simple_cycles_for_node_index(node_index)
+    ] == cycles
@@ -3,9 +3,11 @@
 Diblob component tests (components controlled by DigraphManager).
 """
 
+import random
+
 import pytest
 
-from diblob.components import Node, Edge, Diblob
+from diblob.components import Node, Edge, EdgeMultiset, Diblob, OrderedMultiset
 from diblob.exceptions import InvalidPathException
 
 
@@ -89,3 +91,123 @@ def test_diblob():
 
     assert diblob.children == {"B1", "B2", "B3", "B4", "B5"}
     assert diblob.nodes == {"1", "2", "3", "4", "5", "6", "7"}
+
+
+def test_edge_multiset():
+    """
+    EdgeMultiset test.
+    """
+
+    edges = EdgeMultiset("1", "2")
+    edges.append(Edge(["1", "2"]))
+    edges.append(Edge(["1", "2"]))
+
+    assert len(edges) == 2
+    assert [edge.path for edge in edges] == [["1", "2"], ["1", "2"]]
+    assert edges[-1].get_id() == ("1", "2")
+    assert len(edges[1:]) == 1
+
+    with pytest.raises(IndexError):
+        edges[2]  # pylint: disable=pointless-statement
+
+    with pytest.raises(InvalidPathException):
+        edges.append(Edge(["1", "3", "2"]))
+
+    assert not edges.accepts(Edge(["1", "3", "2"]))
+
+    edges.remove(edges[0])
+    edges.remove(Edge(["1", "2"]))
+    assert not edges
+
+    with pytest.raises(ValueError):
+        edges.remove(Edge(["1", "2"]))
+
+
+def test_slots():
+    """
+    Components do not have per-instance __dict__.
+    """
+
+    for component in (
+        Node("node_id", "diblob_id", [], []),
+        Edge(["1", "2"]),
+        EdgeMultiset("1", "2"),
+        Diblob("diblob_id", set(), set()),
+    ):
+        assert not hasattr(component, "__dict__")
+
+
+def test_ordered_multiset():
+    """
+    OrderedMultiset (adjacency of the Node) test.
+    """
+
+    node_ids = OrderedMultiset(["B", "C", "B", "A"])
+
+    assert node_ids == ["B", "C", "B", "A"]
+    assert len(node_ids) == 4
+    assert node_ids[0] == "B" and node_ids[-1] == "A" and node_ids[1] == "C"
+    assert node_ids[-2] == "B" and node_ids[1:3] == ["C", "B"]
+    assert "C" in node_ids and "D" not in node_ids
+    assert node_ids.count("B") == 2
+    assert list(node_ids.distinct()) == ["B", "C", "A"]
+
+    node_ids.remove("B")
+    node_ids.remove("C")
+    node_ids.append("C")
+
+    assert node_ids == ["B", "A", "C"]
+    assert node_ids + ["D"] == ["B", "A", "C", "D"]
+    assert sorted(node_ids) == ["A", "B", "C"]
+
+    with pytest.raises(ValueError):
+        node_ids.remove("D")
+
+    with pytest.raises(IndexError):
+        node_ids[3]  # pylint: disable=pointless-statement
+
+    with pytest.raises(TypeError):
+        node_ids["B"]  # pylint: disable=pointless-statement
+
+    node = Node("node_id", "diblob_id", [], ["B", "A"])
+    node.outgoing_nodes = sorted(node.outgoing_nodes)
+
+    assert isinstance(node.outgoing_nodes, OrderedMultiset)
+    assert isinstance(node.incoming_nodes, OrderedMultiset)
+    assert node.outgoing_nodes == ["A", "B"]
+
+
+def test_large_ordered_multiset():
+    """
+    OrderedMultiset above INDEX_THRESHOLD (indexed, lazy removal) behaves like list.
+    """
+    rng = random.Random(0)
+    node_ids = OrderedMultiset()
+    expected = []
+
+    for _ in range(2000):
+        node_id = rng.choice("ABCDEFGH")
+
+        if rng.random() < 0.4 and node_id in expected:
+            node_ids.remove(node_id)
+            expected.remove(node_id)
+        else:
+            node_ids.append(node_id)
+            expected.append(node_id)
+
+        assert len(node_ids) == len(expected)
+        assert node_ids.count(node_id) == expected.count(node_id)
+        assert (node_id in node_ids) == (node_id in expected)
+
+    assert len(expected) > OrderedMultiset.INDEX_THRESHOLD
+    assert node_ids == expected
+    assert list(reversed(node_ids)) == expected[::-1]
+    assert node_ids[0] == expected[0] and node_ids[-1] == expected[-1]
+    assert set(node_ids.distinct()) == set(expected)
+
+    for node_id in list(expected):
+        node_ids.remove(node_id)
+    assert not node_ids and node_ids == []
+
+    with pytest.raises(ValueError):
+        node_ids.remove("A")
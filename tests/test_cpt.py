@@ -0,0 +1,370 @@
+"""
+Tests for CPT (Chinese Postman Tour) digraph managers.
+"""
+
+import importlib.util
+import inspect
+from decimal import Decimal
+
+import pytest
+
+from diblob import DigraphManager
+from testing_criterions.CPT import (
+    CPTDigraphManager,
+    WeightedDigraphManager,
+    InvalidShortestPathsBackendException,
+    InvalidCPTSolverException,
+    InvalidNumericModeException,
+    NotSCGException,
+)
+from testing_criterions.CPTTestCasesGenerator import (
+    TestCasesGenerator as CPTTestCasesGenerator,
+)
+
+CPT_GRAPH = {
+    "B0": {
+        "A": ["B", "C"],
+        "B": ["C", "D"],
+        "C": ["D"],
+        "D": ["A", "B"],
+    }
+}
+
+CPT_COST_FUNCTION = {
+    ("A", "B"): 2,
+    ("A", "C"): 5,
+    ("B", "C"): 1,
+    ("B", "D"): 7,
+    ("C", "D"): 1,
+    ("D", "A"): 3,
+    ("D", "B"): 4,
+}
+
+BACKENDS = ["floyd_warshall", "johnson"] + (
+    ["numpy"] if importlib.util.find_spec("numpy") else []
+)
+
+
+def is_tour(cpt, start_node, edges):
+    """
+    return True if cpt is closed walk starting in start_node covering all edges.
+    """
+    return (
+        cpt[0][0] == start_node
+        and cpt[-1][1] == start_node
+        and all(edge[1] == next_edge[0] for edge, next_edge in zip(cpt, cpt[1:]))
+        and set(edges) <= set(cpt)
+    )
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_least_cost_paths(backend):
+    """
+    Tests shortest paths backends of WeightedDigraphManager.
+    """
+    weighted_digraph_manager = WeightedDigraphManager(
+        CPT_GRAPH, CPT_COST_FUNCTION, shortest_paths_backend=backend
+    )
+    weighted_digraph_manager.least_cost_paths()
+
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+
+    assert cost[("A", "D")] == 4
+    assert cost[("B", "A")] == 5
+    assert cost[("A", "A")] == 7
+    assert spanning_tree[("A", "D")] == "B"
+    assert spanning_tree[("B", "A")] == "C"
+    assert len(cost) == 16
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_least_cost_paths_negative_cycle(backend):
+    """
+    Negative cycle can be followed using spanning_tree.
+    """
+    cost_function = CPT_COST_FUNCTION | {("D", "B"): -3}
+    weighted_digraph_manager = WeightedDigraphManager(
+        CPT_GRAPH,
+        cost_function,
+        shortest_paths_backend=backend,
+    )
+    weighted_digraph_manager.least_cost_paths()
+
+    cost = weighted_digraph_manager.cost
+    spanning_tree = weighted_digraph_manager.spanning_tree
+
+    node_id = next(node_id for node_id in "ABCD" if cost.get((node_id, node_id), 0) < 0)
+    cycle, u = [node_id], spanning_tree[(node_id, node_id)]
+    while u != node_id:
+        cycle.append(u)
+        u = spanning_tree[(u, node_id)]
+
+    assert sorted(cycle) == ["B", "C", "D"]
+
+    cycle_cost = sum(
+        cost_function[edge_id] for edge_id in zip(cycle, cycle[1:] + cycle[:1])
+    )
+    assert cycle_cost == cost[(node_id, node_id)] < 0
+
+
+@pytest.mark.parametrize("solver", ["min_cost_flow", "cycle_canceling"])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compute_cpt(backend, solver):
+    """
+    Tests CPT computed with different shortest paths backends and solvers.
+    """
+    cpt_digraph_manager = CPTDigraphManager(
+        CPT_GRAPH, CPT_COST_FUNCTION, shortest_paths_backend=backend
+    )
+    cpt, cost = cpt_digraph_manager.compute_cpt("A", solver=solver)
+
+    assert cost == 27
+    assert sum(CPT_COST_FUNCTION[edge_id] for edge_id in cpt) == cost
+    assert is_tour(cpt, "A", CPT_COST_FUNCTION)
+
+
+def test_default_solver():
+    """
+    compute_cpt and CPTTestCasesGenerator use cycle_canceling by default.
+    """
+    cpt_digraph_manager = CPTDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION)
+    assert cpt_digraph_manager.compute_cpt("A") == cpt_digraph_manager.compute_cpt(
+        "A", solver="cycle_canceling"
+    )
+
+    solver = inspect.signature(CPTTestCasesGenerator).parameters["solver"]
+    assert solver.default == "cycle_canceling"
+
+
+def test_invalid_backend():
+    """
+    Tests unknown shortest paths backend and CPT solver.
+    """
+    with pytest.raises(InvalidShortestPathsBackendException):
+        WeightedDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION, shortest_paths_backend="x")
+
+    with pytest.raises(InvalidCPTSolverException):
+        CPTDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION).compute_cpt("A", solver="x")
+
+
+@pytest.mark.parametrize(
+    "numeric_mode, cost_type", [("auto", int), ("float", float), ("decimal", Decimal)]
+)
+def test_numeric_mode(numeric_mode, cost_type):
+    """
+    Tests numeric modes of the costs.
+    """
+    cpt_digraph_manager = CPTDigraphManager(
+        CPT_GRAPH, CPT_COST_FUNCTION, numeric_mode=numeric_mode
+    )
+    _, cost = cpt_digraph_manager.compute_cpt("A")
+
+    assert cost == 27
+    assert type(cost) is cost_type
+    assert all(type(value) is cost_type for value in cpt_digraph_manager.cost.values())
+
+
+def test_auto_numeric_mode_with_fractional_costs():
+    """
+    Fractional costs switch auto numeric mode to float (with tolerance).
+    """
+    cost_function = {
+        edge_id: value / 10 for edge_id, value in CPT_COST_FUNCTION.items()
+    }
+    costs = {}
+    for solver in ("min_cost_flow", "cycle_canceling"):
+        cpt_digraph_manager = CPTDigraphManager(CPT_GRAPH, cost_function)
+        _, costs[solver] = cpt_digraph_manager.compute_cpt("A", solver=solver)
+
+        assert cpt_digraph_manager.cost_type == "float"
+        assert cpt_digraph_manager.tolerance > 0
+
+    assert costs["min_cost_flow"] == pytest.approx(2.7)
+    assert costs["cycle_canceling"] == pytest.approx(2.7)
+
+    with pytest.raises(InvalidNumericModeException):
+        CPTDigraphManager(CPT_GRAPH, cost_function, numeric_mode="int")
+
+    with pytest.raises(InvalidNumericModeException):
+        CPTDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION, numeric_mode="x")
+
+
+def test_incremental_updates():
+    """
+    Costs, spanning tree, delta and basic cost updated by connect_nodes
+    (incrementally or in batch) are the same as for the digraph built at once.
+    """
+    edge_ids = [
+        (tail_id, head_id)
+        for tail_id, head_ids in CPT_GRAPH["B0"].items()
+        for head_id in head_ids
+    ]
+    expected = CPTDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION)
+
+    incremental = CPTDigraphManager({"B0": {}}, {})
+    incremental.add_nodes(*CPT_GRAPH["B0"])
+    for edge_id in edge_ids:
+        incremental.connect_nodes(edge_id)
+    incremental.update_cost_function(CPT_COST_FUNCTION)
+
+    batch = CPTDigraphManager({"B0": {}}, {})
+    with batch.batch():
+        batch.add_nodes(*CPT_GRAPH["B0"])
+        batch.connect_nodes(*edge_ids)
+        batch.update_cost_function(CPT_COST_FUNCTION)
+        assert batch.cost == {}
+
+    for cpt_digraph_manager in (incremental, batch):
+        assert cpt_digraph_manager.cost == expected.cost
+        assert cpt_digraph_manager.spanning_tree == expected.spanning_tree
+        assert cpt_digraph_manager.delta == expected.delta
+        assert cpt_digraph_manager.basic_cost == expected.basic_cost == 23
+        assert cpt_digraph_manager.compute_cpt("A")[1] == 27
+
+    incremental.connect_nodes(("A", "D"))
+    assert incremental.spanning_tree[("A", "D")] == "D"
+    assert incremental.cost == expected.cost | {("A", "D"): 1}
+    assert incremental.delta["A"] == 2 and incremental.delta["D"] == -1
+
+    incremental.update_cost_function({("A", "D"): 0.5})
+    assert incremental.cost_type == "float"
+    assert incremental.cost[("A", "D")] == 0.5
+
+
+def test_fork():
+    """
+    Fork of CPTDigraphManager reads costs of the original one and is updated
+    independently.
+    """
+    cpt_digraph_manager = CPTDigraphManager(CPT_GRAPH, CPT_COST_FUNCTION)
+    expected_cost = dict(cpt_digraph_manager.cost)
+
+    fork = cpt_digraph_manager.fork()
+    assert fork.cost.get(("A", "B")) == CPT_COST_FUNCTION[("A", "B")]
+    assert dict(fork.cost.items()) == expected_cost
+    assert fork.compute_cpt("A")[1] == 27
+    assert all(fork[node_id] is cpt_digraph_manager[node_id] for node_id in "ABCD")
+
+    fork.connect_nodes(("A", "D"))
+    fork.update_cost_function({("A", "D"): 2})
+    expected = CPTDigraphManager(
+        fork(fork.root_diblob_id), CPT_COST_FUNCTION | {("A", "D"): 2}
+    )
+    assert fork.cost == expected.cost
+    assert fork.spanning_tree == expected.spanning_tree
+    assert fork.delta == expected.delta
+    assert fork.basic_cost == expected.basic_cost
+
+    assert cpt_digraph_manager.cost == expected_cost
+    assert ("A", "D") not in cpt_digraph_manager
+    assert cpt_digraph_manager.compute_cpt("A")[1] == 27
+
+
+def test_structural_updates():
+    """
+    Cost related structures after removals, reversal, compression and injection
+    are the same as for the digraph rebuilt from scratch.
+    """
+
+    def assert_rebuilt(cpt_digraph_manager, cost_function):
+        root_diblob_id = cpt_digraph_manager.root_diblob_id
+        expected = CPTDigraphManager(
+            cpt_digraph_manager(root_diblob_id), cost_function
+        )
+        assert cpt_digraph_manager.cost == expected.cost
+        assert cpt_digraph_manager.spanning_tree == expected.spanning_tree
+        assert cpt_digraph_manager.delta == expected.delta
+        assert cpt_digraph_manager.basic_cost == expected.basic_cost
+
+    cycle = {"B0": {"A": ["B", "B"], "B": ["C"], "C": ["A"]}}
+
+    cpt_digraph_manager = CPTDigraphManager(cycle, {})
+    cpt_digraph_manager.reverse_edges(cpt_digraph_manager[("A", "B")][0])
+    assert cpt_digraph_manager.delta == {"A": -1, "B": 1, "C": 0}
+    assert_rebuilt(cpt_digraph_manager, {})
+
+    cpt_digraph_manager = CPTDigraphManager(cycle, {})
+    cpt_digraph_manager.remove_edges(*cpt_digraph_manager[("A", "B")])
+    assert ("A", "B") not in cpt_digraph_manager.cost
+    assert cpt_digraph_manager.basic_cost == 2
+    assert_rebuilt(cpt_digraph_manager, {})
+
+    cpt_digraph_manager.remove_nodes(cpt_digraph_manager["C"])
+    assert_rebuilt(cpt_digraph_manager, {})
+
+    with_diblob = {"B0": {"A": ["B", "C"], "B1": {"B": ["C"], "C": ["A"]}}}
+    cpt_digraph_manager = CPTDigraphManager(with_diblob, CPT_COST_FUNCTION)
+    cpt_digraph_manager.compress_diblob("B1")
+    assert cpt_digraph_manager.delta == {"A": 1, "B1": -1}
+    assert_rebuilt(cpt_digraph_manager, CPT_COST_FUNCTION)
+
+    cpt_digraph_manager = CPTDigraphManager(cycle, CPT_COST_FUNCTION)
+    cpt_digraph_manager.inject(DigraphManager({"B1": {"Y": ["Z"], "Z": []}}), "C")
+    assert "Y" in cpt_digraph_manager.delta
+    assert_rebuilt(cpt_digraph_manager, CPT_COST_FUNCTION)
+
+
+def test_cpt_on_multigraph():
+    """
+    Every multiple edge is covered by the tour and counted in the cost.
+    """
+    digraph_dict = {"B0": {"A": ["B", "B", "C"], "B": ["A"], "C": ["C", "A"]}}
+    cost_function = {("A", "B"): 2, ("B", "A"): 3, ("A", "C"): 1, ("C", "A"): 1}
+
+    cpt_digraph_manager = CPTDigraphManager(digraph_dict, cost_function)
+    cpt, cost = cpt_digraph_manager.compute_cpt("C")
+
+    assert cost == 2 * 2 + 2 * 3 + 1 + 1 + 1
+    assert sum(cost_function.get(edge_id, 1) for edge_id in cpt) == cost
+    assert cpt.count(("A", "B")) == cpt.count(("B", "A")) == 2
+    assert is_tour(cpt, "C", cost_function | {("C", "C"): 1})
+
+
+def test_cpt_solvers_on_unbalanced_digraph():
+    """
+    Both solvers give the same cost when many nodes are unbalanced.
+    """
+    digraph_dict = {
+        "B0": {
+            "A": ["B", "C", "D", "E"],
+            "B": ["A"],
+            "C": ["A", "B"],
+            "D": ["A", "B", "C"],
+            "E": ["D", "C"],
+        }
+    }
+    cost_function = {("A", "E"): 4, ("D", "A"): 3, ("C", "B"): 2}
+
+    costs = {
+        solver: CPTDigraphManager(digraph_dict, cost_function).compute_cpt(
+            "A", solver=solver
+        )[1]
+        for solver in ("min_cost_flow", "cycle_canceling")
+    }
+    assert costs["min_cost_flow"] == costs["cycle_canceling"] == 26
+
+
+def test_strong_connectivity():
+    """
+    Tests strong connectivity validation.
+    """
+    assert WeightedDigraphManager(
+        CPT_GRAPH, CPT_COST_FUNCTION
+    ).check_if_digraph_is_strongly_connected()
+
+    assert not WeightedDigraphManager(
+        {"B0": {"A": []}}, {}
+    ).check_if_digraph_is_strongly_connected()
+
+    assert WeightedDigraphManager(
+        {"B0": {"A": ["A"]}}, {}
+    ).check_if_digraph_is_strongly_connected()
+
+    cpt_digraph_manager = CPTDigraphManager(
+        {"B0": CPT_GRAPH["B0"] | {"E": [], "D": ["A", "B", "E"]}}, CPT_COST_FUNCTION
+    )
+    assert not cpt_digraph_manager.check_if_digraph_is_strongly_connected()
+
+    with pytest.raises(NotSCGException):
+        cpt_digraph_manager.compute_cpt("A")
@@ -3,11 +3,17 @@
 Diblob digraph_manager tests.
 """
 
+import gc
+import io
 import os
 import json
 import pytest
+from diblob.algorithms import DFS_with_path
 from diblob.digraph_manager import DigraphManager
+from diblob.components import EdgeMultiset
+from diblob.tools import gc_paused
 from diblob.exceptions import (
+    CollisionException,
     InvalidDigraphDictException,
     RemoveRootDiblobException,
     CommonResourcesInjection,
@@ -348,3 +354,349 @@ def test_digraph_joining(digraph_dict):
             "A": [{"BJoin": ["B", "C", "D"]}],
         }
     }
+
+
+def test_component_lookup(digraph_dict):
+    """
+    test __getitem__ / __contains__ dispatch over diblobs, nodes and edges.
+    """
+    digraph_manager = DigraphManager(digraph_dict["g11_graph_with_diblobs"])
+
+    assert digraph_manager["B1"] is digraph_manager.diblobs["B1"]
+    assert digraph_manager["A"] is digraph_manager.nodes["A"]
+    assert digraph_manager[("A", "B")] is digraph_manager.edges[("A", "B")]
+
+    assert "B1" in digraph_manager
+    assert "A" in digraph_manager
+    assert ("A", "B") in digraph_manager
+    assert "X" not in digraph_manager
+    assert ("A", "I") not in digraph_manager
+
+    with pytest.raises(KeyError):
+        digraph_manager["X"]  # pylint: disable=pointless-statement
+
+    with pytest.raises(KeyError):
+        digraph_manager[("A", "I")]  # pylint: disable=pointless-statement
+
+
+def test_fork(digraph_dict):
+    """
+    Tests copy-on-write fork - modifications of the fork do not affect
+    the original digraph manager, untouched components are shared.
+    """
+    digraph_manager = DigraphManager(digraph_dict["g11_graph_with_diblobs"])
+    expected_json = digraph_manager(digraph_manager.root_diblob_id)
+    node_a = digraph_manager["A"]
+
+    fork = digraph_manager.fork()
+    assert fork(fork.root_diblob_id) == expected_json
+    assert fork.edges.peek(("A", "B")) is digraph_manager[("A", "B")]
+
+    fork.reverse_edges(*[edges[0] for edges in fork.edges.values()])
+    fork.add_nodes("X")
+    fork.connect_nodes(("X", "A"))
+    fork.remove_nodes(fork["C"])
+
+    assert fork["A"] is not node_a
+    assert "X" in fork and "C" not in fork
+    assert list(fork.nodes) == [
+        node_id for node_id in digraph_manager.nodes if node_id != "C"
+    ] + ["X"]
+
+    assert digraph_manager(digraph_manager.root_diblob_id) == expected_json
+    assert digraph_manager["A"] is node_a and "X" not in digraph_manager
+
+    fork_of_fork = fork.fork()
+    fork_of_fork.remove_nodes(fork_of_fork["X"])
+    assert "X" in fork and "X" not in fork_of_fork
+    assert len(fork_of_fork.nodes) == len(digraph_manager.nodes) - 1
+
+
+def test_fork_removals():
+    """
+    Tests removal of the node with self-loop and compress_diblob on the fork.
+    """
+    digraph_manager = DigraphManager({"B0": {"A": ["B"], "B": ["B", "A"]}})
+    expected_json = digraph_manager("B0")
+
+    fork = digraph_manager.fork()
+    fork.remove_nodes(fork["B"])
+    assert fork("B0") == {"B0": {"A": []}}
+    assert digraph_manager("B0") == expected_json
+
+    digraph_manager = DigraphManager(
+        {"B0": {"A": ["B"], "B1": {"B": ["B", "C"], "C": ["A", "B"]}}}
+    )
+    expected_json = digraph_manager("B0")
+
+    fork = digraph_manager.fork()
+    fork.compress_diblob("B1")
+    assert fork("B0") == {"B0": {"A": ["B1"], "B1": ["A"]}}
+    assert digraph_manager("B0") == expected_json
+
+
+def test_fork_reads(digraph_dict):
+    """
+    Tests that reads of the fork (traversals, Mapping methods) share components
+    with the original digraph manager - only modified components are copied.
+    """
+    digraph_manager = DigraphManager(digraph_dict["g11_graph_with_diblobs"])
+    expected_json = digraph_manager(digraph_manager.root_diblob_id)
+    fork = digraph_manager.fork()
+
+    assert all(
+        node is digraph_manager[node_id] for node_id, node in fork.nodes.items()
+    )
+    assert all(
+        edges is digraph_manager[edge_id] for edge_id, edges in fork.edges.items()
+    )
+    assert fork.nodes.get("A") is digraph_manager["A"]
+    assert fork["A"] is digraph_manager["A"]
+
+    visited = DFS_with_path(fork).run("A")
+    assert visited == DFS_with_path(digraph_manager).run("A")
+    assert all(
+        node is digraph_manager[node_id] for node_id, node in fork.nodes.items()
+    )
+
+    edges = fork[("A", "B")]
+    fork.reverse_edges(edges[0])
+    assert fork["A"] is not digraph_manager["A"]
+    assert ("A", "B") in digraph_manager
+    assert digraph_manager(digraph_manager.root_diblob_id) == expected_json
+
+    untouched_node_ids = set(fork.nodes) - {"A", "B"}
+    assert all(
+        fork[node_id] is digraph_manager[node_id] for node_id in untouched_node_ids
+    )
+
+
+def test_compact_edges(digraph_dict):
+    """
+    Digraph manager with compact edges (EdgeMultiset) behaves as the default one.
+    """
+    pseudograph = {"B0": {"A": ["B", "B", "C"], "B": ["C", "A"], "C": ["A", "C"]}}
+
+    for representation in (
+        digraph_dict["g11_graph_with_diblobs"],
+        digraph_dict["g13_graph_to_compress"],
+        pseudograph,
+    ):
+        digraph_manager = DigraphManager(representation)
+        compact_digraph_manager = DigraphManager(representation, compact_edges=True)
+        root_diblob_id = digraph_manager.root_diblob_id
+
+        assert all(
+            isinstance(edges, EdgeMultiset)
+            for edges in compact_digraph_manager.edges.values()
+        )
+        assert compact_digraph_manager(root_diblob_id) == digraph_manager(
+            root_diblob_id
+        )
+
+        for manager in (digraph_manager, compact_digraph_manager):
+            manager.flatten(*(set(manager.diblobs) - {root_diblob_id}))
+            manager.decouple_edges()
+            manager.compress_edges()
+
+        assert {
+            edge_id: sorted(edge.path for edge in edges)
+            for edge_id, edges in compact_digraph_manager.edges.items()
+        } == {
+            edge_id: sorted(edge.path for edge in edges)
+            for edge_id, edges in digraph_manager.edges.items()
+        }
+
+        for manager in (digraph_manager, compact_digraph_manager):
+            manager.decompress_edges()
+            manager.reverse_edges(*[edges[0] for edges in manager.edges.values()])
+
+        assert compact_digraph_manager(root_diblob_id) == digraph_manager(
+            root_diblob_id
+        )
+
+
+def test_get_diblob_edges(digraph_dict):
+    """
+    Edges of the diblob found by adjacency are the same as found by
+    classification of all edges of the digraph.
+    """
+    digraph_manager = DigraphManager(digraph_dict["g11_graph_with_diblobs"])
+
+    for diblob_id in digraph_manager.diblobs:
+        descendants = digraph_manager.get_diblob_descendants(diblob_id) | {diblob_id}
+        edges = {
+            (tail, head): (
+                digraph_manager[tail].diblob_id in descendants,
+                digraph_manager[head].diblob_id in descendants,
+            )
+            for tail, head in digraph_manager.edges
+        }
+
+        assert digraph_manager.get_diblob_edges(diblob_id) == (
+            {edge_id for edge_id, inside in edges.items() if inside == (True, True)},
+            {edge_id for edge_id, inside in edges.items() if inside == (False, True)},
+            {edge_id for edge_id, inside in edges.items() if inside == (True, False)},
+            descendants,
+        )
+
+
+def test_hierarchy_index():
+    """
+    Ancestor queries on the nested diblobs are updated after the diblob
+    tree is modified (gather, flatten, join_diblobs) and in the fork.
+    """
+    digraph_manager = DigraphManager({"B0": {str(idx): [] for idx in range(6)}})
+
+    # B0 -> D0 -> D1 -> D2 -> D3 -> D4
+    parent_id = "B0"
+    for idx in range(5):
+        digraph_manager.gather(f"D{idx}", digraph_manager[parent_id].nodes - {str(idx)})
+        parent_id = f"D{idx}"
+    digraph_manager.gather("E", {"2"})
+
+    assert digraph_manager["B0"].children == {"D0"}
+    assert digraph_manager.get_diblobs_common_ancestor("D4", "E") == "D1"
+    assert digraph_manager.get_diblobs_common_ancestor("D4", "D2") == "D2"
+    assert digraph_manager.get_diblob_descendants("D1") == {"D2", "D3", "D4", "E"}
+    assert digraph_manager.is_diblob_ancestor({"D0"}, "D4")
+    assert not digraph_manager.is_diblob_ancestor({"E", "D4"}, "D4")
+    assert not digraph_manager.is_diblob_ancestor({"E", "X", "Y", "Z", "D3"}, "D2")
+
+    fork = digraph_manager.fork()
+    fork.flatten("D2")
+    assert fork.get_diblob_descendants("D1") == {"D3", "D4", "E"}
+    assert fork.get_diblobs_common_ancestor("D4", "E") == "D1"
+
+    fork.join_diblobs("D3", "E", "J")
+    assert fork.get_diblob_descendants("D1") == {"J", "D4"}
+    assert fork.get_diblobs_common_ancestor("D4", "J") == "J"
+
+    assert digraph_manager.get_diblob_descendants("D1") == {"D2", "D3", "D4", "E"}
+
+
+def test_pseudograph_round_trip():
+    """
+    Adjacency order of the pseudograph (repeated node ids) is preserved.
+    """
+    pseudograph = {"B0": {"A": ["B", "C", "B"], "B": ["A", "C", "A"], "C": []}}
+
+    for digraph_manager in (
+        DigraphManager(pseudograph),
+        DigraphManager(pseudograph, compact_edges=True),
+        DigraphManager.from_adjacency(pseudograph["B0"]),
+    ):
+        assert digraph_manager("B0") == pseudograph
+        assert digraph_manager["A"].incoming_nodes == ["B", "B"]
+
+    digraph_manager.remove_edges(digraph_manager[("A", "B")][0])
+    digraph_manager.connect_nodes(("A", "B"))
+    assert digraph_manager["A"].outgoing_nodes == ["C", "B", "B"]
+
+
+def test_bulk_construction(digraph_dict):
+    """
+    from_edges / from_adjacency build the same digraphs as the dict
+    representation and connect_nodes.
+    """
+    for name in (
+        "g1_empty_graph",
+        "g2_one_node",
+        "g4_path_3",
+        "g6_self_cycle",
+        "g9_cycle_7",
+        "g11_graph_without_diblobs",
+        "g13_graph_to_compress",
+    ):
+        digraph_dict_representation = digraph_dict[name]
+        (root_diblob_id, adjacency), *_ = digraph_dict_representation.items()
+
+        for compact_edges in (False, True):
+            digraph_manager = DigraphManager.from_adjacency(
+                adjacency, root_diblob_id, compact_edges
+            )
+            assert digraph_manager(root_diblob_id) == digraph_dict_representation, name
+            assert digraph_manager.compact_edges == compact_edges
+
+    edge_ids = [("A", "B"), ("B", "C"), ("A", "B"), ("C", "A")]
+    digraph_manager = DigraphManager.from_edges(edge_ids, node_ids=["D"])
+    expected_digraph_manager = DigraphManager({"B0": {}})
+    expected_digraph_manager.add_nodes("D", "A", "B", "C")
+    expected_digraph_manager.connect_nodes(*edge_ids)
+
+    assert digraph_manager("B0") == expected_digraph_manager("B0")
+    assert len(digraph_manager[("A", "B")]) == 2
+    assert digraph_manager["B"].incoming_nodes == ["A", "A"]
+
+    digraph_manager.gather("B1", {"A", "B"})
+    assert digraph_manager["A"].diblob_id == "B1"
+
+    with pytest.raises(CollisionException):
+        DigraphManager.from_edges([("B0", "A")])
+
+    with pytest.raises(CollisionException):
+        DigraphManager.from_edges(edge_ids, node_ids=["D", "E", "D"])
+
+    adjacency = [("A", ["B"]), ("B", ["A"])]
+    assert DigraphManager.from_adjacency(adjacency)("B0") == {
+        "B0": {"A": ["B"], "B": ["A"]}
+    }
+
+    with pytest.raises(CollisionException):
+        DigraphManager.from_adjacency(adjacency + [("A", ["C"])])
+
+
+def test_gc_state():
+    """
+    Exports do not touch the garbage collector, nested gc_paused blocks
+    (bulk construction) restore its state when the outermost block exits.
+    """
+    digraph_manager = DigraphManager.from_edges([("A", "B"), ("B", "A")])
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        digraph_manager("B0")
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+    with gc_paused():
+        with gc_paused():
+            DigraphManager.from_edges([("A", "B")])
+        assert not gc.isenabled()
+    assert gc.isenabled()
+
+
+def test_export(digraph_dict):
+    """
+    Tests cached dict representation (reset after modification)
+    and write_json (the same output as json.dumps).
+    """
+    for name, digraph_dict_representation in digraph_dict.items():
+        try:
+            digraph_manager = DigraphManager(digraph_dict_representation)
+        except InvalidDigraphDictException:
+            continue
+
+        for diblob_id in digraph_manager.diblobs:
+            file = io.StringIO()
+            digraph_manager.write_json(file, diblob_id, chunk_size=2)
+            assert file.getvalue() == json.dumps(digraph_manager(diblob_id)), name
+
+    digraph_manager = DigraphManager(digraph_dict["g11_graph_with_diblobs"])
+    root_diblob_id = digraph_manager.root_diblob_id
+    expected_json = digraph_manager(root_diblob_id)
+
+    digraph_manager(root_diblob_id)[root_diblob_id].clear()
+    assert digraph_manager(root_diblob_id) == expected_json
+
+    fork = digraph_manager.fork()
+    fork.add_nodes("X")
+    fork.connect_nodes(("X", "A"))
+    assert fork(root_diblob_id)[root_diblob_id]["X"] == ["A"]
+    assert digraph_manager(root_diblob_id) == expected_json
+
+    digraph_manager.flatten("B1")
+    assert digraph_manager(root_diblob_id) != expected_json
+    assert "B1" not in str(digraph_manager)
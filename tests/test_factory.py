@@ -2,8 +2,11 @@
 Diblob factory tests.
 """
 
+import pytest
+
 from diblob.digraph_manager import DigraphManager
-from diblob.factory import DiblobFactory
+from diblob.exceptions import CycleException
+from diblob.factory import DiblobFactory, add_outgoing
 
 
 def test_edge_graph():
@@ -252,3 +255,31 @@ def test_flow_digraph():
             "E`": ["E``"],
         }
     }
+
+
+def test_order_bipartite_digraph():
+    """
+    test for Dilworth's digraph creation (DAG only).
+    """
+    digraph_manager = DigraphManager(
+        {"B0": {"A": ["B", "C"], "B": ["D"], "C": ["D"], "D": []}}
+    )
+
+    order_digraph_manager = DiblobFactory.generate_order_bipartite_digraph(
+        digraph_manager
+    )
+    assert order_digraph_manager("B0") == {
+        "B0": {"A": ["B", "C", "D"], "B": ["D"], "C": ["D"], "D": []}
+    }
+
+    node_ids = [str(idx) for idx in range(3000)]
+    digraph_manager = DigraphManager({"B0": {node_id: [] for node_id in node_ids}})
+    digraph_manager.connect_nodes(*zip(node_ids, node_ids[1:]))
+
+    outgoing_list = []
+    add_outgoing(digraph_manager, node_ids[0], outgoing_list)
+    assert outgoing_list == node_ids[1:]
+
+    digraph_manager.connect_nodes((node_ids[-1], node_ids[1]))
+    with pytest.raises(CycleException):
+        DiblobFactory.generate_order_bipartite_digraph(digraph_manager)
@@ -0,0 +1,95 @@
+"""
+Diblob generators tests.
+"""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from diblob.generators import (
+    CycleBasedDigraph,
+    RandomCycle,
+    RandomDAG,
+    RandomDigraph,
+    RandomSCC,
+    RandomSESEPathBased,
+    SemiRandomDigraph,
+)
+
+NODE_SPACE = [str(idx) for idx in range(12)]
+
+GENERATORS = {
+    "random_cycle": lambda rng: RandomCycle(NODE_SPACE, 8, rng=rng),
+    "random_scc": lambda rng: RandomSCC(NODE_SPACE, [6, 4, 4], rng=rng),
+    "random_dag": lambda rng: RandomDAG(NODE_SPACE, 20, rng=rng),
+    "random_digraph": lambda rng: RandomDigraph(10, 30, rng=rng),
+    "cycle_based_digraph": lambda rng: CycleBasedDigraph(10, 16, rng=rng),
+    "random_sese": lambda rng: RandomSESEPathBased(10, 5, 2, 6, rng=rng),
+    "semi_random_digraph": lambda rng: SemiRandomDigraph(
+        RandomDAG(NODE_SPACE, 20, rng=rng),
+        [RandomCycle(["X", "Y", "Z"], 3, "C", rng=rng)],
+        rng=rng,
+    ),
+}
+
+
+def generate(generator_name: str, rng):
+    """
+    Returns dict representation of the generated digraph.
+    """
+    digraph_manager = GENERATORS[generator_name](rng).get_digraph_manager()
+    return digraph_manager(digraph_manager.root_diblob_id)
+
+
+@pytest.mark.parametrize("generator_name", GENERATORS)
+def test_seeded_generators(generator_name):
+    """
+    Generators with the same seed (or generator in the same state) return
+    the same digraphs, global random is not used.
+    """
+    random.seed(1)
+    expected = generate(generator_name, random.Random(7))
+    global_state = random.getstate()
+
+    random.seed(2)
+    assert generate(generator_name, random.Random(7)) == expected
+    assert generate(generator_name, 7) == generate(generator_name, 7)
+
+    random.seed(1)
+    generate(generator_name, random.Random(7))
+    assert random.getstate() == global_state
+
+
+def test_generators_across_processes():
+    """
+    Seeded generators don't depend on the hash randomization.
+    """
+    code = (
+        "import random;"
+        "from diblob.generators import *;"
+        "rng = random.Random(3);"
+        "node_space = [str(idx) for idx in range(12)];"
+        "generators = ["
+        "RandomSCC(node_space, [6, 4, 4], rng=rng),"
+        "RandomSESEPathBased(10, 5, 2, 6, rng=rng),"
+        "SemiRandomDigraph(RandomDAG(node_space, 20, rng=rng),"
+        " [RandomCycle(['X', 'Y', 'Z'], 3, 'C', rng=rng),"
+        " RandomCycle(['U', 'V', 'W'], 3, 'D', rng=rng)], rng=rng)];"
+        "managers = [generator.get_digraph_manager() for generator in generators];"
+        "print([(sorted(manager.nodes), sorted(manager.get_multiple_edge_ids("
+        "*manager.edges))) for manager in managers])"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env=os.environ | {"PYTHONHASHSEED": str(hash_seed)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for hash_seed in range(3)
+    }
+    assert len(outputs) == 1